@@ -46,11 +46,37 @@ def _collect_classes() -> None:
 # Don't import when running outside Blender
 if "bpy" in sys.modules:
     import bpy
+    from bpy.app.handlers import persistent
 
     from . import preferences
 
     from .properties import register_properties, unregister_properties
-    from .shared.profile import load_profiles
+    from .shared.analysis_cache import (
+        clear_collection_analyses,
+        tag_depsgraph_updates,
+    )
+    from .shared.export import shapekey_deltas
+    from .shared.profile import load_profiles, set_lazy_profile_loading
+
+    @persistent
+    def _on_depsgraph_update_post(
+        scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph
+    ) -> None:
+        tag_depsgraph_updates(depsgraph)
+        shapekey_deltas.tag_depsgraph_updates(depsgraph)
+
+    @persistent
+    def _on_blend_data_replaced(*args: object) -> None:
+        # Cached analyses reference objects that undo or loading replaced
+        clear_collection_analyses()
+        shapekey_deltas.clear_static_shapekeys()
+
+    _HANDLERS = [
+        (bpy.app.handlers.depsgraph_update_post, _on_depsgraph_update_post),
+        (bpy.app.handlers.load_post, _on_blend_data_replaced),
+        (bpy.app.handlers.undo_post, _on_blend_data_replaced),
+        (bpy.app.handlers.redo_post, _on_blend_data_replaced),
+    ]
 
     def register() -> None:
         """Register add-on classes and properties."""
@@ -63,10 +89,29 @@ if "bpy" in sys.modules:
             bpy.utils.register_class(cls)
 
         register_properties()
+
+        prefs = preferences.get_addon_preferences()
+        if prefs is not None:
+            set_lazy_profile_loading(prefs.lazy_profile_loading)
         load_profiles()
 
+        if prefs is not None and prefs.watch_profiles:
+            preferences.start_profile_watcher()
+
+        for handlers, handler in _HANDLERS:
+            if handler not in handlers:
+                handlers.append(handler)
+
     def unregister() -> None:
         """Unregister add-on classes and properties."""
+        preferences.stop_profile_watcher()
+
+        for handlers, handler in _HANDLERS:
+            if handler in handlers:
+                handlers.remove(handler)
+        clear_collection_analyses()
+        shapekey_deltas.clear_static_shapekeys()
+
         unregister_properties()
 
         for cls in reversed(_COLLECTED_CLASSES):
@@ -7,6 +7,7 @@ import bpy
 from bpy.types import Operator, Context
 from bpy.props import StringProperty, EnumProperty, BoolProperty
 
+from ..shared.analysis_cache import invalidate_object_analysis
 from ..shared.blender_typing import OperatorReturn
 
 
@@ -127,6 +128,8 @@ class MODKIT_OT_handle_attribute(Operator):
                         {'INFO'}, f"Removed attribute: {self.attribute_name}")
                     break
 
+        # Collection property edits raise no depsgraph update
+        invalidate_object_analysis(obj)
         return {'FINISHED'}
 
     if TYPE_CHECKING:
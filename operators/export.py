@@ -15,11 +15,19 @@ from ..shared.cancel import Cancelled
 from ..properties.export_properties import get_export_props
 from ..preferences import get_addon_preferences
 from ..shared.export.progress import ProgressStage
-from ..shared.logging import log_warning
+from ..shared.logging import log_error, log_warning
+from ..shared.export.parallel import ParallelExport
+from ..shared.export.scheduler import FrameBudget
 from ..shared.export.session import ExportSession
+from ..shared.export_context import CollectionExportInfo
 from ..shared.blender_typing import OperatorReturn
 
 
+# Seconds between modal timer ticks; each tick runs stages for up to the
+# frame budget, so this only bounds the idle gap between batches
+_TIMER_INTERVAL = 0.01
+
+
 class MODKIT_OT_export_models(Operator):
     """Export enabled collections."""
 
@@ -34,6 +42,11 @@ class MODKIT_OT_export_models(Operator):
     _timer: Optional[Timer] = None
     _session: Optional[ExportSession] = None
     _progress_reporter: Optional[ExportProgress] = None
+    _budget: Optional[FrameBudget] = None
+    _parallel: Optional[ParallelExport] = None
+    # Last values shown, so unchanged progress doesn't redraw the header
+    _shown_header: Optional[str] = None
+    _shown_progress: int = -1
 
     def execute(self, context: Context) -> set[OperatorReturn]:
         cfg = get_export_props()
@@ -83,14 +96,43 @@ class MODKIT_OT_export_models(Operator):
             cols = set(collect_enabled_collections())
 
         self._progress_reporter.clear()
-        self._session.start(cols)
+
+        if cfg.export_workers > 1:
+            if cfg.export_mode == "FBX_ONLY":
+                return self._start_parallel(
+                    context, export_root, cols, cfg.export_workers
+                )
+            self.report(
+                {"WARNING"},
+                "Parallel export only supports FBX Only; "
+                "exporting in this Blender instance",
+            )
+
+        try:
+            self._session.start(cols)
+        except ValueError as e:
+            self.report({"ERROR"}, str(e))
+            return {"CANCELLED"}
+
+        if self._session.is_large_job():
+            self.report(
+                {"WARNING"},
+                f"Exporting {self._session.total_variants} variants, "
+                "this will take a while",
+            )
 
         # total_variants = reporter.total_variant_count if reporter else 0
         # if total_variants > 0:
+        self._budget = FrameBudget(
+            cfg.frame_budget_ms, interval_s=_TIMER_INTERVAL
+        )
+
         self._begin_progress_ui(context)
         wm = context.window_manager
         assert wm
-        self._timer = wm.event_timer_add(0.1, window=context.window)
+        self._timer = wm.event_timer_add(
+            _TIMER_INTERVAL, window=context.window
+        )
         wm.modal_handler_add(self)
         return {"RUNNING_MODAL"}
 
@@ -98,7 +140,90 @@ class MODKIT_OT_export_models(Operator):
         self.report({"INFO"}, "No variants to export")
         return {"CANCELLED"}
 
+    def _start_parallel(
+        self,
+        context: Context,
+        export_root: Path,
+        cols: set[Collection],
+        worker_count: int,
+    ) -> set[OperatorReturn]:
+        """Hand the export to background Blender workers."""
+        reporter = self._progress_reporter
+        assert reporter
+
+        try:
+            total = sum(CollectionExportInfo(c).variant_count for c in cols)
+        except ValueError as e:
+            self.report({"ERROR"}, str(e))
+            return {"CANCELLED"}
+
+        self._session = None
+        self._parallel = ParallelExport(
+            export_root,
+            sorted(c.name for c in cols),
+            worker_count,
+            reporter,
+            mode="FBX_ONLY",
+        )
+        try:
+            self._parallel.start()
+        except Exception as e:
+            self._parallel.cancel()
+            self._parallel.cleanup()
+            self.report({"ERROR"}, f"Failed to start export workers: {e}")
+            return {"CANCELLED"}
+        reporter.set_total_variant_count(total)
+
+        self._begin_progress_ui(context)
+        wm = context.window_manager
+        assert wm
+        self._timer = wm.event_timer_add(0.1, window=context.window)
+        wm.modal_handler_add(self)
+        return {"RUNNING_MODAL"}
+
+    def _modal_parallel(
+        self, parallel: ParallelExport, context: Context, event: Any
+    ) -> set[OperatorReturn]:
+        if event.type == 'ESC' and event.value == 'PRESS':
+            parallel.cancel()
+            parallel.cleanup()
+            self._end_progress_ui(context)
+            self.report({"INFO"}, "Export cancelled")
+            return {"CANCELLED"}
+
+        if event.type != 'TIMER':
+            return {"RUNNING_MODAL"}
+
+        if parallel.poll():
+            self._update_ui(ProgressStage.EXPORT, context)
+            return {"RUNNING_MODAL"}
+
+        self._end_progress_ui(context)
+        failures = parallel.failures()
+        parallel.cleanup()
+        if failures:
+            for failure in failures:
+                log_error(f"Parallel export: {failure}")
+            self.report(
+                {"ERROR"},
+                f"{len(failures)} export workers failed: {failures[0]}",
+            )
+            return {"CANCELLED"}
+
+        progress = parallel.progress
+        message = (
+            f"Exported {progress.processed_variants} variants "
+            f"with {parallel.worker_count} workers"
+        )
+        if progress.skipped_variants:
+            message += f", {progress.skipped_variants} skipped as unchanged"
+        self.report({"INFO"}, message)
+        return {"FINISHED"}
+
     def modal(self, context: Context, event: Any) -> set[OperatorReturn]:
+        if self._parallel is not None:
+            return self._modal_parallel(self._parallel, context, event)
+
         # Cancel requested by user
         if event.type == 'ESC' and event.value == 'PRESS':
             self._handle_cancel(context)
@@ -116,11 +241,33 @@ class MODKIT_OT_export_models(Operator):
                     return {"CANCELLED"}
                 return {"FINISHED"}
 
+            budget = self._budget or FrameBudget()
+            budget.begin_tick()
+            stage: Optional[ProgressStage] = None
             try:
-                stage = session.next()
+                # Always advance at least one stage, then as many as fit
+                # in the budget before handing control back to the UI
+                while True:
+                    stage = session.next()
+                    if not budget.has_time():
+                        break
             except StopIteration:
                 # session finished
                 self._end_progress_ui(context)
+                failures = session.conversion_failures
+                if failures:
+                    self.report(
+                        {"ERROR"},
+                        f"{len(failures)} MDL conversions failed, "
+                        "see the console for details",
+                    )
+                rep = self._progress_reporter
+                if rep and rep.skipped_variants:
+                    self.report(
+                        {"INFO"},
+                        f"Rebuilt {rep.rebuilt_variants} variants, skipped "
+                        f"{rep.skipped_variants} unchanged",
+                    )
                 return {"FINISHED"}
             except Cancelled:
                 # cancelled during generator
@@ -128,8 +275,12 @@ class MODKIT_OT_export_models(Operator):
                 self.report({"INFO"}, "Export cancelled")
                 return {"CANCELLED"}
             except Exception as e:
-                log_warning(f"Export session step failed: {e}")
+                log_error(f"Export session step failed: {e}")
+                self._handle_cancel(context)
+                self.report({"ERROR"}, f"Export failed: {e}")
                 return {"CANCELLED"}
+            finally:
+                budget.end_tick()
             if stage:
                 self._update_ui(stage, context)
 
@@ -198,16 +349,20 @@ class MODKIT_OT_export_models(Operator):
         """Update progress UI."""
         rep = self._progress_reporter
 
-        if stage == ProgressStage.VARIANT and context.window_manager:
-            wm = context.window_manager
-            assert wm
-            progress = rep.processed_variants if rep else 0
-            wm.progress_update(progress)
+        # Several stages may have run since the last update, so always
+        # refresh the progress rather than only on VARIANT stages
+        progress = rep.processed_variants if rep else 0
+        if context.window_manager and progress != self._shown_progress:
+            context.window_manager.progress_update(progress)
+            self._shown_progress = progress
 
         header_text = self._build_header_text(rep, stage)
+        if header_text == self._shown_header:
+            return
         area = context.area
         assert area
         area.header_text_set(header_text)
+        self._shown_header = header_text
 
     if TYPE_CHECKING:
         collection_name: Optional[str]
@@ -35,6 +35,20 @@ class MODKIT_PT_export(Panel):
 
         row = layout.row()
         row.prop(cfg, "export_mode")
+        layout.prop(cfg, "variant_order")
+        layout.prop(cfg, "duplication_mode")
+        layout.prop(cfg, "incremental_export")
+        layout.prop(cfg, "sandbox_export")
+        layout.prop(cfg, "frame_budget_ms")
+        row = layout.row()
+        row.enabled = cfg.export_mode == "FBX_ONLY"
+        row.prop(cfg, "export_workers")
+        row = layout.row()
+        row.enabled = cfg.export_mode == "FBX_TO_MDL"
+        row.prop(cfg, "pipeline_conversion")
+        sub = row.row()
+        sub.enabled = cfg.pipeline_conversion
+        sub.prop(cfg, "conversion_workers")
         layout.operator("modkit.export_models", icon='EXPORT')
         layout.separator()
 
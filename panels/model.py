@@ -4,7 +4,8 @@ from types import SimpleNamespace
 from typing import Any, List, Optional, Tuple, Union
 from bpy.types import Panel, Collection, UILayout, Object, Context
 
-from ..shared.model_scanner import ModelScanner
+from ..shared.analysis_cache import get_collection_analysis
+from ..shared.collection_analysis import CollectionAnalysis
 
 from ..properties.object_settings import get_modkit_object_props
 from ..properties.model_settings import (
@@ -12,8 +13,6 @@ from ..properties.model_settings import (
     get_model_props,
     get_modkit_collection_props,
 )
-from ..shared.export.shapekey_utils import collect_collection_shapekeys
-from ..shared.variants import filter_profile_shapekeys
 from ..shared.profile import GroupMode, NamePair, get_profile_data
 from ..shared.ui_helpers import (
     draw_info_box,
@@ -23,7 +22,9 @@ from ..shared.ui_helpers import (
 )
 
 
-def draw_model_meshes(layout: UILayout, collection: Collection) -> None:
+def draw_model_meshes(
+    layout: UILayout, collection: Collection, analysis: CollectionAnalysis
+) -> None:
     """Render meshes with material selectors and part attributes."""
     box = draw_info_box(
         layout, f"Model: {collection.name}", icon="OUTLINER_OB_MESH"
@@ -38,7 +39,7 @@ def draw_model_meshes(layout: UILayout, collection: Collection) -> None:
         box.label(text="No assigned profile", icon="ERROR")
         return
 
-    scanned_meshes = ModelScanner.scan_collection(collection)
+    scanned_meshes = analysis.meshes
 
     # Ensure stable ordering: meshes ascending, parts ascending
     for mesh_id, parts in sorted(scanned_meshes.items()):
@@ -73,12 +74,7 @@ def _draw_single_mesh(
         label = "No material assigned" if mat_name == "" else mat_name
 
         if isinstance(mesh_prop, MeshSettings):
-            standard_mats = mesh_prop.get_standard_materials()
-
-            for key, value in standard_mats.items():
-                if label == value:
-                    label = key
-                    break
+            label = mesh_prop.get_standard_material_name(label) or label
 
         op = row.operator(
             "modkit.mesh_material",
@@ -169,7 +165,9 @@ def _draw_part(layout: UILayout, part_info: Tuple[Object, str, int]) -> None:
             pass
 
 
-def draw_variant_shapekeys(layout: UILayout, collection: Collection) -> None:
+def draw_variant_shapekeys(
+    layout: UILayout, collection: Collection, analysis: CollectionAnalysis
+) -> None:
     """Show shape key support for the collection's variant profile."""
     mainbox = layout.box()
     row = mainbox.row()
@@ -191,9 +189,9 @@ def draw_variant_shapekeys(layout: UILayout, collection: Collection) -> None:
         mainbox.label(text="Profile not loaded", icon="ERROR")
         return
 
-    shapekeys = collect_collection_shapekeys(collection)
+    shapekeys = analysis.shapekeys
 
-    support_groups = filter_profile_shapekeys(shapekeys, profile)
+    group_shapekeys = profile.index.group_shapekeys
 
     model_props = col_props.model if col_props else None
     for group in profile.groups:
@@ -201,25 +199,19 @@ def draw_variant_shapekeys(layout: UILayout, collection: Collection) -> None:
         mode = group.mode
         sks = group.shapekeys
 
-        matching_group = next(
-            (g for g in support_groups if g.group_name == group_name), None
+        detected_keys = set(group_shapekeys[group_name] & shapekeys)
+
+        # Use transient handling in the helper: pass the collection and
+        # group_name so the helper can obtain/manage transient state.
+        _draw_variant_group(
+            mainbox,
+            collection,
+            group_name,
+            mode,
+            sks,
+            detected_keys,
+            state_key=f"collection:{collection.name}:group:{group_name}",
         )
-        detected_keys: set[str] = set()
-        if matching_group:
-            detected_keys = {bname for bname, _ in matching_group.shapekeys}
-
-            # Retrieve saved expansion state
-            # Use transient handling in the helper: pass the collection and
-            # group_name so the helper can obtain/manage transient state.
-            _draw_variant_group(
-                mainbox,
-                collection,
-                group_name,
-                mode,
-                sks,
-                detected_keys,
-                state_key=f"collection:{collection.name}:group:{group_name}",
-            )
 
 
 def _draw_variant_group(
@@ -303,8 +295,11 @@ class MODKIT_PT_model_panel(Panel):
         if not model_props.is_enabled:
             return
 
+        # One walk over the collection's objects serves both sections
+        analysis = get_collection_analysis(col)
+
         # Model mesh display with materials and attributes
-        draw_model_meshes(layout, col)
+        draw_model_meshes(layout, col, analysis)
 
         # Model configuration
         box = layout.box()
@@ -318,7 +313,7 @@ class MODKIT_PT_model_panel(Panel):
         box.prop(model_props, "assigned_profile")
 
         # Shape variant support visualization
-        draw_variant_shapekeys(layout, col)
+        draw_variant_shapekeys(layout, col, analysis)
 
 
 CLASSES = [
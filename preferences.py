@@ -9,14 +9,16 @@ from typing import TYPE_CHECKING, Optional
 import bpy
 
 from bpy.types import AddonPreferences, Operator, Context
-from bpy.props import StringProperty
+from bpy.props import BoolProperty, FloatProperty, StringProperty
 
 from .shared.blender_typing import OperatorReturn
-from .shared.logging import log_debug
+from .shared.logging import log_debug, log_error, log_info
 from .shared.profile import (
     get_profiles_dir,
-    get_loaded_profiles,
+    get_profile_names,
     load_profiles,
+    reload_profiles,
+    set_lazy_profile_loading,
 )
 
 _PACKAGE_NAME = str(__package__)
@@ -32,14 +34,17 @@ class MODKIT_OT_reload_profiles(Operator):
     def execute(self, context: Context) -> set[OperatorReturn]:
         """Execute profile reloading."""
         try:
-            load_profiles()
-            count: int = len(get_loaded_profiles())
-            self.report({"INFO"}, f"Reloaded {count} variant profiles")
+            result = reload_profiles()
+            names = get_profile_names()
+            count: int = len(names)
+            self.report(
+                {"INFO"},
+                f"Reloaded {count} variant profiles "
+                f"({len(result.added)} added, {len(result.changed)} changed, "
+                f"{len(result.removed)} removed)",
+            )
             if count > 0:
-                log_debug(
-                    "[PROFILES] Loaded profiles: "
-                    f"{list(get_loaded_profiles().keys())}"
-                )
+                log_debug(f"[PROFILES] Loaded profiles: {names}")
             return {"FINISHED"}
         except Exception as e:
             self.report({"ERROR"}, f"Failed to reload profiles: {str(e)}")
@@ -74,6 +79,64 @@ class MODKIT_OT_open_profiles_folder(Operator):
             return {"CANCELLED"}
 
 
+def _tag_redraw_all(context: Context) -> None:
+    wm = context.window_manager
+    for window in wm.windows if wm else []:
+        for area in window.screen.areas:
+            area.tag_redraw()
+
+
+def _poll_profiles() -> Optional[float]:
+    """Timer callback picking up edited profile files."""
+    prefs = get_addon_preferences()
+    if prefs is None or not prefs.watch_profiles:
+        return None
+
+    try:
+        result = reload_profiles()
+    except Exception as e:
+        log_error(f"[PROFILES] Failed to reload profiles: {e}")
+    else:
+        if result.affected:
+            log_info(
+                "[PROFILES] Reloaded changed profiles: "
+                f"{sorted(result.affected)}"
+            )
+            _tag_redraw_all(bpy.context)
+
+    return max(prefs.profile_poll_interval, 0.1)
+
+
+def start_profile_watcher() -> None:
+    """Start polling the profiles directory for edits."""
+    if not bpy.app.timers.is_registered(_poll_profiles):
+        bpy.app.timers.register(
+            _poll_profiles, first_interval=1.0, persistent=True
+        )
+
+
+def stop_profile_watcher() -> None:
+    """Stop polling the profiles directory."""
+    if bpy.app.timers.is_registered(_poll_profiles):
+        bpy.app.timers.unregister(_poll_profiles)
+
+
+def _update_lazy_profile_loading(
+    prefs: "ModkitAddonPreferences", context: Context
+) -> None:
+    set_lazy_profile_loading(prefs.lazy_profile_loading)
+    load_profiles()
+
+
+def _update_watch_profiles(
+    prefs: "ModkitAddonPreferences", context: Context
+) -> None:
+    if prefs.watch_profiles:
+        start_profile_watcher()
+    else:
+        stop_profile_watcher()
+
+
 class ModkitAddonPreferences(AddonPreferences):
     """Addon preferences."""
 
@@ -85,9 +148,42 @@ class ModkitAddonPreferences(AddonPreferences):
         subtype="DIR_PATH",
     )
 
+    lazy_profile_loading: BoolProperty(  # type: ignore
+        name="Load Profiles On Demand",
+        description=(
+            "Only index profile names at startup and parse each profile "
+            "when it is first used"
+        ),
+        default=False,
+        update=_update_lazy_profile_loading,
+    )
+
+    watch_profiles: BoolProperty(  # type: ignore
+        name="Watch Profiles Folder",
+        description="Reload edited profile files automatically",
+        default=False,
+        update=_update_watch_profiles,
+    )
+
+    profile_poll_interval: FloatProperty(  # type: ignore
+        name="Poll Interval",
+        description="Seconds between checks of the profiles folder",
+        default=1.0,
+        min=0.1,
+        soft_max=10.0,
+        subtype="TIME_ABSOLUTE",
+        unit="TIME_ABSOLUTE",
+    )
+
     def draw(self, context: Context) -> None:
         layout = self.layout
         layout.prop(self, "textools_path")
+        layout.prop(self, "lazy_profile_loading")
+        row = layout.row()
+        row.prop(self, "watch_profiles")
+        sub = row.row()
+        sub.enabled = self.watch_profiles
+        sub.prop(self, "profile_poll_interval")
         row = layout.row()
         row.operator(
             "modkit.open_profiles_folder",
@@ -102,6 +198,9 @@ class ModkitAddonPreferences(AddonPreferences):
 
     if TYPE_CHECKING:
         textools_path: str
+        lazy_profile_loading: bool
+        watch_profiles: bool
+        profile_poll_interval: float
 
 
 def get_addon_preferences() -> Optional[ModkitAddonPreferences]:
@@ -4,7 +4,13 @@ from typing import TYPE_CHECKING, Optional
 import bpy
 
 from bpy.types import PropertyGroup
-from bpy.props import PointerProperty, StringProperty, EnumProperty
+from bpy.props import (
+    BoolProperty,
+    IntProperty,
+    PointerProperty,
+    StringProperty,
+    EnumProperty,
+)
 
 
 class ExportSettings(PropertyGroup):
@@ -45,6 +51,92 @@ class ExportSettings(PropertyGroup):
         default='FBX_TO_MDL',
     )
 
+    variant_order: EnumProperty(  # type: ignore
+        name="Variant Order",
+        description="Order in which each collection's variants are exported",
+        items=[
+            ('PROFILE', "Profile", "Export variants in profile order"),
+            ('MIN_CHANGES', "Fewest Changes",
+             "Order variants so consecutive ones differ by as few "
+             "shapekeys as possible, only rewriting the keys that change. "
+             "The collection's own shapekey values are changed while it "
+             "exports and restored afterwards")
+        ],
+        default='PROFILE',
+    )
+
+    duplication_mode: EnumProperty(  # type: ignore
+        name="Export Copies",
+        description="How the export copy of a collection is provided for "
+        "each variant",
+        items=[
+            ('PER_VARIANT', "Copy Per Variant",
+             "Duplicate the whole collection for every variant"),
+            ('REUSE_PARTS', "Reuse Unchanged Parts",
+             "Keep an object's export copy between variants while the "
+             "shapekeys it depends on stay the same, instead of duplicating "
+             "and preprocessing it again"),
+            ('SNAPSHOT', "Copy Once",
+             "Duplicate the collection once and reset the copies between "
+             "variants from a snapshot of the UVs and shapekey states, "
+             "swapping in a fresh mesh copy after weight transfer"),
+        ],
+        default='PER_VARIANT',
+    )
+
+    incremental_export: BoolProperty(  # type: ignore
+        name="Incremental Export",
+        description="Keep a manifest of what each variant was exported "
+        "from and skip variants whose meshes, modifiers, shapekeys, "
+        "materials and settings are unchanged and whose files are still "
+        "as exported",
+        default=False,
+    )
+
+    sandbox_export: BoolProperty(  # type: ignore
+        name="Sandbox Export",
+        description="While exporting, turn off global undo, draw export "
+        "copies as bounds and only restore the selection and mode once "
+        "the export ends or is cancelled",
+        default=False,
+    )
+
+    frame_budget_ms: IntProperty(  # type: ignore
+        name="Frame Budget (ms)",
+        description="Export work to run between UI updates. Adapts while "
+        "exporting: shrinks when Blender is busy and grows when it is idle",
+        default=50,
+        min=5,
+        soft_max=500,
+    )
+
+    pipeline_conversion: BoolProperty(  # type: ignore
+        name="Convert in Background",
+        description="Convert exported FBX files to MDL on a background "
+        "thread while the next variants are exported",
+        default=False,
+    )
+
+    conversion_workers: IntProperty(  # type: ignore
+        name="Converters",
+        description="MDL conversions to run at once when converting in "
+        "the background, each in its own copy of the converter folder",
+        default=1,
+        min=1,
+        soft_max=8,
+        max=32,
+    )
+
+    export_workers: IntProperty(  # type: ignore
+        name="Export Workers",
+        description="Background Blender processes sharing the export. "
+        "Only used for FBX Only exports; 1 exports in this Blender instance",
+        default=1,
+        min=1,
+        soft_max=16,
+        max=64,
+    )
+
     live_install_target_dir: StringProperty(  # type: ignore
         name="Live Mod Folder",
         description="Path to the installed mod folder "
@@ -58,6 +150,14 @@ class ExportSettings(PropertyGroup):
         export_prefix_mode: str
         export_custom_prefix: str
         export_mode: str
+        variant_order: str
+        duplication_mode: str
+        incremental_export: bool
+        sandbox_export: bool
+        frame_budget_ms: int
+        pipeline_conversion: bool
+        conversion_workers: int
+        export_workers: int
         live_install_target_dir: str
 
 
@@ -19,12 +19,20 @@ class MeshSettings(PropertyGroup):
     """Property group for individual mesh configuration."""
 
     def get_standard_materials(self) -> Dict[str, str]:
+        """Return material name -> path of the profile. Don't mutate it."""
         profile_obj = get_profile_data(self.profile)
 
         if not profile_obj:
             return {}
-        mats = {mat.name: mat.path for mat in profile_obj.standard_materials}
-        return mats
+        return profile_obj.index.material_paths
+
+    def get_standard_material_name(self, path: str) -> Optional[str]:
+        """Return the standard material name for a game path, if any."""
+        profile_obj = get_profile_data(self.profile)
+
+        if not profile_obj:
+            return None
+        return profile_obj.index.material_names.get(path)
 
     def _search(self, context: Context, edit_text: str) -> list[str]:
         return list(self.get_standard_materials().keys())
@@ -34,7 +42,7 @@ class MeshSettings(PropertyGroup):
 
     def _set_material(self, name: str) -> None:
         standard_mats = self.get_standard_materials()
-        if name in standard_mats.keys():
+        if name in standard_mats:
             self["material_name"] = standard_mats[name]
         else:
             self["material_name"] = name.lower()
@@ -0,0 +1,153 @@
+"""Cache of collection analyses, invalidated from depsgraph updates."""
+
+from __future__ import annotations
+from dataclasses import dataclass
+
+from typing import TYPE_CHECKING, Dict, Iterable, Set
+
+from bpy.types import Collection, Key, Mesh, Object
+
+from .collection_analysis import (
+    CollectionAnalysis,
+    ObjectAnalysis,
+    analyse_object,
+)
+
+if TYPE_CHECKING:
+    from bpy.types import Depsgraph
+
+
+@dataclass
+class AnalysisCacheStats:
+    hits: int = 0
+    # Collection analyses rebuilt and objects read again for them
+    rebuilds: int = 0
+    objects_analysed: int = 0
+    # Collections marked dirty by updates, and full cache clears
+    invalidations: int = 0
+    clears: int = 0
+
+
+class _CachedCollection:
+    __slots__ = ("analysis", "objects", "meshes")
+
+    def __init__(
+        self,
+        analysis: CollectionAnalysis,
+        objects: Dict[int, ObjectAnalysis],
+        meshes: Dict[int, Set[int]],
+    ) -> None:
+        self.analysis = analysis
+        self.objects = objects
+        # Mesh uid -> uids of the objects using it, to map shapekey updates
+        self.meshes = meshes
+
+
+# Keyed by `session_uid`, which stays unique for an ID during a session
+_cache: Dict[int, _CachedCollection] = {}
+# Collection uid -> uids of its objects that changed. A present key means
+# the collection is dirty; membership is always re-read for it.
+_dirty: Dict[int, Set[int]] = {}
+_stats = AnalysisCacheStats()
+
+
+def get_collection_analysis(collection: Collection) -> CollectionAnalysis:
+    """Return the collection's analysis, re-reading only changed objects."""
+    key = collection.session_uid
+    cached = _cache.get(key)
+    dirty_objects = _dirty.pop(key, None)
+
+    if cached is not None and dirty_objects is None:
+        _stats.hits += 1
+        return cached.analysis
+
+    _stats.rebuilds += 1
+    previous = cached.objects if cached is not None else {}
+    stale = dirty_objects or set()
+
+    objects: Dict[int, ObjectAnalysis] = {}
+    meshes: Dict[int, Set[int]] = {}
+    for obj in collection.objects:
+        uid = obj.session_uid
+        entry = previous.get(uid)
+        if entry is None or uid in stale:
+            entry = analyse_object(obj)
+            _stats.objects_analysed += 1
+        objects[uid] = entry
+        data = getattr(obj, "data", None)
+        if isinstance(data, Mesh):
+            meshes.setdefault(data.session_uid, set()).add(uid)
+
+    analysis = CollectionAnalysis.from_objects(objects.values())
+    _cache[key] = _CachedCollection(analysis, objects, meshes)
+    return analysis
+
+
+def _mark_dirty(key: int, objects: Iterable[int] = ()) -> None:
+    if key not in _cache:
+        return
+
+    if key not in _dirty:
+        _stats.invalidations += 1
+    _dirty.setdefault(key, set()).update(objects)
+
+
+def _mark_mesh_dirty(mesh: Mesh) -> None:
+    uid = mesh.session_uid
+    for key, cached in _cache.items():
+        users = cached.meshes.get(uid)
+        if users:
+            _mark_dirty(key, users)
+
+
+def invalidate_object_analysis(obj: Object) -> None:
+    """Mark the collections of `obj` dirty after a change that raises no
+    depsgraph update, e.g. removing one of its modkit attributes."""
+    for col in obj.users_collection:
+        _mark_dirty(col.session_uid, (obj.session_uid,))
+
+
+def tag_depsgraph_updates(depsgraph: Depsgraph) -> None:
+    """Mark collections whose objects, shapekeys, names or props changed.
+
+    Object updates that only moved the object are ignored; a collection
+    update covers linking, unlinking and collection props. Changes that
+    raise no update go through `invalidate_object_analysis`.
+    """
+    for update in depsgraph.updates:
+        datablock = getattr(update.id, "original", update.id)
+        match datablock:
+            case Collection():
+                _mark_dirty(datablock.session_uid)
+            case Object():
+                if update.is_updated_transform and not (
+                    update.is_updated_geometry or update.is_updated_shading
+                ):
+                    continue
+                invalidate_object_analysis(datablock)
+            case Mesh():
+                _mark_mesh_dirty(datablock)
+            case Key():
+                if isinstance(datablock.user, Mesh):
+                    _mark_mesh_dirty(datablock.user)
+
+
+def clear_collection_analyses() -> None:
+    """Drop every cached analysis, e.g. after undo or loading a file."""
+    _stats.clears += 1
+    _cache.clear()
+    _dirty.clear()
+
+
+def get_analysis_cache_stats() -> AnalysisCacheStats:
+    """Return the hit and invalidation counters of the analysis cache."""
+    return _stats
+
+
+def reset_analysis_cache_stats() -> None:
+    """Reset the counters of the analysis cache."""
+    _stats.hits = 0
+    _stats.rebuilds = 0
+    _stats.objects_analysed = 0
+    _stats.invalidations = 0
+    _stats.clears = 0
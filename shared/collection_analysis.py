@@ -0,0 +1,151 @@
+"""Gather everything needed about a collection's objects in one pass."""
+
+from __future__ import annotations
+from collections import defaultdict
+from typing import (
+    DefaultDict,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from bpy.types import Collection, Mesh, Object
+
+from .model_scanner import parse_part_name
+
+from ..properties.object_settings import get_modkit_object_props
+
+
+class PartRecord:
+    """A mesh object named as a `<base> <mesh>.<part>` model part."""
+
+    __slots__ = (
+        "obj",
+        "base_name",
+        "mesh_index",
+        "part_index",
+        "attributes",
+        "materials",
+    )
+
+    def __init__(
+        self,
+        obj: Object,
+        base_name: str,
+        mesh_index: int,
+        part_index: int,
+        attributes: Tuple[str, ...],
+        materials: Tuple[str, ...],
+    ) -> None:
+        self.obj = obj
+        self.base_name = base_name
+        self.mesh_index = mesh_index
+        self.part_index = part_index
+        self.attributes = attributes
+        self.materials = materials
+
+
+class ObjectAnalysis:
+    """Shapekeys of one object and its part record, if it is a part."""
+
+    __slots__ = ("shapekeys", "part")
+
+    def __init__(
+        self, shapekeys: FrozenSet[str], part: Optional[PartRecord]
+    ) -> None:
+        self.shapekeys = shapekeys
+        self.part = part
+
+
+class CollectionAnalysis:
+    """Shapekeys and model parts of a collection."""
+
+    __slots__ = ("shapekeys", "parts", "meshes", "part_attrs")
+
+    def __init__(
+        self, shapekeys: FrozenSet[str], parts: Tuple[PartRecord, ...]
+    ) -> None:
+        meshes: DefaultDict[int, List[Tuple[Object, str, int]]] = (
+            defaultdict(list)
+        )
+        part_attrs: Dict[Tuple[int, int], List[str]] = {}
+        for part in parts:
+            meshes[part.mesh_index].append(
+                (part.obj, part.base_name, part.part_index)
+            )
+            if part.attributes:
+                part_attrs[(part.mesh_index, part.part_index)] = list(
+                    part.attributes
+                )
+
+        self.shapekeys = shapekeys
+        self.parts = parts
+        # Mesh index -> (object, base name, part index), like
+        # ModelScanner.scan_collection
+        self.meshes: Dict[int, List[Tuple[Object, str, int]]] = dict(meshes)
+        self.part_attrs = part_attrs
+
+    @classmethod
+    def from_objects(
+        cls, objects: Iterable[ObjectAnalysis]
+    ) -> CollectionAnalysis:
+        shapekeys: Set[str] = set()
+        parts: List[PartRecord] = []
+        for entry in objects:
+            shapekeys.update(entry.shapekeys)
+            if entry.part is not None:
+                parts.append(entry.part)
+        return cls(frozenset(shapekeys), tuple(parts))
+
+
+def analyse_object(obj: Object) -> ObjectAnalysis:
+    """Read an object's shapekeys and, for named parts, its part data.
+
+    Every RNA property is read a single time.
+    """
+    shapekeys: FrozenSet[str] = frozenset()
+    data = getattr(obj, "data", None)
+    if isinstance(data, Mesh):
+        sk = data.shape_keys
+        if sk:
+            shapekeys = frozenset(kb.name for kb in sk.key_blocks)
+
+    if obj.type != "MESH":
+        return ObjectAnalysis(shapekeys, None)
+
+    name_info = parse_part_name(obj.name)
+    if not name_info:
+        return ObjectAnalysis(shapekeys, None)
+
+    props = get_modkit_object_props(obj)
+    attributes = tuple(a.value for a in props.attributes) if props else ()
+    materials = tuple(
+        slot.material.name
+        for slot in getattr(obj, "material_slots", ())
+        if slot.material
+    )
+
+    part = PartRecord(
+        obj,
+        name_info.base_name,
+        name_info.mesh_index,
+        name_info.part_index,
+        attributes,
+        materials,
+    )
+    return ObjectAnalysis(shapekeys, part)
+
+
+def analyse_collection(collection: Collection) -> CollectionAnalysis:
+    """Read shapekeys, part names, attributes and material slots at once.
+
+    Each object is visited a single time; callers share the result
+    instead of walking `collection.objects` again.
+    """
+    return CollectionAnalysis.from_objects(
+        analyse_object(obj) for obj in collection.objects
+    )
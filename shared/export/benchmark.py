@@ -0,0 +1,126 @@
+r"""Time how long each export copy mode takes to provide the copies of a
+collection's variants.
+
+Run inside Blender, for example::
+
+    pkg=bl_ext.user_default.serenkit.shared.export
+    blender -b scene.blend --python-expr \
+        "from $pkg.benchmark import main; main()" \
+        -- --collection Body --variants 20
+
+Prints one JSON object per mode. Only duplication is timed: shapekeys
+and preprocessing still run during the export in most modes, while the
+evaluated mode already mixes keys and applies modifiers while copying.
+The evaluated mode can only be selected here until its results justify
+offering it in the export settings.
+"""
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import asdict, dataclass
+from itertools import islice
+from typing import Callable, List, Optional, Sequence
+
+import bpy
+
+from .duplication import (
+    EvaluatedDuplicator,
+    VariantDuplicator,
+    create_duplicator,
+)
+
+from ..export_context import CollectionExportInfo
+
+from ...properties.export_properties import ExportSettings, get_export_props
+
+DUPLICATION_MODES = ("PER_VARIANT", "REUSE_PARTS", "SNAPSHOT", "EVALUATED")
+
+
+@dataclass
+class DuplicationTiming:
+    mode: str
+    variants: int
+    # Seconds spent in prepare (including the depsgraph update it
+    # causes), release and close
+    prepare_s: float = 0.0
+    release_s: float = 0.0
+    close_s: float = 0.0
+
+    @property
+    def per_variant_ms(self) -> float:
+        total = self.prepare_s + self.release_s + self.close_s
+        return total * 1000 / max(1, self.variants)
+
+
+def _create_duplicator(
+    cfg: ExportSettings, info: CollectionExportInfo, mode: str
+) -> VariantDuplicator:
+    # The evaluated mode isn't one of the export settings' choices
+    if mode == "EVALUATED":
+        return EvaluatedDuplicator(info)
+    return create_duplicator(cfg, info, mode)
+
+
+def time_duplication(
+    cfg: ExportSettings,
+    info: CollectionExportInfo,
+    mode: str,
+    variants: Sequence[int],
+    clock: Callable[[], float] = time.perf_counter,
+) -> DuplicationTiming:
+    """Provide the copies of `variants` with `mode`, timing every step."""
+    view_layer = bpy.context.view_layer
+    timing = DuplicationTiming(mode, len(variants))
+
+    duplicator = _create_duplicator(cfg, info, mode)
+
+    try:
+        for variant in variants:
+            start = clock()
+            duplicator.prepare(variant)
+            if view_layer:
+                view_layer.update()
+            timing.prepare_s += clock() - start
+
+            start = clock()
+            duplicator.release()
+            timing.release_s += clock() - start
+    finally:
+        start = clock()
+        duplicator.close()
+        timing.close_s += clock() - start
+
+    return timing
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Entry point for `blender -b ... --python-expr`."""
+    parser = argparse.ArgumentParser(prog="serenkit-benchmark")
+    parser.add_argument("--collection", required=True)
+    parser.add_argument("--variants", type=int, default=10)
+    parser.add_argument(
+        "--mode",
+        dest="modes",
+        action="append",
+        choices=DUPLICATION_MODES,
+        help="Mode to time; repeat for several. Defaults to all",
+    )
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    args = parser.parse_args(argv)
+
+    cfg = get_export_props()
+    assert bpy.data.collections is not None
+    collection = bpy.data.collections.get(args.collection)
+    if cfg is None or collection is None:
+        sys.exit(f"Collection '{args.collection}' or export settings missing")
+
+    info = CollectionExportInfo(collection)
+    variants: List[int] = list(islice(info.iter_variants(), args.variants))
+    for mode in args.modes or DUPLICATION_MODES:
+        timing = time_duplication(cfg, info, mode, variants)
+        print(json.dumps(
+            {**asdict(timing), "per_variant_ms": timing.per_variant_ms}
+        ))
@@ -0,0 +1,245 @@
+"""FBX to MDL conversion through TexTools, optionally in the background."""
+
+import os
+import queue
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..db_patcher import apply_mesh_materials, apply_part_attributes
+from ..logging import log_debug, log_warning
+
+# The FBX converter always writes its database to this file in its
+# working directory
+RESULT_DB = "result.db"
+
+
+@dataclass(frozen=True)
+class ConversionJob:
+    """Everything needed to turn one exported FBX into an MDL."""
+
+    fbx_path: Path
+    textools_dir: Path
+    game_path: str
+    materials_info: Dict[int, str]
+    part_attrs: Dict[Tuple[int, int], List[str]]
+
+    @property
+    def mdl_path(self) -> Path:
+        return self.fbx_path.with_suffix(".mdl")
+
+
+@dataclass(frozen=True)
+class ConversionFailure:
+    job: ConversionJob
+    error: str
+
+
+def _mirror_entry(source: Path, target: Path) -> None:
+    try:
+        target.symlink_to(source, target_is_directory=source.is_dir())
+        return
+    except OSError:
+        # Windows without symlink rights
+        pass
+
+    if source.is_dir():
+        shutil.copytree(source, target)
+        return
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+
+class ConverterWorkspace:
+    """Private scratch copy of the FBX converter folder.
+
+    The converter writes `result.db` to its working directory, so
+    conversions can only run side by side from separate folders. Files
+    are linked instead of copied where the OS allows it.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._source: Optional[Path] = None
+
+    @property
+    def converter_dir(self) -> Path:
+        return self.root / "fbx"
+
+    def prepare(self, converter_dir: Path) -> Path:
+        """Mirror `converter_dir` if needed and clear the last result."""
+        target = self.converter_dir
+        if self._source != converter_dir:
+            shutil.rmtree(target, ignore_errors=True)
+            target.mkdir(parents=True)
+            for entry in converter_dir.iterdir():
+                if entry.name != RESULT_DB:
+                    _mirror_entry(entry, target / entry.name)
+            self._source = converter_dir
+
+        (target / RESULT_DB).unlink(missing_ok=True)
+        return target
+
+    def cleanup(self) -> None:
+        # rmtree removes links without following them
+        shutil.rmtree(self.root, ignore_errors=True)
+        self._source = None
+
+
+def convert_fbx_to_mdl(
+    job: ConversionJob, workspace: Optional[ConverterWorkspace] = None
+) -> None:
+    """Convert an FBX to MDL, patching materials and attributes in between.
+
+    Runs the converter from `workspace` when given, otherwise from the
+    TexTools folder itself. Doesn't touch Blender data, so it may run on
+    any thread.
+    """
+    converter_dir: Path = job.textools_dir / "converters" / "fbx"
+    if workspace is not None:
+        converter_dir = workspace.prepare(converter_dir)
+    db_path: Path = converter_dir / RESULT_DB
+
+    subprocess.check_call(
+        [str(converter_dir / "converter.exe"), str(job.fbx_path)],
+        cwd=converter_dir,
+    )
+
+    if not db_path.exists():
+        raise RuntimeError("FBX converter did not produce result.db")
+
+    conn: sqlite3.Connection = sqlite3.connect(db_path)
+    with conn:
+        cur: sqlite3.Cursor = conn.cursor()
+        apply_mesh_materials(cur, job.materials_info)
+        apply_part_attributes(cur, job.part_attrs)
+
+    conn.close()
+
+    subprocess.check_call(
+        [
+            str(job.textools_dir / "ConsoleTools.exe"),
+            "/wrap",
+            str(db_path),
+            str(job.mdl_path),
+            job.game_path,
+            "/mats",
+            "/attributes",
+        ],
+        cwd=job.textools_dir,
+        shell=sys.platform == "win32",
+    )
+    log_debug(f"Exported MDL to {job.mdl_path}")
+
+
+ConvertFn = Callable[[ConversionJob, ConverterWorkspace], None]
+
+
+class ConversionQueue:
+    """Runs conversions on background threads while Blender keeps
+    exporting.
+
+    Each of the `workers` threads converts one job at a time in its own
+    `ConverterWorkspace`, so with a single worker jobs finish in
+    submission order. Failures are collected rather than raised so the
+    export can report them all at the end.
+    """
+
+    def __init__(
+        self,
+        convert: ConvertFn = convert_fbx_to_mdl,
+        workers: int = 1,
+        workspace_root: Optional[Path] = None,
+    ) -> None:
+        self._convert = convert
+        self._workspace_root = workspace_root
+        self._jobs: "queue.Queue[Optional[ConversionJob]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pending = 0
+        self._cancelled = False
+        self.completed = 0
+        self.failures: List[ConversionFailure] = []
+        self._threads = [
+            threading.Thread(
+                target=self._run, name=f"mdl-conversion-{i}", daemon=True
+            )
+            for i in range(max(1, workers))
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    @property
+    def pending(self) -> int:
+        """Jobs submitted but not finished yet."""
+        with self._lock:
+            return self._pending
+
+    def submit(self, job: ConversionJob) -> None:
+        with self._lock:
+            self._pending += 1
+        self._jobs.put(job)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every submitted job finished; False on timeout."""
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    def cancel(self) -> None:
+        """Drop jobs that haven't started; the running one still finishes."""
+        with self._lock:
+            self._cancelled = True
+
+    def close(self, wait: bool = True) -> None:
+        """Stop the worker threads once the queued jobs are done.
+
+        Every worker removes its workspace on the way out.
+        """
+        for _ in self._threads:
+            self._jobs.put(None)
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def _run(self) -> None:
+        root = tempfile.mkdtemp(
+            prefix="serenkit-convert-", dir=self._workspace_root
+        )
+        workspace = ConverterWorkspace(Path(root))
+        try:
+            self._work(workspace)
+        finally:
+            workspace.cleanup()
+            if workspace.root.exists():
+                log_warning(f"Could not remove converter workspace {root}")
+
+    def _work(self, workspace: ConverterWorkspace) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+
+            with self._lock:
+                skip = self._cancelled
+            failure = None
+            if not skip:
+                try:
+                    self._convert(job, workspace)
+                except Exception as e:
+                    failure = ConversionFailure(job, str(e))
+
+            with self._idle:
+                self._pending -= 1
+                if failure is not None:
+                    self.failures.append(failure)
+                elif not skip:
+                    self.completed += 1
+                self._idle.notify_all()
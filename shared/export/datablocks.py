@@ -0,0 +1,81 @@
+"""Count the datablocks an export creates, to catch copies it leaks."""
+
+from dataclasses import dataclass, fields
+from typing import Any, Optional
+
+import bpy
+
+from ..logging import log_info, log_warning
+
+
+@dataclass(frozen=True)
+class DatablockCounts:
+    meshes: int = 0
+    objects: int = 0
+    materials: int = 0
+    collections: int = 0
+
+    @classmethod
+    def capture(cls, data: Any = None) -> "DatablockCounts":
+        """Count the datablocks in `data`, by default `bpy.data`."""
+        data = data if data is not None else bpy.data
+        return cls(*(len(getattr(data, f.name)) for f in fields(cls)))
+
+    def growth_since(self, before: "DatablockCounts") -> "DatablockCounts":
+        """Datablocks added since `before`; removals count as zero."""
+        return DatablockCounts(*(
+            max(0, getattr(self, f.name) - getattr(before, f.name))
+            for f in fields(self)
+        ))
+
+    def peak_with(self, other: "DatablockCounts") -> "DatablockCounts":
+        return DatablockCounts(*(
+            max(getattr(self, f.name), getattr(other, f.name))
+            for f in fields(self)
+        ))
+
+    def __bool__(self) -> bool:
+        return any(getattr(self, f.name) for f in fields(self))
+
+    def __str__(self) -> str:
+        return ", ".join(
+            f"{getattr(self, f.name)} {f.name}" for f in fields(self)
+        )
+
+
+class DatablockAccounting:
+    """Datablock counts of an export session.
+
+    Runners check every variant and collection against the counts before
+    it and log what is left behind; the peak counts are summarised at
+    the end.
+    """
+
+    def __init__(self, data: Any = None) -> None:
+        self._data = data
+        self.start = DatablockCounts.capture(data)
+        self.peak = self.start
+        self.leaks = 0
+
+    def sample(self) -> DatablockCounts:
+        """Count the datablocks now and update the peak."""
+        counts = DatablockCounts.capture(self._data)
+        self.peak = self.peak.peak_with(counts)
+        return counts
+
+    def check(self, label: str, before: DatablockCounts) -> None:
+        """Log the datablocks added since `before` as leaked by `label`."""
+        leaked = self.sample().growth_since(before)
+        if leaked:
+            self.leaks += 1
+            log_warning(f"{label} left behind {leaked}")
+
+    def summary(self, end: Optional[DatablockCounts] = None) -> str:
+        end = end or self.sample()
+        return (
+            f"Datablocks at start: {self.start}; peak: {self.peak}; "
+            f"left behind: {end.growth_since(self.start)}"
+        )
+
+    def log_summary(self) -> None:
+        log_info(self.summary())
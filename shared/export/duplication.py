@@ -0,0 +1,309 @@
+"""Strategies providing the export copy of a collection for each variant."""
+
+from typing import TYPE_CHECKING, Optional
+
+import bpy
+from bpy.types import Collection, Mesh, Object
+
+from .object_snapshot import ObjectSnapshot
+from .shapekey_deltas import static_shapekeys
+from .shapekey_utils import (
+    ShapeKeyState,
+    apply_variant_mask_to_collection,
+    collect_collection_meshes,
+    collect_object_shapekeys,
+    restore_shapekey_config,
+    save_shapekey_config,
+)
+from .utils import (
+    adjust_modifier_object_references,
+    cleanup_duplicate_collection,
+    create_export_collection,
+    duplicate_collection,
+    duplicate_mesh_for_export,
+    evaluated_mesh_for_export,
+    get_export_armature,
+    iter_modifier_object_references,
+    remove_export_copy,
+)
+
+from ..export_context import CollectionExportInfo
+
+from ...properties.export_properties import ExportSettings
+from ...properties.model_settings import get_modkit_collection_props
+from ...properties.object_settings import get_modkit_object_props
+
+if TYPE_CHECKING:
+    from bpy.types import Modifier
+
+
+class VariantDuplicator:
+    """Duplicates the whole collection for every variant."""
+
+    info: CollectionExportInfo
+    fresh_objects: list[Object]
+    _dup: Optional[Collection]
+    # Whether prepare() already wrote the variant's keys to the copies
+    applies_shapekeys: bool = False
+
+    def __init__(self, info: CollectionExportInfo) -> None:
+        self.info = info
+        self.fresh_objects = []
+        self._dup = None
+
+    def prepare(self, variant: int) -> Collection:
+        """Return the export collection for `variant`. Copies that still need
+        shapekeys applied and preprocessing are listed in `fresh_objects`.
+        """
+        self._dup = duplicate_collection(self.info.collection)
+        self.fresh_objects = list(self._dup.objects)
+        return self._dup
+
+    def release(self) -> None:
+        """Called once the current variant has been exported."""
+        if self._dup:
+            cleanup_duplicate_collection(self._dup)
+            self._dup = None
+        self.fresh_objects = []
+
+    def close(self) -> None:
+        """Called once every variant of the collection is done."""
+        self.release()
+
+
+def _own_shapekey_mask(info: CollectionExportInfo, obj: Object) -> int:
+    data = getattr(obj, "data", None)
+    if not isinstance(data, Mesh):
+        return 0
+    # Keys that move no vertex leave the copy unchanged whatever their state
+    keys = collect_object_shapekeys(data) - static_shapekeys(data)
+    return info.shapekey_bits.mask_of(keys)
+
+
+def object_state_masks(info: CollectionExportInfo) -> dict[Object, int]:
+    """Return, per source mesh object, the mask of profile keys whose state
+    affects its export copy.
+
+    Besides its own keys this covers the mannequin for robust weight
+    transfer and the objects its modifiers read from.
+    """
+    props = get_modkit_collection_props(info.collection)
+    mannequin = props.model.mannequin_object if props else None
+    mannequin_mask = _own_shapekey_mask(info, mannequin) if mannequin else 0
+
+    objects = [o for o in info.collection.objects if o.type == "MESH"]
+    masks = {obj: _own_shapekey_mask(info, obj) for obj in objects}
+    targets = {obj: list(iter_modifier_object_references(obj))
+               for obj in objects}
+
+    for obj in objects:
+        obj_props = get_modkit_object_props(obj)
+        if obj_props and obj_props.props.post_proc_robust_weight_transfer:
+            masks[obj] |= mannequin_mask
+
+    # Fold in the masks of modifier targets until nothing changes
+    changed = True
+    while changed:
+        changed = False
+        for obj in objects:
+            mask = masks[obj]
+            for target in targets[obj]:
+                if target in masks:
+                    mask |= masks[target]
+                elif target == mannequin:
+                    mask |= mannequin_mask
+            if mask != masks[obj]:
+                masks[obj] = mask
+                changed = True
+
+    return masks
+
+
+class ReusingDuplicator(VariantDuplicator):
+    """Keeps each object's export copy for as long as the variant state of
+    the keys it depends on stays the same, so only changed parts are
+    duplicated and preprocessed again."""
+
+    _copies: dict[Object, Object]
+    _states: dict[Object, int]
+    _masks: dict[Object, int]
+
+    def __init__(self, info: CollectionExportInfo) -> None:
+        super().__init__(info)
+        self._copies = {}
+        self._states = {}
+        self._masks = object_state_masks(info)
+
+    def prepare(self, variant: int) -> Collection:
+        if self._dup is None:
+            self._dup = create_export_collection(self.info.collection)
+        dup = self._dup
+
+        arm = get_export_armature(self.info.collection)
+        replaced: dict[Object, Object] = {}
+        self.fresh_objects = []
+
+        for obj, mask in self._masks.items():
+            state = variant & mask
+            copy = self._copies.get(obj)
+            if copy is not None and self._states[obj] == state:
+                continue
+
+            new_copy = duplicate_mesh_for_export(obj, arm)
+            dup.objects.link(new_copy)
+            if copy is not None:
+                replaced[copy] = new_copy
+            self._copies[obj] = new_copy
+            self._states[obj] = state
+            self.fresh_objects.append(new_copy)
+
+        adjust_modifier_object_references(self._copies, self.fresh_objects)
+
+        if replaced:
+            # Reused copies may still point at the copies being replaced
+            fresh = set(self.fresh_objects)
+            reused = [c for c in self._copies.values() if c not in fresh]
+            adjust_modifier_object_references(replaced, reused)
+            for old_copy in replaced:
+                remove_export_copy(old_copy)
+
+        return dup
+
+    def release(self) -> None:
+        self.fresh_objects = []
+
+    def close(self) -> None:
+        if self._dup:
+            cleanup_duplicate_collection(self._dup)
+            self._dup = None
+        self._copies.clear()
+        self._states.clear()
+        self.fresh_objects = []
+
+
+class SnapshotDuplicator(VariantDuplicator):
+    """Duplicates the collection once and resets the copies between
+    variants from a snapshot of the state preprocessing changes."""
+
+    _snapshots: list[ObjectSnapshot]
+    # Restoring resets the copies' keys, whatever the variant order
+    applies_shapekeys = True
+
+    def __init__(self, info: CollectionExportInfo) -> None:
+        super().__init__(info)
+        self._snapshots = []
+
+    def prepare(self, variant: int) -> Collection:
+        if self._dup is None:
+            self._dup = duplicate_collection(self.info.collection)
+            snapshots = (ObjectSnapshot.take(o) for o in self._dup.objects)
+            self._snapshots = [s for s in snapshots if s is not None]
+        else:
+            for snapshot in self._snapshots:
+                snapshot.restore()
+
+        copies = [s.obj for s in self._snapshots]
+        apply_variant_mask_to_collection(
+            self._dup, self.info.shapekey_bits, variant, objects=copies
+        )
+        self.fresh_objects = copies
+        return self._dup
+
+    def release(self) -> None:
+        self.fresh_objects = []
+
+    def close(self) -> None:
+        for snapshot in self._snapshots:
+            snapshot.free()
+        if self._dup:
+            cleanup_duplicate_collection(self._dup)
+            self._dup = None
+        self._snapshots = []
+        self.fresh_objects = []
+
+
+class EvaluatedDuplicator(VariantDuplicator):
+    """Builds each variant's export objects from the evaluated source
+    meshes, with shapekeys already mixed and modifiers applied, and frees
+    them right after the export.
+
+    The variant's keys are written to the source meshes and restored in
+    `close()`. Armature modifiers on the sources are turned off meanwhile,
+    so the copies are skinned to the export armature instead of baking
+    the current pose. Only the benchmark creates it, until its timings
+    justify offering it in the export settings.
+    """
+
+    _sources: list[Object]
+    _source_keys: list[tuple[Mesh, dict[str, ShapeKeyState]]]
+    _hidden_modifiers: list["Modifier"]
+
+    def __init__(self, info: CollectionExportInfo) -> None:
+        super().__init__(info)
+        self._sources = [o for o in info.collection.objects if o.type == "MESH"]
+        self._source_keys = []
+        self._hidden_modifiers = []
+
+    def _begin(self) -> Collection:
+        collection = self.info.collection
+        self._source_keys = [
+            (mesh, save_shapekey_config(mesh))
+            for mesh in collect_collection_meshes(collection)
+        ]
+        for obj in self._sources:
+            for mod in obj.modifiers:
+                if mod.type == "ARMATURE" and mod.show_viewport:
+                    mod.show_viewport = False
+                    self._hidden_modifiers.append(mod)
+        return create_export_collection(collection)
+
+    def prepare(self, variant: int) -> Collection:
+        if self._dup is None:
+            self._dup = self._begin()
+        dup = self._dup
+
+        apply_variant_mask_to_collection(
+            self.info.collection, self.info.shapekey_bits, variant
+        )
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        arm = get_export_armature(self.info.collection)
+
+        self.fresh_objects = []
+        for obj in self._sources:
+            copy = evaluated_mesh_for_export(obj, depsgraph, arm)
+            dup.objects.link(copy)
+            self.fresh_objects.append(copy)
+        return dup
+
+    def release(self) -> None:
+        for copy in self.fresh_objects:
+            remove_export_copy(copy)
+        self.fresh_objects = []
+
+    def close(self) -> None:
+        self.release()
+        if self._dup:
+            cleanup_duplicate_collection(self._dup)
+            self._dup = None
+        for mesh, config in self._source_keys:
+            restore_shapekey_config(mesh, config)
+        for mod in self._hidden_modifiers:
+            mod.show_viewport = True
+        self._source_keys = []
+        self._hidden_modifiers = []
+
+
+def create_duplicator(
+    cfg: ExportSettings,
+    info: CollectionExportInfo,
+    mode: Optional[str] = None,
+) -> VariantDuplicator:
+    """Factory function to create the duplicator selected in the export
+    settings, or the one for `mode`."""
+    match mode or cfg.duplication_mode:
+        case "REUSE_PARTS":
+            return ReusingDuplicator(info)
+        case "SNAPSHOT":
+            return SnapshotDuplicator(info)
+        case _:
+            return VariantDuplicator(info)
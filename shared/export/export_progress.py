@@ -13,6 +13,8 @@ class ProgressReporter(Protocol):
 
     def increment_variant_index(self) -> None: ...
 
+    def skip_variant(self) -> None: ...
+
     def clear(self) -> None: ...
 
 
@@ -30,6 +32,14 @@ class ExportProgress:
     processed_variants: int = 0
     total_variant_count: int = 0
 
+    # Variants left as they were because their inputs didn't change;
+    # also counted in `processed_variants`
+    skipped_variants: int = 0
+
+    @property
+    def rebuilt_variants(self) -> int:
+        return self.processed_variants - self.skipped_variants
+
     def set_total_collection_count(self, count: int) -> None:
         self.collection_count = count
 
@@ -46,6 +56,10 @@ class ExportProgress:
         self.local_idx += 1
         self.processed_variants += 1
 
+    def skip_variant(self) -> None:
+        self.skipped_variants += 1
+        self.increment_variant_index()
+
     def clear(self) -> None:
         self.collection_name = ""
         self.collection_index = 0
@@ -53,4 +67,5 @@ class ExportProgress:
         self.local_idx = 0
         self.local_variant_count = 0
         self.processed_variants = 0
+        self.skipped_variants = 0
         self.total_variant_count = 0
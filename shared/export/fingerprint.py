@@ -0,0 +1,203 @@
+"""Fingerprints of everything that goes into a variant's exported files."""
+
+import hashlib
+from typing import AbstractSet, Any, Iterable, List, Optional
+
+import numpy as np
+from bpy.types import Armature, Collection, Mesh, Object
+
+from .mesh_buffers import extract_mesh_buffers
+from .utils import get_export_armature, iter_modifier_object_references
+
+from ..export_context import CollectionExportInfo
+
+from ...properties.export_properties import ExportSettings
+from ...properties.model_settings import get_modkit_collection_props
+from ...properties.object_settings import get_modkit_object_props
+
+# Bump when a change to the export pipeline changes its output for the
+# same inputs, so earlier fingerprints stop matching
+FINGERPRINT_VERSION = 1
+
+# Export settings that don't change what ends up in the files
+RUNTIME_SETTINGS = frozenset({
+    "export_root_dir",
+    "live_install_target_dir",
+    "frame_budget_ms",
+    "export_workers",
+    "pipeline_conversion",
+    "conversion_workers",
+    "sandbox_export",
+    "incremental_export",
+    "variant_order",
+    "duplication_mode",
+})
+
+
+def _update(hasher: "hashlib.blake2b", label: str, value: Any) -> None:
+    hasher.update(f"{label}={value!r};".encode())
+
+
+def hash_rna(
+    hasher: "hashlib.blake2b",
+    struct: Any,
+    skip: Iterable[str] = (),
+    depth: int = 2,
+) -> None:
+    """Hash the RNA properties of `struct`, e.g. a modifier or props.
+
+    Datablock pointers are hashed by name; nested structs and collections
+    are followed up to `depth` levels. Objects a modifier reads from are
+    hashed separately, see `collection_fingerprint`.
+    """
+    skipped = set(skip) | {"rna_type"}
+    for prop in struct.bl_rna.properties:
+        name = prop.identifier
+        if name in skipped:
+            continue
+        value: Any = getattr(struct, name, None)
+        match prop.type:
+            case "POINTER":
+                if value is None or hasattr(value, "users"):
+                    # An ID datablock, or nothing
+                    _update(hasher, name, getattr(value, "name", None))
+                elif depth > 0:
+                    hash_rna(hasher, value, depth=depth - 1)
+            case "COLLECTION":
+                if depth > 0:
+                    for item in value:
+                        hash_rna(hasher, item, depth=depth - 1)
+            case _:
+                if hasattr(value, "__len__") and not isinstance(value, str):
+                    value = tuple(value)
+                _update(hasher, name, value)
+
+
+def _hash_shapekeys(
+    hasher: "hashlib.blake2b", mesh: Mesh, variant_keys: AbstractSet[str]
+) -> None:
+    # Values and mutes of `variant_keys` are left out: each variant writes
+    # its own, so only the other keys' slider state reaches the files
+    sk = mesh.shape_keys
+    if not sk:
+        return
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    _update(hasher, "use_relative", sk.use_relative)
+    for kb in sk.key_blocks:
+        _update(hasher, "key", (
+            kb.name, kb.relative_key.name, kb.vertex_group,
+            kb.slider_min, kb.slider_max, kb.interpolation,
+        ))
+        if kb.name not in variant_keys:
+            _update(hasher, "state", (kb.value, kb.mute))
+        kb.data.foreach_get("co", coords)
+        hasher.update(coords.tobytes())
+
+
+def hash_object(
+    hasher: "hashlib.blake2b",
+    obj: Object,
+    variant_keys: AbstractSet[str] = frozenset(),
+) -> None:
+    """Hash an object's mesh, shapekeys, modifiers and export props.
+
+    `variant_keys` are the shapekeys the variant masks set on `obj`.
+    """
+    _update(hasher, "object", (obj.name, obj.type))
+    _update(hasher, "parent", obj.parent.name if obj.parent else None)
+    hasher.update(np.asarray(obj.matrix_world, dtype=np.float32).tobytes())
+
+    mesh = obj.data
+    if isinstance(mesh, Mesh):
+        extract_mesh_buffers(mesh).update_hash(hasher)
+        _hash_shapekeys(hasher, mesh, variant_keys)
+        _update(hasher, "materials", [m.name if m else None
+                                      for m in mesh.materials])
+        _update(hasher, "groups", [g.name for g in obj.vertex_groups])
+
+    for mod in obj.modifiers:
+        _update(hasher, "modifier", mod.type)
+        hash_rna(hasher, mod)
+
+    container = get_modkit_object_props(obj)
+    if container is not None:
+        hash_rna(hasher, container.props, skip=("is_expanded",))
+
+
+def _hash_armature(hasher: "hashlib.blake2b", arm: Object) -> None:
+    _update(hasher, "armature", arm.name)
+    hasher.update(np.asarray(arm.matrix_world, dtype=np.float32).tobytes())
+    if not isinstance(arm.data, Armature):
+        return
+    bones = arm.data.bones
+    _update(hasher, "bones", [b.name for b in bones])
+    matrices = np.empty(len(bones) * 16, dtype=np.float32)
+    bones.foreach_get("matrix_local", matrices)
+    hasher.update(matrices.tobytes())
+
+
+def referenced_objects(
+    collection: Collection, mannequin: Optional[Object] = None
+) -> List[Object]:
+    """Objects outside `collection` its export reads from: the mannequin
+    and the targets of modifiers, followed through their own modifiers."""
+    members = set(collection.objects)
+    pending = [mannequin] if mannequin is not None else []
+    for obj in collection.objects:
+        pending.extend(iter_modifier_object_references(obj))
+
+    found: List[Object] = []
+    while pending:
+        obj = pending.pop()
+        if obj in members or obj in found:
+            continue
+        found.append(obj)
+        pending.extend(iter_modifier_object_references(obj))
+    return sorted(found, key=lambda o: o.name)
+
+
+def collection_fingerprint(
+    info: CollectionExportInfo,
+    cfg: ExportSettings,
+    textools_dir: Optional[str] = None,
+) -> "hashlib.blake2b":
+    """Hash the inputs a collection's variants share.
+
+    Returns the hasher so per-variant inputs can be added to copies of it.
+    """
+    hasher = hashlib.blake2b(digest_size=20)
+    _update(hasher, "version", FINGERPRINT_VERSION)
+    collection: Collection = info.collection
+    _update(hasher, "collection", collection.name)
+    _update(hasher, "textools", textools_dir)
+    hash_rna(hasher, cfg, skip=RUNTIME_SETTINGS)
+
+    props = get_modkit_collection_props(collection)
+    if props is not None:
+        hash_rna(hasher, props.model, skip=("is_expanded",))
+    _update(hasher, "game_path", info.game_path)
+    _update(hasher, "materials", sorted(info.materials_info.items()))
+    _update(hasher, "attributes", sorted(info.part_attrs.items()))
+
+    variant_keys = info.shapekey_bits.name_masks.keys()
+    for obj in sorted(collection.objects, key=lambda o: o.name):
+        hash_object(hasher, obj, variant_keys)
+
+    mannequin = props.model.mannequin_object if props else None
+    for obj in referenced_objects(collection, mannequin):
+        hash_object(hasher, obj)
+
+    arm = get_export_armature(collection)
+    if arm is not None:
+        _hash_armature(hasher, arm)
+
+    return hasher
+
+
+def variant_fingerprint(
+    base: "hashlib.blake2b", info: CollectionExportInfo, variant: int
+) -> str:
+    """Fingerprint of one variant: the shared inputs plus its active keys."""
+    hasher = base.copy()
+    _update(hasher, "keys", info.shapekey_bits.pairs(variant))
+    return hasher.hexdigest()
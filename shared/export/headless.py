@@ -0,0 +1,252 @@
+r"""Run exports without a UI, for build machines and scripts.
+
+Arguments follow Blender's `--` separator, for example::
+
+    pkg=bl_ext.user_default.serenkit.shared.export
+    blender -b scene.blend --python-expr \
+        "from $pkg.headless import main; main()" \
+        -- --export-root out --collection Body --mode FBX_ONLY
+
+Progress is printed to stdout as one JSON object per line.
+"""
+
+import argparse
+import json
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Iterator, List, Optional, Sequence
+
+import bpy
+from bpy.types import Collection
+
+from .export_progress import ExportProgress
+from .session import ExportSession, Shard
+from .utils import collect_enabled_collections
+
+from ..cancel import Cancelled
+
+from ...properties.export_properties import ExportSettings, get_export_props
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+
+_EXPORT_MODES = ("FBX_ONLY", "FBX_TO_MDL")
+
+
+class _UsageError(Exception):
+    pass
+
+
+class _ArgumentParser(argparse.ArgumentParser):
+    def error(self, message: str) -> Any:
+        raise _UsageError(message)
+
+
+class JsonLinesProgress(ExportProgress):
+    """Export progress that also prints every change as a JSON line."""
+
+    def __init__(self, stream: IO[str]) -> None:
+        super().__init__()
+        self._stream = stream
+
+    def emit(self, event: str, **fields: Any) -> None:
+        self._stream.write(json.dumps({"event": event, **fields}) + "\n")
+        self._stream.flush()
+
+    def start_new_collection(self, name: str, local_total: int) -> None:
+        super().start_new_collection(name, local_total)
+        self.emit(
+            "collection",
+            name=name,
+            index=self.collection_index,
+            count=self.collection_count,
+            variants=local_total,
+        )
+
+    def increment_variant_index(self) -> None:
+        super().increment_variant_index()
+        self.emit(
+            "variant",
+            collection=self.collection_name,
+            index=self.local_idx,
+            processed=self.processed_variants,
+            skipped=self.skipped_variants,
+            total=self.total_variant_count,
+        )
+
+
+def _parse_shard(value: str) -> Shard:
+    """Parse `INDEX/COUNT`, e.g. `0/4` for the first of four workers."""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected INDEX/COUNT, got {value!r}")
+    if count < 1 or not 0 <= index < count:
+        raise argparse.ArgumentTypeError(f"invalid shard {value!r}")
+    return Shard(index, count)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = _ArgumentParser(
+        prog="serenkit-export",
+        description="Export SerenKit collections without a UI.",
+    )
+    parser.add_argument(
+        "--export-root",
+        required=True,
+        type=Path,
+        help="Folder receiving one sub-folder per exported collection",
+    )
+    parser.add_argument(
+        "--collection",
+        dest="collections",
+        action="append",
+        default=[],
+        metavar="NAME",
+        help="Collection to export; repeat for several. "
+        "Defaults to every export-enabled collection",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=_EXPORT_MODES,
+        help="Export pipeline; defaults to the scene's setting",
+    )
+    parser.add_argument(
+        "--textools",
+        type=Path,
+        help="TexTools directory; defaults to the add-on preferences",
+    )
+    parser.add_argument(
+        "--shard",
+        type=_parse_shard,
+        metavar="INDEX/COUNT",
+        help="Export only this worker's slice of all variants",
+    )
+    parser.add_argument(
+        "--stage-dir",
+        type=Path,
+        help="Write files here first and move each finished one into "
+        "the export root; must be on the same drive as the export root",
+    )
+    return parser
+
+
+def _script_args(argv: Optional[Sequence[str]]) -> List[str]:
+    """Return the arguments meant for this script, after Blender's `--`."""
+    if argv is not None:
+        return list(argv)
+    args = sys.argv
+    return args[args.index("--") + 1:] if "--" in args else []
+
+
+def _resolve_collections(names: Sequence[str]) -> List[Collection]:
+    if not names:
+        return sorted(collect_enabled_collections(), key=lambda c: c.name)
+
+    assert bpy.data.collections is not None
+    collections: List[Collection] = []
+    for name in names:
+        collection = bpy.data.collections.get(name)
+        if collection is None:
+            raise _UsageError(f"Collection '{name}' not found")
+        collections.append(collection)
+    return collections
+
+
+def _resolve_textools(arg: Optional[Path]) -> Optional[Path]:
+    if arg is not None:
+        return arg
+
+    # Imported lazily: preferences registers UI classes on import
+    from ...preferences import get_addon_preferences
+
+    prefs = get_addon_preferences()
+    path = prefs.textools_path if prefs else ""
+    return Path(path) if path else None
+
+
+@contextmanager
+def _export_mode(cfg: ExportSettings, mode: Optional[str]) -> Iterator[None]:
+    """Temporarily override the scene's export mode."""
+    previous = cfg.export_mode
+    if mode:
+        cfg.export_mode = mode
+    try:
+        yield
+    finally:
+        cfg.export_mode = previous
+
+
+def run_headless(
+    argv: Optional[Sequence[str]] = None, stream: IO[str] = sys.stdout
+) -> int:
+    """Run an export to completion and return a process exit status."""
+    progress = JsonLinesProgress(stream)
+
+    try:
+        args = build_parser().parse_args(_script_args(argv))
+        cfg = get_export_props()
+        if cfg is None:
+            raise _UsageError("Scene has no SerenKit export settings")
+
+        collections = _resolve_collections(args.collections)
+        textools_dir = _resolve_textools(args.textools)
+        mode = args.mode or cfg.export_mode
+        has_textools = bool(textools_dir and textools_dir.is_dir())
+        if mode == "FBX_TO_MDL" and not has_textools:
+            raise _UsageError(f"TexTools directory not found: {textools_dir}")
+        args.export_root.mkdir(parents=True, exist_ok=True)
+    except (_UsageError, OSError) as e:
+        progress.emit("error", message=str(e))
+        return EXIT_USAGE
+
+    session = ExportSession(args.export_root, cfg, progress_reporter=progress)
+    session.textools_dir = textools_dir
+    session.shard = args.shard
+    session.stage_root = args.stage_dir
+
+    with _export_mode(cfg, args.mode):
+        try:
+            session.start(collections)
+            progress.emit(
+                "start",
+                mode=mode,
+                collections=[c.name for c in collections],
+                variants=session.total_variants,
+            )
+            for _ in session.step():
+                pass
+        except (Cancelled, KeyboardInterrupt):
+            session.cancel()
+            progress.emit("cancelled", processed=progress.processed_variants)
+            return EXIT_FAILED
+        except Exception as e:
+            session.cancel()
+            progress.emit(
+                "error",
+                message=str(e),
+                type=type(e).__name__,
+                processed=progress.processed_variants,
+            )
+            return EXIT_FAILED
+
+    failures = session.conversion_failures
+    for failure in failures:
+        progress.emit(
+            "error",
+            message=failure.error,
+            file=str(failure.job.fbx_path),
+        )
+    progress.emit(
+        "done",
+        processed=progress.processed_variants,
+        skipped=progress.skipped_variants,
+    )
+    return EXIT_FAILED if failures else EXIT_OK
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Entry point for `blender -b ... --python-expr`; exits Blender."""
+    sys.exit(run_headless(argv))
@@ -0,0 +1,121 @@
+"""Record of what each exported variant was built from, so unchanged
+variants can be skipped by the next export."""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ..logging import log_warning
+
+MANIFEST_VERSION = 1
+MANIFEST_PREFIX = ".serenkit-manifest"
+
+# (size, mtime_ns) of an output file when its variant was recorded
+Stamp = Tuple[int, int]
+
+
+def _stamp(path: Path) -> Optional[Stamp]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+class ExportManifest:
+    """Fingerprints and output files of the variants in one export folder.
+
+    Each writer, e.g. a shard worker, saves its own file, named after
+    `suffix`; loading merges every manifest in the folder. Outputs are
+    stamped on `save()`, after any background conversion finished, so a
+    variant is only current while its files are exactly as exported.
+    Entries whose files changed since are dropped while loading, so a
+    stale manifest never hides the one that wrote the files.
+    """
+
+    def __init__(self, directory: Path, suffix: str = "") -> None:
+        self.directory = directory
+        self.path = directory / f"{MANIFEST_PREFIX}{suffix}.json"
+        # Variant file name -> (fingerprint, output name -> stamp)
+        self._entries: Dict[str, Tuple[str, Dict[str, Optional[Stamp]]]] = {}
+        self._recorded: Dict[str, Tuple[str, List[str]]] = {}
+
+    def load(self) -> "ExportManifest":
+        paths: List[Tuple[int, str, Path]] = []
+        for path in self.directory.glob(f"{MANIFEST_PREFIX}*.json"):
+            stamp = _stamp(path)
+            if stamp is not None:
+                paths.append((stamp[1], path.name, path))
+
+        # Oldest first, so a newer manifest wins for the same files
+        for _, _, path in sorted(paths):
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as e:
+                log_warning(f"Ignoring unreadable export manifest {path}: {e}")
+                continue
+            if data.get("version") != MANIFEST_VERSION:
+                continue
+            for name, entry in data.get("variants", {}).items():
+                outputs: Dict[str, Optional[Stamp]] = {
+                    output: (stamp[0], stamp[1]) if stamp else None
+                    for output, stamp in entry["outputs"].items()
+                }
+                if self._on_disk(outputs):
+                    self._entries[name] = (entry["fingerprint"], outputs)
+        return self
+
+    def _on_disk(self, stamps: Dict[str, Optional[Stamp]]) -> bool:
+        return all(
+            stamp is not None and _stamp(self.directory / output) == stamp
+            for output, stamp in stamps.items()
+        )
+
+    def is_current(
+        self, name: str, fingerprint: str, outputs: List[Path]
+    ) -> bool:
+        """Whether `outputs` were built from `fingerprint` and are untouched."""
+        entry = self._entries.get(name)
+        if entry is None or entry[0] != fingerprint:
+            return False
+        stamps = entry[1]
+        return all(
+            p.name in stamps and stamps[p.name] is not None
+            and _stamp(p) == stamps[p.name]
+            for p in outputs
+        )
+
+    def keep(self, name: str) -> None:
+        """Carry a skipped variant's entry over into this manifest."""
+        fingerprint, stamps = self._entries[name]
+        self._recorded[name] = (fingerprint, list(stamps))
+
+    def record(self, name: str, fingerprint: str, outputs: List[Path]) -> None:
+        """Note that `outputs` were just built from `fingerprint`."""
+        self._recorded[name] = (fingerprint, [p.name for p in outputs])
+
+    def save(self) -> None:
+        """Stamp the recorded outputs and write the manifest atomically.
+
+        Variants with a missing output, e.g. a failed conversion, are left
+        out so the next export rebuilds them.
+        """
+        if not self._recorded:
+            return
+
+        variants = {}
+        for name, (fingerprint, outputs) in sorted(self._recorded.items()):
+            stamps = {o: _stamp(self.directory / o) for o in outputs}
+            if any(stamp is None for stamp in stamps.values()):
+                continue
+            variants[name] = {"fingerprint": fingerprint, "outputs": stamps}
+
+        data = {"version": MANIFEST_VERSION, "variants": variants}
+        tmp = self.path.with_suffix(".tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(data, indent=1), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError as e:
+            log_warning(f"Could not save export manifest {self.path}: {e}")
@@ -0,0 +1,101 @@
+"""Read export geometry into NumPy arrays, which the incremental export
+hashes to tell whether a variant's inputs changed.
+
+Uses `foreach_get`, which copies a whole attribute at once instead of
+visiting vertices from Python. Bone weights are only stored per vertex,
+so they are copied one vertex at a time, still without a Python loop
+over the weights themselves.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from typing import Any, Dict
+
+import numpy as np
+from bpy.types import ByteColorAttribute, FloatColorAttribute, Mesh
+
+
+def _read(collection: Any, attr: str, width: int, dtype: Any) -> np.ndarray:
+    buffer = np.empty(len(collection) * width, dtype=dtype)
+    collection.foreach_get(attr, buffer)
+    return buffer.reshape(-1, width) if width > 1 else buffer
+
+
+@dataclass
+class MeshBuffers:
+    """Geometry of one mesh as it would be exported."""
+
+    positions: np.ndarray
+    face_sizes: np.ndarray
+    material_indices: np.ndarray
+    corner_verts: np.ndarray
+    normals: np.ndarray
+    uvs: Dict[str, np.ndarray]
+    colors: Dict[str, np.ndarray]
+    # Weights of vertex i are weights[offsets[i]:offsets[i + 1]], for the
+    # vertex groups at the same positions in weight_groups
+    weight_offsets: np.ndarray
+    weight_groups: np.ndarray
+    weights: np.ndarray
+
+    def update_hash(self, hasher: "hashlib.blake2b") -> None:
+        """Feed every buffer, with its name and shape, into `hasher`."""
+        arrays = [
+            ("positions", self.positions),
+            ("face_sizes", self.face_sizes),
+            ("material_indices", self.material_indices),
+            ("corner_verts", self.corner_verts),
+            ("normals", self.normals),
+            ("weight_offsets", self.weight_offsets),
+            ("weight_groups", self.weight_groups),
+            ("weights", self.weights),
+        ]
+        arrays += [(f"uv:{k}", v) for k, v in sorted(self.uvs.items())]
+        arrays += [(f"color:{k}", v) for k, v in sorted(self.colors.items())]
+        for name, array in arrays:
+            hasher.update(f"{name}{array.shape}".encode())
+            hasher.update(np.ascontiguousarray(array).tobytes())
+
+
+def read_vertex_weights(
+    mesh: Mesh,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the offsets, group indices and weights of every vertex."""
+    vertices = mesh.vertices
+    counts = np.fromiter(
+        (len(v.groups) for v in vertices), dtype=np.int64, count=len(vertices)
+    )
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+
+    groups = np.empty(offsets[-1], dtype=np.int32)
+    weights = np.empty(offsets[-1], dtype=np.float32)
+    for vertex, start, stop in zip(vertices, offsets[:-1], offsets[1:]):
+        if start != stop:
+            vertex.groups.foreach_get("group", groups[start:stop])
+            vertex.groups.foreach_get("weight", weights[start:stop])
+    return offsets, groups, weights
+
+
+def extract_mesh_buffers(mesh: Mesh) -> MeshBuffers:
+    """Copy the geometry, normals, UVs, colours and weights of `mesh`."""
+    offsets, groups, weights = read_vertex_weights(mesh)
+    return MeshBuffers(
+        positions=_read(mesh.vertices, "co", 3, np.float32),
+        face_sizes=_read(mesh.polygons, "loop_total", 1, np.int32),
+        material_indices=_read(mesh.polygons, "material_index", 1, np.int32),
+        corner_verts=_read(mesh.loops, "vertex_index", 1, np.int32),
+        normals=_read(mesh.corner_normals, "vector", 3, np.float32),
+        uvs={
+            layer.name: _read(layer.uv, "vector", 2, np.float32)
+            for layer in mesh.uv_layers
+        },
+        colors={
+            attr.name: _read(attr.data, "color", 4, np.float32)
+            for attr in mesh.color_attributes
+            if isinstance(attr, (ByteColorAttribute, FloatColorAttribute))
+        },
+        weight_offsets=offsets,
+        weight_groups=groups,
+        weights=weights,
+    )
@@ -1,7 +1,7 @@
 from ..export_context import CollectionExportInfo
 
 from ..logging import log_error
-from ..variants import detect_export_alias, name_variant
+from ..variants import detect_variant_alias, name_variant
 
 from ...properties.model_settings import get_modkit_collection_props
 from ...properties.export_properties import ExportSettings
@@ -10,7 +10,7 @@ from ...properties.export_properties import ExportSettings
 def build_export_name(
     export_settings: ExportSettings,
     info: CollectionExportInfo,
-    variant: list[str],
+    variant: int,
 ) -> str:
     """Construct an export filename based on the export settings,
     collection, and variant information.
@@ -18,7 +18,7 @@ def build_export_name(
 
     parts: list[str] = []
 
-    remaining = list(variant)
+    remaining = variant
     mode = export_settings.export_prefix_mode
 
     col_props = get_modkit_collection_props(info.collection)
@@ -37,13 +37,19 @@ def build_export_name(
                 "assigned variant profile on the collection"
             )
 
-        override, remaining = detect_export_alias(remaining, info.profile)
+        override, remaining = detect_variant_alias(
+            remaining, info.shapekey_bits, info.profile
+        )
 
         parts.append(override or profile_name)
     elif mode == "CUSTOM" and export_settings.export_custom_prefix:
         parts.append(export_settings.export_custom_prefix)
 
-    label = name_variant(remaining) if remaining else ""
+    label = (
+        name_variant(info.shapekey_bits.export_names(remaining))
+        if remaining
+        else ""
+    )
     if label:
         parts.append(label)
 
@@ -0,0 +1,102 @@
+"""Copies of the export-copy state that preprocessing changes, so one
+copy can be reset between variants instead of duplicated again."""
+
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import bpy
+import numpy as np
+from bpy.types import Mesh, Object
+
+from .shapekey_utils import (
+    ShapeKeyState,
+    restore_shapekey_config,
+    save_shapekey_config,
+)
+
+from ...properties.object_settings import get_modkit_object_props
+
+
+@dataclass
+class _UVSnapshot:
+    layers: Dict[str, np.ndarray]
+    active: Optional[str]
+
+    @classmethod
+    def take(cls, mesh: Mesh) -> "_UVSnapshot":
+        layers: Dict[str, np.ndarray] = {}
+        for layer in mesh.uv_layers:
+            uv = np.empty(len(layer.uv) * 2, dtype=np.float32)
+            layer.uv.foreach_get("vector", uv)
+            layers[layer.name] = uv
+        active = mesh.uv_layers.active
+        return cls(layers, active.name if active is not None else None)
+
+    def restore(self, mesh: Mesh) -> None:
+        for layer in list(mesh.uv_layers):
+            if layer.name not in self.layers:
+                mesh.uv_layers.remove(layer)
+        for name, uv in self.layers.items():
+            target = mesh.uv_layers.get(name) or mesh.uv_layers.new(name=name)
+            # Extra layers were removed above, so there is room for it
+            assert target is not None
+            target.uv.foreach_set("vector", uv)
+        if self.active is not None:
+            mesh.uv_layers.active = mesh.uv_layers.get(self.active)
+
+
+@dataclass
+class ObjectSnapshot:
+    """State of one export copy that preprocessing may change.
+
+    Only what the object's enabled preprocessing touches is kept: the
+    UV layers for unwrapping, and for robust weight transfer an unused
+    copy of the whole mesh. Weight transfer rewrites most weights, so
+    swapping in a fresh copy of that mesh is cheaper than writing the
+    weights back group by group. Shapekey states are always kept.
+    """
+
+    obj: Object
+    shapekeys: Dict[str, ShapeKeyState]
+    uvs: Optional[_UVSnapshot]
+    mesh: Optional[Mesh]
+
+    @classmethod
+    def take(cls, obj: Object) -> Optional["ObjectSnapshot"]:
+        """Snapshot a mesh object; other objects return None."""
+        mesh = obj.data
+        if not isinstance(mesh, Mesh):
+            return None
+
+        container = get_modkit_object_props(obj)
+        props = container.props if container else None
+        unwraps = bool(props and props.postproc_unwrap_uvs)
+        transfers = bool(props and props.post_proc_robust_weight_transfer)
+
+        return cls(
+            obj,
+            save_shapekey_config(mesh),
+            # The mesh copy brings the UV layers back as well
+            _UVSnapshot.take(mesh) if unwraps and not transfers else None,
+            mesh.copy() if transfers else None,
+        )
+
+    def restore(self) -> None:
+        if self.mesh is not None:
+            used = self.obj.data
+            self.obj.data = self.mesh.copy()
+            if isinstance(used, Mesh) and used.users == 0:
+                bpy.data.meshes.remove(used)
+
+        mesh = self.obj.data
+        assert isinstance(mesh, Mesh)
+        restore_shapekey_config(mesh, self.shapekeys)
+        if self.uvs is not None:
+            self.uvs.restore(mesh)
+        mesh.update()
+
+    def free(self) -> None:
+        """Remove the kept mesh copy, once the object is done with."""
+        if self.mesh is not None:
+            bpy.data.meshes.remove(self.mesh)
+            self.mesh = None
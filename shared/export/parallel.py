@@ -0,0 +1,206 @@
+"""Split an export across background Blender processes."""
+
+import json
+import queue
+import shutil
+import subprocess
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Dict, List, Optional, Sequence
+
+import bpy
+
+from . import headless
+from .export_progress import ExportProgress
+
+from ..logging import log_debug, log_warning
+
+# Hidden folder below the export root holding the snapshot and the
+# per-worker stage folders, so finished files move within one drive
+STAGE_DIR_NAME = ".serenkit-stage"
+
+
+@dataclass
+class WorkerState:
+    """Progress of one worker process as reported on its stdout."""
+
+    index: int
+    process: "subprocess.Popen[str]"
+    total: int = 0
+    processed: int = 0
+    skipped: int = 0
+    collection: str = ""
+    error: Optional[str] = None
+    done: bool = False
+    log: List[str] = field(default_factory=list)
+
+
+class ParallelExport:
+    """Run an export in `worker_count` background Blender processes.
+
+    Every worker exports a contiguous slice of all (collection, variant)
+    pairs through the headless driver, and the workers' JSON progress is
+    merged into one `ExportProgress`.
+    """
+
+    def __init__(
+        self,
+        export_root: Path,
+        collections: Sequence[str],
+        worker_count: int,
+        progress: ExportProgress,
+        mode: str = "FBX_ONLY",
+        textools_dir: Optional[Path] = None,
+        blender_binary: Optional[str] = None,
+    ) -> None:
+        self.export_root = export_root
+        self.collections = list(collections)
+        self.worker_count = max(1, worker_count)
+        self.progress = progress
+        self.mode = mode
+        self.textools_dir = textools_dir
+        self.blender_binary = blender_binary or bpy.app.binary_path
+        self.stage_root = export_root / STAGE_DIR_NAME
+        self.workers: List[WorkerState] = []
+        self._events: "queue.Queue[tuple[int, Optional[Dict[str, Any]]]]" = (
+            queue.Queue()
+        )
+
+    def save_snapshot(self) -> Path:
+        """Save a copy of the open .blend for the workers to load."""
+        self.stage_root.mkdir(parents=True, exist_ok=True)
+        snapshot = self.stage_root / "snapshot.blend"
+        bpy.ops.wm.save_as_mainfile(
+            filepath=str(snapshot), copy=True, check_existing=False
+        )
+        return snapshot
+
+    def worker_command(self, snapshot: Path, index: int) -> List[str]:
+        expr = f"import {headless.__name__} as h; h.main()"
+        command = [
+            self.blender_binary,
+            "--background",
+            str(snapshot),
+            "--python-expr",
+            expr,
+            "--",
+            "--export-root",
+            str(self.export_root),
+            "--mode",
+            self.mode,
+            "--shard",
+            f"{index}/{self.worker_count}",
+            "--stage-dir",
+            str(self.stage_root / f"worker-{index}"),
+        ]
+        for name in self.collections:
+            command += ["--collection", name]
+        if self.textools_dir:
+            command += ["--textools", str(self.textools_dir)]
+        return command
+
+    def start(self, snapshot: Optional[Path] = None) -> None:
+        """Launch the workers; progress arrives through `poll()`."""
+        snapshot = snapshot or self.save_snapshot()
+
+        self.progress.clear()
+        self.progress.set_total_collection_count(len(self.collections))
+
+        for index in range(self.worker_count):
+            process = subprocess.Popen(
+                self.worker_command(snapshot, index),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1,
+            )
+            self.workers.append(WorkerState(index, process))
+            assert process.stdout is not None
+            threading.Thread(
+                target=self._read_output,
+                args=(index, process.stdout),
+                daemon=True,
+            ).start()
+
+    def _read_output(self, index: int, stream: IO[str]) -> None:
+        for line in stream:
+            try:
+                event = json.loads(line)
+            except ValueError:
+                # Blender's own console output
+                self.workers[index].log.append(line.rstrip())
+                continue
+            if isinstance(event, dict):
+                self._events.put((index, event))
+        self._events.put((index, None))
+
+    def _apply(self, worker: WorkerState, event: Dict[str, Any]) -> None:
+        match event:
+            case {"event": "start", "variants": int(total)}:
+                worker.total = total
+                self.progress.set_total_variant_count(
+                    sum(w.total for w in self.workers)
+                )
+            case {"event": "collection", "name": str(name)}:
+                worker.collection = name
+                self.progress.collection_name = name
+            case {"event": "variant", "processed": int(processed)}:
+                worker.processed = processed
+                worker.skipped = event.get("skipped", 0)
+                self.progress.processed_variants = sum(
+                    w.processed for w in self.workers
+                )
+                self.progress.skipped_variants = sum(
+                    w.skipped for w in self.workers
+                )
+            case {"event": "error", "message": str(message)}:
+                worker.error = message
+            case {"event": "cancelled"}:
+                worker.error = "cancelled"
+
+    def poll(self) -> bool:
+        """Merge pending worker progress; return whether work remains."""
+        while True:
+            try:
+                index, event = self._events.get_nowait()
+            except queue.Empty:
+                break
+            worker = self.workers[index]
+            if event is None:
+                worker.done = True
+            else:
+                self._apply(worker, event)
+
+        return not all(
+            w.done and w.process.poll() is not None for w in self.workers
+        )
+
+    def failures(self) -> List[str]:
+        """Describe every worker that failed, once all have finished."""
+        failed: List[str] = []
+        for w in self.workers:
+            if w.process.returncode == headless.EXIT_OK:
+                continue
+            reason = w.error or "\n".join(w.log[-5:]) or "no output"
+            failed.append(
+                f"worker {w.index} exited with {w.process.returncode}: {reason}"
+            )
+        return failed
+
+    def cancel(self) -> None:
+        """Stop all workers; files already moved to the export root stay."""
+        for w in self.workers:
+            if w.process.poll() is None:
+                w.process.terminate()
+        for w in self.workers:
+            try:
+                w.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                log_warning(f"Export worker {w.index} did not stop, killing")
+                w.process.kill()
+
+    def cleanup(self) -> None:
+        """Remove the snapshot and stage folders."""
+        log_debug(f"Removing export stage folder {self.stage_root}")
+        shutil.rmtree(self.stage_root, ignore_errors=True)
@@ -6,10 +6,11 @@ from contextlib import contextmanager
 from ...properties.object_settings import get_modkit_object_props
 
 
+from .sandbox import get_active_sandbox
 from .utils import select_objects_for_export
 
 from ..logging import log_debug, log_error, log_warning
-from ..ui_helpers import call_operator_in_3d_viewport
+from ..ui_helpers import ViewportUnavailable, call_operator_in_3d_viewport
 from ..export_context import CollectionExportInfo
 
 from ...properties.model_settings import get_modkit_collection_props
@@ -31,20 +32,23 @@ def _preserve_view_context():
         yield
     finally:
         try:
-            bpy.ops.object.mode_set(mode=prev_mode)
+            if bpy.context.mode != prev_mode:
+                bpy.ops.object.mode_set(mode=prev_mode)
         except Exception as e:
             log_warning(f"postprocessing: could not restore mode: {e}")
-        try:
-            bpy.ops.object.select_all(action="DESELECT")
-        except Exception:
-            pass
-        for o in prev_selection:
+        # The export sandbox restores the selection once at the end
+        if not get_active_sandbox():
             try:
-                o.select_set(True)
+                bpy.ops.object.select_all(action="DESELECT")
             except Exception:
                 pass
-        if view_layer:
-            view_layer.objects.active = prev_active
+            for o in prev_selection:
+                try:
+                    o.select_set(True)
+                except Exception:
+                    pass
+            if view_layer:
+                view_layer.objects.active = prev_active
 
 
 def unwrap_uvs(obj: Object) -> None:
@@ -139,6 +143,8 @@ def robust_weight_transfer(info: CollectionExportInfo, obj: Object) -> None:
 
             try:
                 call_operator_in_3d_viewport(rwt_op, "INVOKE_DEFAULT")
+            except ViewportUnavailable:
+                raise
             except Exception as exc:
                 raise RuntimeError(f"robust weight transfer failed: {exc}")
     finally:
@@ -150,7 +156,12 @@ def robust_weight_transfer(info: CollectionExportInfo, obj: Object) -> None:
 def run_preprocessing(
     info: CollectionExportInfo, objects: list[Object]
 ) -> None:
-    """Run configured preprocessing operations on a list of objects."""
+    """Run configured preprocessing operations on a list of objects.
+
+    Failures are logged per object, except a missing viewport: exporting
+    without the requested preprocessing would silently produce wrong
+    files, so `ViewportUnavailable` fails the export instead.
+    """
     for obj in objects:
         if obj.type != "MESH":
             continue
@@ -171,5 +182,7 @@ def run_preprocessing(
                 )
                 robust_weight_transfer(info, obj)
 
+        except ViewportUnavailable:
+            raise
         except Exception as exc:
             log_error(f"preprocessing: failed for {obj.name}: {exc}")
@@ -7,3 +7,4 @@ class ProgressStage(str, Enum):
     PREPROCESS = "preprocess"
     EXPORT = "export"
     VARIANT = "variant"
+    CONVERT = "convert"
@@ -1,22 +1,32 @@
+import os
+from itertools import islice
 from pathlib import Path
-from typing import Generator, Optional
+from typing import Generator, Iterable, List, Optional, Tuple
+
 from bpy.types import Object, Collection, Mesh
 
 
 from .naming import build_export_name
 from .preprocessing import run_preprocessing
 from .shapekey_utils import (
-    apply_variant_shapekeys_to_collection,
+    apply_variant_mask_to_collection,
+    collect_collection_meshes,
     restore_shapekey_config,
     save_shapekey_config,
 )
-from .utils import cleanup_duplicate_collection, duplicate_collection
+from .conversion import ConversionQueue
+from .datablocks import DatablockAccounting, DatablockCounts
+from .duplication import VariantDuplicator, create_duplicator
+from .fingerprint import collection_fingerprint, variant_fingerprint
+from .manifest import ExportManifest
 from .progress import ProgressStage
+from .sandbox import get_active_sandbox
 from .export_progress import ProgressReporter
 
-from ..profile import NamePair
 from ..cancel import CancelToken, Cancelled
 from ..export_context import CollectionExportInfo
+from ..logging import log_debug
+from ..variants import iter_variant_changes, order_by_fewest_changes
 
 from ...properties.export_properties import ExportSettings
 from ...properties.model_settings import get_modkit_collection_props
@@ -31,6 +41,11 @@ class ExportRunner:
     cancel_token: CancelToken
     generator: Optional[Generator[ProgressStage, None, None]]
     progress_reporter: Optional[ProgressReporter]
+    variant_range: Optional[Tuple[int, int]]
+    publish_dir: Optional[Path]
+    conversion_queue: Optional[ConversionQueue]
+    datablocks: Optional[DatablockAccounting]
+    manifest: Optional[ExportManifest]
 
     def __init__(
         self,
@@ -39,15 +54,34 @@ class ExportRunner:
         cancel_token: CancelToken,
         progress_reporter: Optional[ProgressReporter],
         textools_dir: Optional[Path] = None,
+        variant_range: Optional[Tuple[int, int]] = None,
+        publish_dir: Optional[Path] = None,
+        conversion_queue: Optional[ConversionQueue] = None,
+        datablocks: Optional[DatablockAccounting] = None,
+        manifest: Optional[ExportManifest] = None,
     ) -> None:
         self.collection_info = collection_info
         self.textools_dir = textools_dir
         self.export_settings = export_settings
         self.cancel_token = cancel_token
         self.progress_reporter = progress_reporter
+        # Only export variants [start, stop) of the collection's sequence
+        self.variant_range = variant_range
+        # Move finished files here from the export dir, one at a time
+        self.publish_dir = publish_dir
+        # Background conversion of exported files, when pipelined
+        self.conversion_queue = conversion_queue
+        # Session-wide datablock counts, checked for leaked copies
+        self.datablocks = datablocks
+        # Fingerprints of earlier exports, to skip unchanged variants
+        self.manifest = manifest
 
     def export(self, fbx_path: Path, objects: list[Object]) -> None: ...
 
+    def output_paths(self, fbx_path: Path) -> List[Path]:
+        """Files written by `export()` for a variant."""
+        return [fbx_path]
+
     def start(
         self,
         info: CollectionExportInfo,
@@ -88,30 +122,90 @@ class ExportRunner:
     ) -> Generator[ProgressStage, None, None]:
         """Generator iterating through the export process for each variant of a collection, yielding stage events."""
 
-        mannequin = None
-        # ensure collection props are loaded
-        props = get_modkit_collection_props(info.collection)
-        if props:
-            mannequin = props.model.mannequin_object
+        # Hashed before any variant touches the source meshes
+        fingerprint = None
+        if self.manifest is not None:
+            textools = str(self.textools_dir) if self.textools_dir else None
+            fingerprint = collection_fingerprint(
+                info, self.export_settings, textools
+            )
+
+        # In fewest-changes order the variant diffs are applied to the
+        # source meshes, which the per-variant duplicates then inherit.
+        # Copies are made (or reset) from the sources for every variant,
+        # so a diff written to a copy would be lost with it. The sources'
+        # key states are saved below and restored once the collection is
+        # done; the export sandbox keeps these writes out of undo.
+        apply_to_source = self.export_settings.variant_order == "MIN_CHANGES"
+
+        if apply_to_source:
+            source_meshes = collect_collection_meshes(info.collection)
+        else:
+            source_meshes = []
+            props = get_modkit_collection_props(info.collection)
+            mannequin = props.model.mannequin_object if props else None
+            if mannequin and isinstance(mannequin.data, Mesh):
+                source_meshes.append(mannequin.data)
+
+        original_shape_keys = [
+            (mesh, save_shapekey_config(mesh)) for mesh in source_meshes
+        ]
+
+        variants: Iterable[int] = info.iter_variants()
+        if apply_to_source:
+            variants = order_by_fewest_changes(
+                info.shapekey_bits, info.detected_mask
+            )
+        if self.variant_range is not None:
+            variants = islice(variants, *self.variant_range)
 
-        original_shape_keys = None
-        if mannequin and isinstance(mannequin.data, Mesh):
-            original_shape_keys = save_shapekey_config(mannequin.data)
+        name = info.collection.name
+        before = self.datablocks.sample() if self.datablocks else None
+        duplicator = create_duplicator(self.export_settings, info)
 
         try:
-            for variant in info.variants:
-                for stage in self._process_single_variant(
-                    info, export_dir, variant
-                ):
-                    yield stage
+            # Counts once the previous variant was released; every
+            # duplicator returns to them unless it leaks
+            settled: Optional[DatablockCounts] = None
+            for variant, changed in iter_variant_changes(variants):
+                if apply_to_source:
+                    yield ProgressStage.APPLY_SHAPEKEYS
+                    apply_variant_mask_to_collection(
+                        info.collection, info.shapekey_bits, variant, changed
+                    )
+                    self._check_cancel()
+
+                digest = None
+                if fingerprint is not None:
+                    digest = variant_fingerprint(fingerprint, info, variant)
+                    if self._skip_unchanged(info, variant, digest):
+                        continue
+
+                yield from self._process_single_variant(
+                    info, export_dir, variant, duplicator, not apply_to_source
+                )
+
+                if self.manifest is not None and digest is not None:
+                    fbx_path = export_dir / build_export_name(
+                        self.export_settings, info, variant
+                    )
+                    self.manifest.record(
+                        fbx_path.name, digest, self.output_paths(fbx_path)
+                    )
+
+                if self.datablocks:
+                    if settled is not None:
+                        self.datablocks.check(
+                            f"{name} variant {variant}", settled
+                        )
+                    settled = self.datablocks.sample()
 
         finally:
-            if (
-                original_shape_keys
-                and mannequin
-                and isinstance(mannequin.data, Mesh)
-            ):
-                restore_shapekey_config(mannequin.data, original_shape_keys)
+            duplicator.close()
+            for mesh, config in original_shape_keys:
+                restore_shapekey_config(mesh, config)
+            if self.datablocks and before is not None:
+                self.datablocks.check(f"Export of {name}", before)
 
     def is_ready(self) -> tuple[bool, Optional[str]]:
         """Check if the runner is ready to start the export process,
@@ -127,7 +221,9 @@ class ExportRunner:
         self,
         info: CollectionExportInfo,
         export_dir: Path,
-        variant: list[NamePair],
+        variant: int,
+        duplicator: VariantDuplicator,
+        apply_shapekeys: bool = True,
     ) -> Generator[ProgressStage, None, None]:
         """Process a single variant of a collection, performing duplication,
         shape-key application, preprocessing and export steps,
@@ -138,67 +234,98 @@ class ExportRunner:
             self.progress_reporter.increment_variant_index()
 
         yield ProgressStage.DUPLICATE
-        dup = duplicate_collection(info.collection)
-
-        self._check_cancel()
+        dup = duplicator.prepare(variant)
+        if self.datablocks:
+            self.datablocks.sample()
+        sandbox = get_active_sandbox()
+        if sandbox:
+            sandbox.adopt(duplicator.fresh_objects)
 
         try:
+            self._check_cancel()
+
             yield from self._run_variant_steps(
                 dup,
                 info,
                 export_dir,
                 variant,
+                duplicator.fresh_objects,
+                apply_shapekeys and not duplicator.applies_shapekeys,
             )
         finally:
-            cleanup_duplicate_collection(dup)
+            duplicator.release()
 
     def _run_variant_steps(
         self,
         dup: Collection,
         info: CollectionExportInfo,
         export_dir: Path,
-        variant: list[NamePair],
+        variant: int,
+        fresh_objects: list[Object],
+        apply_shapekeys: bool = True,
     ) -> Generator[ProgressStage, None, None]:
         """Run the steps for processing a single variant,
         yielding progress stages between steps.
-        """
-        variant_shapekeys: set[str] = set()
-        shapekeys_names: list[str] = []
-        for shapekey, name in variant:
-            variant_shapekeys.add(shapekey)
-            shapekeys_names.append(name)
 
-        # Apply shapekeys
-        yield ProgressStage.APPLY_SHAPEKEYS
+        Only `fresh_objects` get shapekeys applied and preprocessing run;
+        the other objects in `dup` were prepared for an equivalent variant.
+        """
+        if apply_shapekeys:
+            yield ProgressStage.APPLY_SHAPEKEYS
 
-        profile_data = info.profile
-        if profile_data is None:
-            raise RuntimeError(
-                "Variant profile data is required for applying shape keys"
+            apply_variant_mask_to_collection(
+                dup, info.shapekey_bits, variant, objects=fresh_objects
             )
 
-        apply_variant_shapekeys_to_collection(
-            dup, profile_data, variant_shapekeys
-        )
-
-        self._check_cancel()
+            self._check_cancel()
 
         yield ProgressStage.PREPROCESS
 
-        run_preprocessing(info, list(dup.objects))
+        run_preprocessing(info, fresh_objects)
 
         self._check_cancel()
 
         # Export
-        name = build_export_name(self.export_settings, info, shapekeys_names)
+        name = build_export_name(self.export_settings, info, variant)
         fbx_path: Path = Path(export_dir) / name
 
         yield ProgressStage.EXPORT
 
         self.export(fbx_path, list(dup.objects))
+        self._publish(fbx_path)
 
         yield ProgressStage.VARIANT
 
+    def _skip_unchanged(
+        self, info: CollectionExportInfo, variant: int, digest: str
+    ) -> bool:
+        """Skip a variant whose files were built from the same inputs and
+        haven't changed since."""
+        assert self.manifest is not None
+        name = build_export_name(self.export_settings, info, variant)
+        outputs = [
+            self.manifest.directory / p.name
+            for p in self.output_paths(Path(name))
+        ]
+        if not self.manifest.is_current(name, digest, outputs):
+            return False
+
+        self.manifest.keep(name)
+        if self.progress_reporter:
+            self.progress_reporter.skip_variant()
+        log_debug(f"{name} is unchanged since the last export, skipped")
+        return True
+
+    def _publish(self, fbx_path: Path) -> None:
+        """Atomically move a finished variant's files to `publish_dir`."""
+        if self.publish_dir is None:
+            return
+
+        self.publish_dir.mkdir(parents=True, exist_ok=True)
+        for path in self.output_paths(fbx_path):
+            if path.exists():
+                os.replace(path, self.publish_dir / path.name)
+
     def _check_cancel(self) -> None:
         """Raise `Cancelled` if a cancel has been requested on the token."""
 
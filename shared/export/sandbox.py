@@ -0,0 +1,129 @@
+"""Scene state suspended for the duration of an export session."""
+
+from typing import Dict, List, Literal, Optional
+
+import bpy
+from bpy.types import Object
+
+from ..logging import log_warning
+
+_active: Optional["ExportSandbox"] = None
+
+
+def get_active_sandbox() -> Optional["ExportSandbox"]:
+    """The sandbox of the running export, if any."""
+    return _active
+
+
+ModeSetMode = Literal[
+    "OBJECT", "EDIT", "POSE", "SCULPT",
+    "VERTEX_PAINT", "WEIGHT_PAINT", "TEXTURE_PAINT", "PARTICLE_EDIT",
+]
+
+# `context.mode` names of the modes `mode_set` calls differently
+_MODE_SET_ARGS: Dict[str, ModeSetMode] = {
+    "POSE": "POSE",
+    "SCULPT": "SCULPT",
+    "PAINT_VERTEX": "VERTEX_PAINT",
+    "PAINT_WEIGHT": "WEIGHT_PAINT",
+    "PAINT_TEXTURE": "TEXTURE_PAINT",
+    "PARTICLE": "PARTICLE_EDIT",
+}
+
+
+def _mode_set_arg(mode: str) -> ModeSetMode:
+    # `context.mode` names edit modes per object type, `mode_set` doesn't
+    if mode.startswith("EDIT"):
+        return "EDIT"
+    return _MODE_SET_ARGS.get(mode, "OBJECT")
+
+
+class ExportSandbox:
+    """Suspends undo and keeps export copies cheap to draw while an
+    export runs, restoring the user's mode and selection afterwards.
+
+    While a sandbox is active, steps that change mode or selection only
+    return to object mode instead of restoring the selection every time.
+    """
+
+    def __init__(self) -> None:
+        self._undo: Optional[bool] = None
+        self._mode = "OBJECT"
+        self._selected: List[Object] = []
+        self._active_object: Optional[Object] = None
+
+    @property
+    def is_active(self) -> bool:
+        return _active is self
+
+    def enter(self) -> None:
+        global _active
+        if _active is not None:
+            return
+
+        context = bpy.context
+        edit = context.preferences.edit if context.preferences else None
+        if edit is not None:
+            self._undo = edit.use_global_undo
+            edit.use_global_undo = False
+
+        try:
+            self._mode = context.mode
+            self._selected = list(context.selected_objects)
+            view_layer = context.view_layer
+            self._active_object = (
+                view_layer.objects.active if view_layer else None
+            )
+            if self._mode != "OBJECT":
+                bpy.ops.object.mode_set(mode="OBJECT")
+        except BaseException:
+            # exit() only runs for an entered sandbox
+            self._restore_undo()
+            raise
+
+        _active = self
+
+    def _restore_undo(self) -> None:
+        context = bpy.context
+        edit = context.preferences.edit if context.preferences else None
+        if edit is not None and self._undo is not None:
+            edit.use_global_undo = self._undo
+        self._undo = None
+
+    def exit(self) -> None:
+        global _active
+        if _active is not self:
+            return
+        _active = None
+        self._restore_undo()
+
+        context = bpy.context
+        for obj in list(context.selected_objects):
+            obj.select_set(False)
+        for obj in self._selected:
+            try:
+                obj.select_set(True)
+            except (ReferenceError, RuntimeError):
+                # Deleted or no longer in the view layer
+                pass
+
+        view_layer = context.view_layer
+        if view_layer:
+            try:
+                view_layer.objects.active = self._active_object
+            except ReferenceError:
+                view_layer.objects.active = None
+
+        if self._mode != "OBJECT" and self._active_object is not None:
+            try:
+                bpy.ops.object.mode_set(mode=_mode_set_arg(self._mode))
+            except RuntimeError as e:
+                log_warning(f"Could not restore {self._mode} mode: {e}")
+
+        self._selected = []
+        self._active_object = None
+
+    def adopt(self, objects: List[Object]) -> None:
+        """Draw new export copies as bounds; they only live for the export."""
+        for obj in objects:
+            obj.display_type = "BOUNDS"
@@ -0,0 +1,54 @@
+"""Time budget for running export stages inside a modal timer tick."""
+
+import time
+from typing import Callable, Optional
+
+
+class FrameBudget:
+    """Adaptive amount of export work to run per timer tick.
+
+    The time the rest of Blender needed between two ticks tells how busy
+    the UI is: when it exceeds the budget the budget shrinks so redraws
+    and input stay responsive, and when the UI is idle it grows back up
+    to `max_ms`.
+    """
+
+    SHRINK = 0.75
+    GROW = 1.1
+
+    def __init__(
+        self,
+        budget_ms: float = 50.0,
+        min_ms: Optional[float] = None,
+        max_ms: Optional[float] = None,
+        interval_s: float = 0.0,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.min_ms = min_ms if min_ms is not None else budget_ms / 4
+        self.max_ms = max_ms if max_ms is not None else budget_ms * 4
+        self.budget_ms = min(max(budget_ms, self.min_ms), self.max_ms)
+        self.interval_s = interval_s
+        self._clock = clock
+        self._tick_start: Optional[float] = None
+        self._tick_end: Optional[float] = None
+
+    def begin_tick(self) -> None:
+        """Start a tick, adapting the budget to the time spent outside it."""
+        now = self._clock()
+        if self._tick_end is not None:
+            ui_ms = max(0.0, now - self._tick_end - self.interval_s) * 1000
+            if ui_ms > self.budget_ms:
+                self.budget_ms = max(self.min_ms, self.budget_ms * self.SHRINK)
+            elif ui_ms < self.budget_ms / 4:
+                self.budget_ms = min(self.max_ms, self.budget_ms * self.GROW)
+        self._tick_start = now
+
+    def has_time(self) -> bool:
+        """Whether the current tick can run another stage."""
+        if self._tick_start is None:
+            return False
+        return (self._clock() - self._tick_start) * 1000 < self.budget_ms
+
+    def end_tick(self) -> None:
+        self._tick_end = self._clock()
+        self._tick_start = None
@@ -1,10 +1,15 @@
 from collections.abc import Generator
-from typing import Iterable, Optional, Any, Union
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Any, Tuple, Union
 from pathlib import Path
 
 from bpy.types import Collection
 
 
+from .conversion import ConversionFailure, ConversionQueue
+from .datablocks import DatablockAccounting
+from .manifest import ExportManifest
+from .sandbox import ExportSandbox
 from .fbx_exporter import FBXExportRunner
 from .mdl_converter import MDLExportRunner
 from .runner import ExportRunner
@@ -13,9 +18,56 @@ from .export_progress import ProgressReporter
 
 from ..cancel import CancelToken, Cancelled
 from ..export_context import CollectionExportInfo
+from ..logging import log_error, log_warning
 
 from ...properties.export_properties import ExportSettings
 
+# Variant count above which an export is reported as a long-running job
+LARGE_EXPORT_VARIANT_COUNT = 500
+
+VariantRange = Tuple[int, int]
+
+
+@dataclass(frozen=True)
+class Shard:
+    """One worker's part of an export split across `count` processes."""
+
+    index: int
+    count: int
+
+    def variant_range(self, total: int) -> VariantRange:
+        """Return this worker's [start, stop) slice of `total` variants.
+
+        Slices are contiguous so consecutive variants stay on one worker,
+        where fewest-changes ordering and part reuse still pay off.
+        """
+        return (
+            total * self.index // self.count,
+            total * (self.index + 1) // self.count,
+        )
+
+
+def split_variant_range(
+    counts: List[int], shard: Optional[Shard]
+) -> List[Optional[VariantRange]]:
+    """Map a shard's slice of all variants onto per-collection ranges.
+
+    Collections are laid out one after the other in the given order; None
+    means the whole collection.
+    """
+    if shard is None:
+        return [None] * len(counts)
+
+    start, stop = shard.variant_range(sum(counts))
+    ranges: List[Optional[VariantRange]] = []
+    offset = 0
+    for count in counts:
+        local_start = min(max(start - offset, 0), count)
+        local_stop = min(max(stop - offset, 0), count)
+        ranges.append((local_start, local_stop))
+        offset += count
+    return ranges
+
 
 class ExportSession:
     """Manages the state and execution of an export process across multiple collections."""
@@ -26,6 +78,12 @@ class ExportSession:
     _current_gen: Optional[Generator[ProgressStage, None, None]]
     cancel_token: CancelToken
     textools_dir: Optional[Path]
+    total_variants: int
+    shard: Optional[Shard]
+    stage_root: Optional[Path]
+    conversion_queue: Optional[ConversionQueue]
+    datablocks: Optional[DatablockAccounting]
+    manifests: List[ExportManifest]
 
     def __init__(
         self,
@@ -43,52 +101,191 @@ class ExportSession:
 
         self.textools_dir: Optional[Path] = None
 
-    def _create_runner(self, collection: Collection) -> ExportRunner:
+        self.total_variants = 0
+
+        # Set for sharded workers: export only the shard's variants, into
+        # `stage_root/<collection>`, moving each file to the export root
+        self.shard = None
+        self.stage_root = None
+
+        self.conversion_queue = None
+        self.datablocks = None
+        # Saved once background conversions finished writing
+        self.manifests = []
+
+    def _create_runner(
+        self,
+        info: CollectionExportInfo,
+        variant_range: Optional[VariantRange] = None,
+    ) -> ExportRunner:
         runner_cls = create_runner(self.cfg)
+        publish_dir = None
+        if self.stage_root is not None:
+            publish_dir = self.export_root / info.collection.name
+
+        manifest = None
+        if self.cfg.incremental_export:
+            # One manifest per writer: sharded workers share the folder
+            suffix = ""
+            if variant_range is not None:
+                suffix = f"-{variant_range[0]}-{variant_range[1]}"
+            manifest = ExportManifest(
+                self.export_root / info.collection.name, suffix
+            ).load()
+            self.manifests.append(manifest)
+
         return runner_cls(
-            collection_info=CollectionExportInfo(collection),
+            collection_info=info,
             export_settings=self.cfg,
             cancel_token=self.cancel_token,
             progress_reporter=self.progress_reporter,
             textools_dir=self.textools_dir,
+            variant_range=variant_range,
+            publish_dir=publish_dir,
+            conversion_queue=self.conversion_queue,
+            datablocks=self.datablocks,
+            manifest=manifest,
         )
 
     def start(self, collections: Iterable[Collection]) -> None:
-        self._current_gen = self._iterate_collections(collections)
+        """Analyse the collections and size the progress before the first step.
 
-    def _iterate_collections(
-        self, collections: Iterable[Collection]
-    ) -> Generator[ProgressStage, None, None]:
+        Variant totals are counted without enumerating the variants, so
+        this is cheap even for very large jobs.
+        """
         if not self.progress_reporter:
             raise RuntimeError("ExportSession requires a ProgressReporter")
 
         infos = [CollectionExportInfo(c) for c in collections]
-        total = 0
-        for info in infos:
-            total += info.variant_count
+        ranges = split_variant_range(
+            [info.variant_count for info in infos], self.shard
+        )
+        jobs = [
+            (info, variant_range)
+            for info, variant_range in zip(infos, ranges)
+            if _range_size(info, variant_range) > 0
+        ]
+        self.total_variants = sum(_range_size(*job) for job in jobs)
+
+        self.progress_reporter.set_total_variant_count(self.total_variants)
+        self.progress_reporter.set_total_collection_count(len(jobs))
+
+        if self.is_large_job():
+            log_warning(
+                f"Export of {self.total_variants} variants across "
+                f"{len(infos)} collections will take a long time"
+            )
 
-        self.progress_reporter.set_total_variant_count(total)
-        self.progress_reporter.set_total_collection_count(len(infos))
+        # Staged files are published right after export, before a
+        # background conversion could read them
+        if (
+            self.cfg.export_mode == "FBX_TO_MDL"
+            and self.cfg.pipeline_conversion
+            and self.stage_root is None
+        ):
+            self.conversion_queue = ConversionQueue(
+                workers=self.cfg.conversion_workers
+            )
 
-        for info in infos:
+        self.datablocks = DatablockAccounting()
+        self._current_gen = self._iterate_collections(jobs)
+
+    def is_large_job(self) -> bool:
+        """Whether the started export exceeds `LARGE_EXPORT_VARIANT_COUNT`."""
+        return self.total_variants >= LARGE_EXPORT_VARIANT_COUNT
+
+    def _iterate_collections(
+        self,
+        jobs: list[Tuple[CollectionExportInfo, Optional[VariantRange]]],
+    ) -> Generator[ProgressStage, None, None]:
+        assert self.progress_reporter
+
+        # Entered here rather than in start() so that closing the
+        # generator, on cancel or failure, always exits it again
+        sandbox = ExportSandbox() if self.cfg.sandbox_export else None
+        if sandbox:
+            sandbox.enter()
+
+        drained = False
+        try:
             try:
-                self.progress_reporter.start_new_collection(
-                    info.collection.name, info.variant_count
-                )
+                for info, variant_range in jobs:
+                    try:
+                        self.progress_reporter.start_new_collection(
+                            info.collection.name,
+                            _range_size(info, variant_range),
+                        )
+
+                        yield from self._process_single_collection(
+                            info, variant_range
+                        )
+                    except Cancelled:
+                        if self.conversion_queue is None:
+                            self._save_manifests()
+                        return
+                    except StopIteration:
+                        pass
+            finally:
+                if sandbox:
+                    sandbox.exit()
+
+            yield from self._drain_conversions()
+            drained = True
+        finally:
+            # Cancelled, failed or closed early: don't leave converter
+            # threads and their workspaces behind
+            if not drained:
+                self._stop_conversions()
+
+        self._save_manifests()
+
+        if self.datablocks:
+            self.datablocks.log_summary()
+
+    def _drain_conversions(self) -> Generator[ProgressStage, None, None]:
+        """Wait for background conversions, then log their failures."""
+        conversions = self.conversion_queue
+        if conversions is None:
+            return
+
+        while not conversions.wait(timeout=0.01):
+            yield ProgressStage.CONVERT
+        conversions.close()
+
+        for failure in conversions.failures:
+            log_error(
+                f"MDL conversion failed for {failure.job.fbx_path.name}: "
+                f"{failure.error}"
+            )
 
-                yield from self._process_single_collection(info)
-            except Cancelled:
-                return
-            except StopIteration:
-                pass
+    def _stop_conversions(self) -> None:
+        """Drop queued conversions and let the converter threads exit."""
+        if self.conversion_queue:
+            self.conversion_queue.cancel()
+            self.conversion_queue.close(wait=False)
+
+    def _save_manifests(self) -> None:
+        """Record the exported variants for the next incremental export."""
+        for manifest in self.manifests:
+            manifest.save()
+        self.manifests = []
+
+    @property
+    def conversion_failures(self) -> list[ConversionFailure]:
+        """Conversions that failed in the background so far."""
+        if self.conversion_queue is None:
+            return []
+        return list(self.conversion_queue.failures)
 
     def _process_single_collection(
         self,
         info: CollectionExportInfo,
+        variant_range: Optional[VariantRange] = None,
     ) -> Generator[ProgressStage, None, None]:
-        runner = self._create_runner(info.collection)
+        runner = self._create_runner(info, variant_range)
 
-        collection_export_dir = self.export_root / info.collection.name
+        output_root = self.stage_root or self.export_root
+        collection_export_dir = output_root / info.collection.name
 
         collection_export_dir.mkdir(parents=True, exist_ok=True)
 
@@ -120,6 +317,7 @@ class ExportSession:
 
     def cancel(self) -> None:
         self.cancel_token.request()
+        self._stop_conversions()
         if self._current_gen:
             self._current_gen.close()
         self._current_gen = None
@@ -129,6 +327,14 @@ class ExportSession:
         return self.cancel_token.requested
 
 
+def _range_size(
+    info: CollectionExportInfo, variant_range: Optional[VariantRange]
+) -> int:
+    if variant_range is None:
+        return info.variant_count
+    return variant_range[1] - variant_range[0]
+
+
 def create_runner(cfg_or_mode: Union[str, Any]) -> type[ExportRunner]:
     """Factory function to create an ExportRunner based on the export mode specified in cfg_or_mode."""
     mode = None
@@ -0,0 +1,85 @@
+"""Shapekeys whose offsets against their reference keys move no vertex,
+so their state can't change an export copy."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet
+
+import numpy as np
+from bpy.types import Mesh, Object
+
+if TYPE_CHECKING:
+    from bpy.types import Depsgraph
+
+# Offsets at or below this, in every axis, count as not moving the vertex
+DELTA_TOLERANCE = 1e-6
+
+
+def _read_coords(data: Any, count: int) -> np.ndarray:
+    coords = np.empty(count * 3, dtype=np.float32)
+    data.foreach_get("co", coords)
+    return coords.reshape(-1, 3)
+
+
+def find_static_keys(
+    mesh: Mesh, tolerance: float = DELTA_TOLERANCE
+) -> FrozenSet[str]:
+    """Relative keys of `mesh` that move no vertex off their reference key.
+
+    Each key's coordinates are read once. Keys limited by a vertex group
+    never count as static, as their offsets depend on the group weights.
+    """
+    sk = mesh.shape_keys
+    if not sk or not sk.use_relative or not sk.key_blocks:
+        return frozenset()
+
+    count = len(mesh.vertices)
+    blocks = list(sk.key_blocks)
+    coords = {kb.name: _read_coords(kb.data, count) for kb in blocks}
+
+    static = set()
+    for kb in blocks[1:]:
+        if kb.vertex_group:
+            continue
+        offsets = coords[kb.name] - coords[kb.relative_key.name]
+        if not (np.abs(offsets) > tolerance).any():
+            static.add(kb.name)
+    return frozenset(static)
+
+
+# Mesh `session_uid` -> its static keys, until the mesh changes
+_static_keys: Dict[int, FrozenSet[str]] = {}
+
+
+def static_shapekeys(mesh: Mesh) -> FrozenSet[str]:
+    """Keys of `mesh` whose state can't change its geometry.
+
+    Kept until a depsgraph update reports the mesh changed, so the key
+    coordinates aren't read again for every export of the collection.
+    """
+    key = mesh.session_uid
+    keys = _static_keys.get(key)
+    if keys is None:
+        keys = find_static_keys(mesh)
+        _static_keys[key] = keys
+    return keys
+
+
+def tag_depsgraph_updates(depsgraph: Depsgraph) -> None:
+    """Forget the static keys of meshes whose geometry or keys changed."""
+    for update in depsgraph.updates:
+        datablock = getattr(update.id, "original", update.id)
+        if isinstance(datablock, Object):
+            if not update.is_updated_geometry:
+                continue
+            datablock = datablock.data
+        elif not isinstance(datablock, Mesh):
+            # A shapekey datablock reports its mesh as its user
+            datablock = getattr(datablock, "user", None)
+        if isinstance(datablock, Mesh):
+            _static_keys.pop(datablock.session_uid, None)
+
+
+def clear_static_shapekeys() -> None:
+    """Forget every mesh's static keys, e.g. after undo or loading a file."""
+    _static_keys.clear()
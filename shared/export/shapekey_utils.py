@@ -3,10 +3,11 @@
 """
 
 from dataclasses import dataclass
+from typing import Iterable, Optional
 from bpy.types import Collection, Mesh, Object
 
 
-from ..profile import Profile
+from ..variants import ShapekeyBits
 
 from ...properties.model_settings import get_modkit_collection_props
 
@@ -17,54 +18,78 @@ class ShapeKeyState:
     mute: bool
 
 
-def apply_variant_shapekeys(
+def apply_variant_mask(
     mesh: Mesh,
-    profile: Profile,
-    shapekeys: set[str]
+    bits: ShapekeyBits,
+    variant: int,
+    changed: int = -1
 ) -> None:
-    """Apply shape keys for a given variant on a mesh object."""
+    """Apply shape keys for a variant mask on a mesh object.
 
-    profile_shapekeys = profile.get_shapekey_names()
+    Only keys whose bits are set in `changed` are written; the default
+    writes every profile key.
+    """
 
     sk = mesh.shape_keys
 
     if not sk:
         return
 
-    for key_name in profile_shapekeys:
-        if key_name in sk.key_blocks:
-            if key_name in shapekeys:
-                sk.key_blocks[key_name].value = 1.0
-                sk.key_blocks[key_name].mute = False
+    key_blocks = sk.key_blocks
+    for key_name, mask in bits.name_masks.items():
+        if not mask & changed:
+            continue
+        if key_name in key_blocks:
+            kb = key_blocks[key_name]
+            if variant & mask:
+                kb.value = 1.0
+                kb.mute = False
             else:
-                sk.key_blocks[key_name].value = 0.0
-                sk.key_blocks[key_name].mute = True
+                kb.value = 0.0
+                kb.mute = True
 
 
-def apply_variant_shapekeys_to_collection(
+def collect_collection_meshes(
     collection: Collection,
-    profile: Profile,
-    shapekeys: set[str]
-) -> None:
-    """Apply variant shape-key states to objects in a collection.
-    """
+    objects: Optional[Iterable[Object]] = None
+) -> list[Mesh]:
+    """Return the mannequin mesh followed by the meshes of `objects`, which
+    defaults to the collection's objects."""
 
     col_props = get_modkit_collection_props(collection)
     model = col_props.model if col_props else None
     if not model:
-        return
+        return []
 
+    meshes: list[Mesh] = []
     mannequin = model.mannequin_object
 
     if mannequin and isinstance(mannequin.data, Mesh):
-        apply_variant_shapekeys(mannequin.data, profile, shapekeys)
+        meshes.append(mannequin.data)
+
+    if objects is None:
+        objects = collection.objects
 
-    for obj in collection.objects:
+    for obj in objects:
         data = getattr(obj, 'data', None)
-        if not isinstance(data, Mesh):
-            continue
+        if isinstance(data, Mesh):
+            meshes.append(data)
+
+    return meshes
+
 
-        apply_variant_shapekeys(data, profile, shapekeys)
+def apply_variant_mask_to_collection(
+    collection: Collection,
+    bits: ShapekeyBits,
+    variant: int,
+    changed: int = -1,
+    objects: Optional[Iterable[Object]] = None
+) -> None:
+    """Apply a variant mask to the mannequin and the objects in a collection,
+    or only to `objects` when given.
+    """
+    for mesh in collect_collection_meshes(collection, objects):
+        apply_variant_mask(mesh, bits, variant, changed)
 
 
 def save_shapekey_config(mesh: Mesh) -> dict[str, ShapeKeyState]:
@@ -1,14 +1,17 @@
 
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
 
 import bpy
-from bpy.types import Object, Collection
+from bpy.types import Collection, Mesh, Object
 
 from ...properties.object_settings import get_modkit_object_props
 
 from ..logging import log_warning
 from ...properties.model_settings import get_modkit_collection_props
 
+if TYPE_CHECKING:
+    from bpy.types import Depsgraph
+
 
 def collect_enabled_collections() -> set[Collection]:
     """Collect collections that are enabled for export based on their properties.
@@ -36,13 +39,41 @@ def get_export_armature(collection: Collection) -> Optional[Object]:
     return None
 
 
+def iter_modifier_object_references(obj: Object) -> Iterator[Object]:
+    """Yield the objects referenced by object-pointer properties on the
+    modifiers of `obj`."""
+    for mod in obj.modifiers:
+        try:
+            for prop in mod.bl_rna.properties:
+                if prop.type != 'POINTER':
+                    continue
+                fixed_type = getattr(prop, 'fixed_type', None)
+                if getattr(fixed_type, 'name', None) != 'Object':
+                    continue
+                target = getattr(mod, prop.identifier, None)
+                if target:
+                    yield target
+        except Exception as e:
+            name = getattr(mod, 'name', '<unknown>')
+            log_warning(
+                f"iter_modifier_object_references: skipping modifier "
+                f"{name} due to RNA access error: {e}")
+
+
 def adjust_modifier_object_references(
-    copied_objects: dict[Object, Object]
+    copied_objects: dict[Object, Object],
+    copies: Optional[Iterable[Object]] = None
 ) -> None:
     """Remap object-pointer properties on modifiers to their duplicated targets.
+
+    `copies` limits which objects are adjusted and defaults to the values
+    of `copied_objects`.
     """
 
-    for copy in copied_objects.values():
+    if copies is None:
+        copies = copied_objects.values()
+
+    for copy in copies:
         for mod in copy.modifiers:
             try:
                 for prop in mod.bl_rna.properties:
@@ -77,8 +108,9 @@ def adjust_modifier_object_references(
                 continue
 
 
-def duplicate_collection(source_collection: Collection) -> Collection:
-    """Duplicate a collection and its mesh objects for export, linking an armature if set.
+def create_export_collection(source_collection: Collection) -> Collection:
+    """Create the empty export collection for `source_collection`, copying its
+    Modkit properties and linking the export armature if set.
     """
     scene = bpy.context.scene
 
@@ -98,11 +130,20 @@ def duplicate_collection(source_collection: Collection) -> Collection:
     if arm:
         dup.objects.link(arm)
 
+    return dup
+
+
+def duplicate_collection(source_collection: Collection) -> Collection:
+    """Duplicate a collection and its mesh objects for export, linking an armature if set.
+    """
+    dup = create_export_collection(source_collection)
+    arm = get_export_armature(source_collection)
+
     copied_objects: dict[Object, Object] = {}
     for obj in source_collection.objects:
         if obj.type != "MESH":
             continue
-        obj_copy = _duplicate_mesh_for_export(obj, arm)
+        obj_copy = duplicate_mesh_for_export(obj, arm)
         copied_objects[obj] = obj_copy
         dup.objects.link(obj_copy)
 
@@ -130,18 +171,18 @@ def _set_armature_for_object(obj: Object, arm: Object) -> None:
                 return
 
 
-def _duplicate_mesh_for_export(obj: Object, arm: Optional[Object]) -> Object:
+def duplicate_mesh_for_export(obj: Object, arm: Optional[Object]) -> Object:
     """Duplicate a mesh object for export, copying Modkit properties and linking to `arm` if provided.
     """
     orig_modkit = get_modkit_object_props(obj)
     if not orig_modkit:
         raise RuntimeError(
-            "_duplicate_mesh_for_export: source object missing 'modkit' property group")
+            "duplicate_mesh_for_export: source object missing 'modkit' property group")
     obj_copy = obj.copy()
     copy_modkit = get_modkit_object_props(obj_copy)
     if not copy_modkit:
         raise RuntimeError(
-            "_duplicate_mesh_for_export: duplicated object missing 'modkit' property group")
+            "duplicate_mesh_for_export: duplicated object missing 'modkit' property group")
     copy_modkit.props.copy_from(orig_modkit.props)
     obj_copy.data = obj.data.copy() if obj.data else None
     obj_copy.name = f"export_{obj.name}"
@@ -152,13 +193,55 @@ def _duplicate_mesh_for_export(obj: Object, arm: Optional[Object]) -> Object:
     return obj_copy
 
 
+def remove_export_copy(obj: Object) -> None:
+    """Remove a duplicated export object and its mesh, which would
+    otherwise stay behind as an orphan."""
+    mesh = obj.data
+    bpy.data.objects.remove(obj, do_unlink=True)
+    if isinstance(mesh, Mesh) and mesh.users == 0:
+        bpy.data.meshes.remove(mesh)
+
+
+def evaluated_mesh_for_export(
+    obj: Object, depsgraph: "Depsgraph", arm: Optional[Object]
+) -> Object:
+    """Create an export object from `obj`'s evaluated mesh, with its
+    shapekeys mixed and modifiers applied, linking to `arm` if provided.
+
+    Free it with `remove_export_copy`.
+    """
+    orig_modkit = get_modkit_object_props(obj)
+    if not orig_modkit:
+        raise RuntimeError(
+            "evaluated_mesh_for_export: source object missing 'modkit' "
+            "property group")
+    mesh = bpy.data.meshes.new_from_object(
+        obj.evaluated_get(depsgraph),
+        preserve_all_data_layers=True,
+        depsgraph=depsgraph,
+    )
+    obj_copy = bpy.data.objects.new(f"export_{obj.name}", mesh)
+    copy_modkit = get_modkit_object_props(obj_copy)
+    if not copy_modkit:
+        raise RuntimeError(
+            "evaluated_mesh_for_export: new object missing 'modkit' "
+            "property group")
+    copy_modkit.props.copy_from(orig_modkit.props)
+
+    if arm:
+        _set_armature_for_object(obj_copy, arm)
+    obj_copy.matrix_world = obj.matrix_world.copy()
+
+    return obj_copy
+
+
 def cleanup_duplicate_collection(dup_col: Collection) -> None:
     """Remove the duplicated collection and its objects after export.
     """
 
     for obj in list(dup_col.objects):
         if obj.type != 'ARMATURE':
-            bpy.data.objects.remove(obj, do_unlink=True)
+            remove_export_copy(obj)
 
     scene = bpy.context.scene
     if scene:
@@ -170,13 +253,19 @@ def select_objects_for_export(objects: list[Object]) -> None:
     """Select the given objects in the viewport, making the first one active.
     """
 
-    bpy.ops.object.select_all(action='DESELECT')
+    # Only touch objects whose selection changes, without the select_all
+    # operator, which visits every object in the scene
+    wanted = set(objects)
+    for o in bpy.context.selected_objects:
+        if o not in wanted:
+            o.select_set(False)
 
     if not objects:
         return
 
     for o in objects:
-        o.select_set(True)
+        if not o.select_get():
+            o.select_set(True)
 
     view_layer = bpy.context.view_layer
     if view_layer:
@@ -1,39 +1,22 @@
 """Utilities for preparing exports and variants."""
 
 from __future__ import annotations
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterator, List, Tuple, Optional
 
 from bpy.types import Collection
 
 
-from .model_scanner import ModelScanner
-from .variants import filter_profile_shapekeys, generate_variant_combinations
+from .analysis_cache import get_collection_analysis
+from .collection_analysis import CollectionAnalysis
+from .variants import ShapekeyBits
+from .variant_plan import VariantPlan, get_variant_plan
 from .profile import (
-    NamePair,
     Profile,
     get_profile_data,
     is_profile_loaded,
 )
-from .export.shapekey_utils import collect_collection_shapekeys
 
 from ..properties.model_settings import get_modkit_collection_props
-from ..properties.object_settings import get_modkit_object_props
-
-
-def _collect_attributes(
-    collection: Collection,
-) -> Dict[Tuple[int, int], List[str]]:
-    """Collect attributes for all parts in a collection."""
-    attribute_map = dict()
-    for mesh_id, parts in ModelScanner.scan_collection(collection).items():
-        for obj, _, part_id in parts:
-            props = get_modkit_object_props(obj)
-            if not props:
-                continue
-            attrs_list = [a.value for a in props.attributes]
-            if attrs_list:
-                attribute_map[(mesh_id, part_id)] = attrs_list
-    return attribute_map
 
 
 class CollectionExportInfo:
@@ -51,25 +34,20 @@ class CollectionExportInfo:
                 f"Profile '{profile_name}' not found for collection {collection.name}"
             )
 
-        reduced_profile = filter_profile_shapekeys(
-            collect_collection_shapekeys(collection), profile
-        )
+        analysis = get_collection_analysis(collection)
+        plan = get_variant_plan(profile, analysis.shapekeys)
 
         materials_info = {
             mesh.id: mesh.material_name for mesh in (props.model.meshes)
         }
 
-        part_attrs = _collect_attributes(collection)
-
         self._collection = collection
+        self._analysis: CollectionAnalysis = analysis
         self._profile_name: str = profile_name
         self._profile: Profile = profile
         self._game_path: str = props.model.game_path
-        self._variants: List[List[NamePair]] = generate_variant_combinations(
-            reduced_profile, profile.incompatibilities
-        )
+        self._plan: VariantPlan = plan
         self._materials_info: Dict[int, str] = materials_info
-        self._part_attrs: Dict[Tuple[int, int], List[str]] = part_attrs
 
     @property
     def collection(self) -> Collection:
@@ -88,8 +66,28 @@ class CollectionExportInfo:
         return self._game_path
 
     @property
-    def variants(self) -> List[List[NamePair]]:
-        return self._variants
+    def analysis(self) -> CollectionAnalysis:
+        return self._analysis
+
+    @property
+    def plan(self) -> VariantPlan:
+        return self._plan
+
+    @property
+    def shapekey_bits(self) -> ShapekeyBits:
+        return self._plan.shapekey_bits
+
+    @property
+    def detected_mask(self) -> int:
+        return self._plan.detected_mask
+
+    @property
+    def variants(self) -> List[int]:
+        return list(self.iter_variants())
+
+    def iter_variants(self) -> Iterator[int]:
+        """Yield the collection's variant masks one at a time."""
+        return self._plan.iter_variants()
 
     @property
     def materials_info(self) -> Dict[int, str]:
@@ -97,11 +95,11 @@ class CollectionExportInfo:
 
     @property
     def part_attrs(self) -> Dict[Tuple[int, int], List[str]]:
-        return self._part_attrs
+        return self._analysis.part_attrs
 
     @property
     def variant_count(self) -> int:
-        return len(self.variants)
+        return self._plan.variant_count
 
 
 def is_export_ready(
@@ -17,18 +17,23 @@ class PartNameInfo:
     part_index: int
 
 
+def parse_part_name(name: str) -> Optional[PartNameInfo]:
+    """Parse a `<base> <mesh>.<part>` object name."""
+    match = NAME_RE.match(name)
+
+    if not match:
+        return None
+
+    base, mesh, part = match.groups()
+    return PartNameInfo(base, int(mesh), int(part))
+
+
 class ModelScanner:
     """Scan collections and parse part names."""
 
     @staticmethod
     def _parse_part_name(name: str) -> Optional[PartNameInfo]:
-        match = NAME_RE.match(name)
-
-        if not match:
-            return None
-
-        base, mesh, part = match.groups()
-        return PartNameInfo(base, int(mesh), int(part))
+        return parse_part_name(name)
 
     @staticmethod
     def scan_collection(
@@ -3,10 +3,26 @@
 from __future__ import annotations
 from enum import Enum, auto
 
+from collections import OrderedDict
+import hashlib
+import os
 from pathlib import Path
+import pickle
 import tomllib
-from typing import Dict, Any, Optional, List, Tuple, TypeAlias
-from dataclasses import dataclass, field
+from typing import (
+    Callable,
+    Dict,
+    Any,
+    FrozenSet,
+    Iterable,
+    Optional,
+    List,
+    Set,
+    Tuple,
+    TypeAlias,
+)
+from dataclasses import dataclass, field, replace
+from functools import cached_property
 
 NamePair: TypeAlias = Tuple[str, str]
 
@@ -69,6 +85,42 @@ class Group:
 IncompatibilityMap: TypeAlias = Dict[str, List[str]]
 
 
+@dataclass(frozen=True)
+class ProfileIndex:
+    """Lookup tables of a profile, built once instead of per call."""
+
+    shapekey_names: FrozenSet[str]
+    # Group name -> its shapekey names
+    group_shapekeys: Dict[str, FrozenSet[str]]
+    # Export name -> alias override
+    alias_of: Dict[str, str]
+    # Material name <-> game path
+    material_paths: Dict[str, str]
+    material_names: Dict[str, str]
+
+    @classmethod
+    def from_profile(cls, profile: Profile) -> ProfileIndex:
+        group_shapekeys = {
+            g.group_name: frozenset(g.get_all_shapekey_names())
+            for g in profile.groups
+        }
+
+        material_paths = {m.name: m.path for m in profile.standard_materials}
+        material_names: Dict[str, str] = {}
+        for name, path in material_paths.items():
+            material_names.setdefault(path, name)
+
+        return cls(
+            shapekey_names=frozenset(
+                name for g in profile.groups for name, _ in g.shapekeys
+            ),
+            group_shapekeys=group_shapekeys,
+            alias_of=dict(profile.export_aliases),
+            material_paths=material_paths,
+            material_names=material_names,
+        )
+
+
 @dataclass
 class Profile:
     profile_name: str
@@ -114,41 +166,158 @@ class Profile:
             case _:
                 raise ValueError("Invalid profile structure")
 
-    def get_shapekey_names(self) -> set[str]:
-        """Return a set of all shapekey names in this profile."""
-        names: set[str] = set()
-        for group in self.groups:
-            names.update(group.get_all_shapekey_names())
-        return names
+    @cached_property
+    def index(self) -> ProfileIndex:
+        """Lookup tables of this profile.
+
+        Built on first access; loaded profiles are treated as read-only,
+        so the tables are never rebuilt.
+        """
+        return ProfileIndex.from_profile(self)
+
+    def get_shapekey_names(self) -> FrozenSet[str]:
+        """Return all shapekey names in this profile."""
+        return self.index.shapekey_names
 
 
 def _load_profile(path: Path) -> Profile:
     """Load a profile from a TOML file."""
     if not path.exists():
         raise FileNotFoundError(f"Profile file not found: {path}")
-    with open(path, "rb") as f:
-        try:
-            data = tomllib.load(f)
-        except tomllib.TOMLDecodeError as e:
-            raise ValueError(f"Invalid TOML in {path}: {e}")
+    return _parse_profile(path, path.read_bytes())
+
+
+def _parse_profile(path: Path, content: bytes) -> Profile:
+    """Parse the raw content of a profile file."""
+    try:
+        data = tomllib.loads(content.decode("utf-8"))
+    except (tomllib.TOMLDecodeError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid TOML in {path}: {e}")
 
     return Profile.from_dict(data)
 
 
-def _load_profiles_from_directory(directory: Path) -> Dict[str, Profile]:
-    """Load all profiles from a directory."""
+def _hash_profile(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+# Bump whenever the pickled layout of Profile or Group changes
+_PROFILE_CACHE_FORMAT = 2
+
+# File name -> (mtime_ns, size, content hash, parsed profile or None if invalid)
+_ProfileCacheEntries: TypeAlias = Dict[
+    str, Tuple[int, int, str, Optional[Profile]]
+]
+
+
+def _get_profile_cache_path(directory: Path) -> Path:
+    """Return where the compiled profile cache of `directory` is stored."""
+    return directory / "__pycache__" / "profiles.cache"
+
+
+def _read_profile_cache(path: Path) -> _ProfileCacheEntries:
+    """Read compiled profiles, returning no entries on any cache problem."""
+    try:
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+    except Exception:
+        return {}
+
+    match data:
+        case {"format": _PROFILE_CACHE_FORMAT, "entries": dict(entries)}:
+            return entries
+        case _:
+            return {}
+
+
+def _write_profile_cache(path: Path, entries: _ProfileCacheEntries) -> None:
+    """Write compiled profiles, ignoring unwritable locations."""
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        path.parent.mkdir(exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            pickle.dump(
+                {"format": _PROFILE_CACHE_FORMAT, "entries": entries},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp_path, path)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+
+
+@dataclass(frozen=True)
+class _ProfileFileState:
+    """Fingerprint of a profile file and the profile name it provides."""
+
+    mtime_ns: int
+    size: int
+    # None when only the profile name was read from the file
+    digest: Optional[str]
+    name: Optional[str]
+
+
+_ProfileFiles: TypeAlias = Dict[Path, _ProfileFileState]
+
+
+def _load_profiles_from_directory(
+    directory: Path,
+    use_cache: bool = True,
+    files: Optional[_ProfileFiles] = None,
+) -> Dict[str, Profile]:
+    """Load all profiles from a directory.
+
+    Validated profiles are kept in a compiled cache keyed by file name,
+    mtime and size, so only changed files are parsed again.
+    """
     profiles: Dict[str, Profile] = {}
     if not directory.is_dir():
         return profiles
 
+    cache_path = _get_profile_cache_path(directory)
+    cached = _read_profile_cache(cache_path) if use_cache else {}
+    entries: _ProfileCacheEntries = {}
+    dirty = False
+
     for path in directory.glob("*.toml"):
         try:
-            profile = _load_profile(path)
-            profiles[profile.profile_name] = profile
-        except Exception:
-            # Skip invalid or unreadable profile files and continue loading others
+            stat = path.stat()
+        except OSError:
             continue
 
+        entry = cached.get(path.name)
+        match entry:
+            case (
+                stat.st_mtime_ns, stat.st_size, str(digest), Profile() | None
+            ):
+                profile = entry[3]
+            case _:
+                dirty = True
+                try:
+                    content = path.read_bytes()
+                except OSError:
+                    continue
+                digest = _hash_profile(content)
+                try:
+                    profile = _parse_profile(path, content)
+                except Exception:
+                    # Skip invalid profile files and continue loading others
+                    profile = None
+
+        entries[path.name] = (stat.st_mtime_ns, stat.st_size, digest, profile)
+        if profile is not None:
+            profiles[profile.profile_name] = profile
+        if files is not None:
+            files[path] = _ProfileFileState(
+                stat.st_mtime_ns,
+                stat.st_size,
+                digest,
+                profile.profile_name if profile else None,
+            )
+
+    if use_cache and (dirty or entries.keys() != cached.keys()):
+        _write_profile_cache(cache_path, entries)
+
     return profiles
 
 
@@ -161,39 +330,278 @@ def _initialize_profiles_dir() -> Path:
 _PROFILES_DIRECTORY: Path = _initialize_profiles_dir()
 _profiles: Dict[str, Profile] = {}
 
+# Lazy mode: profile name -> file, parsed into _profiles on first use
+_lazy_loading = False
+_profile_index: Dict[str, Path] = {}
+_lazy_lru: OrderedDict[str, None] = OrderedDict()
+LAZY_PROFILE_CACHE_SIZE = 8
+
+# Fingerprints of the files behind the current profiles, for reloads
+_profile_files: _ProfileFiles = {}
+
+# Called with the names of changed profiles, or None when all may have changed
+ProfilesChangedListener: TypeAlias = Callable[[Optional[Set[str]]], None]
+_profiles_changed_listeners: List[ProfilesChangedListener] = []
+
+
+def add_profiles_changed_listener(listener: ProfilesChangedListener) -> None:
+    """Register a callback invalidating data derived from loaded profiles."""
+    if listener not in _profiles_changed_listeners:
+        _profiles_changed_listeners.append(listener)
+
+
+def _notify_profiles_changed(names: Optional[Set[str]] = None) -> None:
+    for listener in _profiles_changed_listeners:
+        listener(names)
+
 
 def get_profiles_dir() -> Path:
     """Return the profiles directory path."""
     return _PROFILES_DIRECTORY
 
 
+def set_lazy_profile_loading(enabled: bool) -> None:
+    """Choose whether the next `load_profiles()` parses profiles on demand."""
+    global _lazy_loading
+    _lazy_loading = enabled
+
+
+def _read_profile_name(lines: Iterable[str]) -> Optional[str]:
+    """Read only `profile_name` from the top-level keys of a profile file.
+
+    Everything from the first table header on is skipped, so this stays
+    cheap for large profiles. Returns None when the name can't be found.
+    """
+    head: List[str] = []
+    for line in lines:
+        if line.lstrip().startswith("["):
+            break
+        head.append(line)
+
+    try:
+        name = tomllib.loads("".join(head)).get("profile_name")
+    except tomllib.TOMLDecodeError:
+        return None
+    return name if isinstance(name, str) else None
+
+
+def _index_profiles_directory(
+    directory: Path, files: Optional[_ProfileFiles] = None
+) -> Dict[str, Path]:
+    """Map profile names to their files without parsing whole profiles."""
+    index: Dict[str, Path] = {}
+    if not directory.is_dir():
+        return index
+
+    for path in directory.glob("*.toml"):
+        try:
+            stat = path.stat()
+            with open(path, "r", encoding="utf-8") as f:
+                name = _read_profile_name(f)
+        except Exception:
+            continue
+
+        if name is None:
+            # Name isn't a plain top-level key; fall back to a full parse
+            try:
+                name = _load_profile(path).profile_name
+            except Exception:
+                name = None
+
+        if name is not None:
+            index[name] = path
+        if files is not None:
+            files[path] = _ProfileFileState(
+                stat.st_mtime_ns, stat.st_size, None, name
+            )
+
+    return index
+
+
 def load_profiles() -> None:
-    """Load profiles from the built-in directory."""
+    """Load profiles from the built-in directory.
+
+    In lazy mode only a name index is built and each profile is parsed
+    the first time `get_profile_data()` asks for it.
+    """
     global _profiles
     _profiles.clear()
+    _profile_index.clear()
+    _lazy_lru.clear()
+    _profile_files.clear()
+
+    directory = get_profiles_dir()
+    if _lazy_loading:
+        _profiles = {}
+        _profile_index.update(
+            _index_profiles_directory(directory, _profile_files)
+        )
+    else:
+        _profiles = _load_profiles_from_directory(
+            directory, files=_profile_files
+        )
+    _notify_profiles_changed()
 
-    _profiles = _load_profiles_from_directory(get_profiles_dir())
+
+@dataclass
+class ProfileReloadResult:
+    """Profile names affected by an incremental reload."""
+
+    added: Set[str] = field(default_factory=set)
+    changed: Set[str] = field(default_factory=set)
+    removed: Set[str] = field(default_factory=set)
+
+    @property
+    def affected(self) -> Set[str]:
+        return self.added | self.changed | self.removed
+
+
+def _forget_profile(profile_name: str) -> None:
+    _profiles.pop(profile_name, None)
+    _profile_index.pop(profile_name, None)
+    _lazy_lru.pop(profile_name, None)
+
+
+def _register_profile_text(path: Path, text: str) -> Optional[str]:
+    """Parse, or in lazy mode only index, a profile and return its name."""
+    if _lazy_loading:
+        name = _read_profile_name(text.splitlines(keepends=True))
+        if name is not None:
+            _profile_index[name] = path
+            return name
+
+    try:
+        profile = Profile.from_dict(tomllib.loads(text))
+    except Exception:
+        return None
+
+    if _lazy_loading:
+        _profile_index[profile.profile_name] = path
+    else:
+        _profiles[profile.profile_name] = profile
+    return profile.profile_name
+
+
+def reload_profiles() -> ProfileReloadResult:
+    """Re-read only profile files that were added, changed or deleted.
+
+    Files are compared by mtime and size first and by content hash after
+    that, so saving a file without editing it doesn't re-parse it.
+    Listeners are notified with the affected profile names only.
+    """
+    directory = get_profiles_dir()
+    paths = set(directory.glob("*.toml")) if directory.is_dir() else set()
+    before = set(get_profile_names())
+    touched: Set[str] = set()
+
+    for path in _profile_files.keys() - paths:
+        state = _profile_files.pop(path)
+        if state.name is not None:
+            _forget_profile(state.name)
+            touched.add(state.name)
+
+    for path in sorted(paths):
+        known = _profile_files.get(path)
+        try:
+            stat = path.stat()
+            if known is not None and (known.mtime_ns, known.size) == (
+                stat.st_mtime_ns,
+                stat.st_size,
+            ):
+                continue
+            data = path.read_bytes()
+        except OSError:
+            continue
+
+        digest = _hash_profile(data)
+        if known is not None and known.digest == digest:
+            _profile_files[path] = replace(
+                known, mtime_ns=stat.st_mtime_ns, size=stat.st_size
+            )
+            continue
+
+        if known is not None and known.name is not None:
+            _forget_profile(known.name)
+            touched.add(known.name)
+
+        try:
+            name = _register_profile_text(path, data.decode("utf-8"))
+        except UnicodeDecodeError:
+            name = None
+
+        _profile_files[path] = _ProfileFileState(
+            stat.st_mtime_ns, stat.st_size, digest, name
+        )
+        if name is not None:
+            touched.add(name)
+
+    after = set(get_profile_names())
+    result = ProfileReloadResult(
+        added=after - before,
+        changed=touched & before & after,
+        removed=before - after,
+    )
+    if result.affected:
+        _notify_profiles_changed(result.affected)
+    return result
 
 
 def get_loaded_profiles() -> Dict[str, Profile]:
-    """Return loaded variant profiles."""
+    """Return profiles currently parsed in memory."""
     return _profiles
 
 
+def get_profile_names() -> List[str]:
+    """Return names of all available profiles, parsed or not."""
+    names = list(_profiles.keys())
+    names.extend(name for name in _profile_index if name not in _profiles)
+    return names
+
+
 def is_profile_loaded(profile_name: str) -> bool:
-    """Check if a profile is loaded."""
-    return profile_name in _profiles
+    """Check if a profile is loaded or can be loaded on demand."""
+    return profile_name in _profiles or profile_name in _profile_index
+
+
+def _load_indexed_profile(profile_name: str) -> Optional[Profile]:
+    """Parse an indexed profile and keep it in the LRU of lazy profiles."""
+    path = _profile_index.get(profile_name)
+    if path is None:
+        return None
+
+    try:
+        profile = _load_profile(path)
+    except Exception:
+        return None
+    if profile.profile_name != profile_name:
+        return None
+
+    _profiles[profile_name] = profile
+    _lazy_lru[profile_name] = None
+
+    while len(_lazy_lru) > LAZY_PROFILE_CACHE_SIZE:
+        evicted, _ = _lazy_lru.popitem(last=False)
+        _profiles.pop(evicted, None)
+        _notify_profiles_changed({evicted})
+
+    return profile
 
 
 def get_profile_data(profile_name: str) -> Optional[Profile]:
     """Return a profile by name, or None if missing."""
-    return _profiles.get(profile_name)
+    profile = _profiles.get(profile_name)
+    if profile is not None:
+        if profile_name in _lazy_lru:
+            _lazy_lru.move_to_end(profile_name)
+        return profile
+
+    return _load_indexed_profile(profile_name)
 
 
 def get_profile_items() -> List[Tuple[str, str, str]]:
     """Generate enum items for UI profile dropdowns."""
     items: List[Tuple[str, str, str]] = []
-    for name in _profiles.keys():
+    for name in get_profile_names():
         items.append((name, name, f"Variant profile: {name}"))
 
     if not items:
@@ -122,16 +122,26 @@ def draw_toggle_with_field(
         box.prop(owner, field_attr, text=label)
 
 
+class ViewportUnavailable(RuntimeError):
+    """Raised when an operator needs a 3D Viewport but none exists, e.g.
+    when Blender runs in background mode."""
+
+
 def call_operator_in_3d_viewport(
     op_func: Callable[[str], Any], context: str
 ) -> Any:
     """Invoke an operator in a 3D Viewport area and return its result."""
-    assert bpy.context.window_manager
-
-    for window in bpy.context.window_manager.windows:
+    if bpy.app.background:
+        raise ViewportUnavailable(
+            "Operator needs a 3D Viewport, which doesn't exist when "
+            "Blender runs in background mode"
+        )
+
+    wm = bpy.context.window_manager
+    for window in wm.windows if wm else []:
         screen = window.screen
         for area in screen.areas:
             if area.type == "VIEW_3D":
                 with bpy.context.temp_override(window=window, area=area):
                     return op_func(context)
-    raise RuntimeError("No 3D Viewport found to call operator in")
+    raise ViewportUnavailable("No 3D Viewport found to call operator in")
@@ -0,0 +1,101 @@
+"""Cache of variant plans shared by collections with the same profile and
+detected shapekeys."""
+
+from __future__ import annotations
+from dataclasses import dataclass
+
+from typing import Dict, FrozenSet, Iterable, Iterator, Optional, Tuple
+
+from .profile import Profile, add_profiles_changed_listener
+from .variants import ShapekeyBits, count_variant_masks, iter_variant_masks
+
+
+@dataclass(frozen=True)
+class VariantPlan:
+    """Variants of a profile restricted to a set of detected shapekeys."""
+
+    profile: Profile
+    shapekey_bits: ShapekeyBits
+    detected_mask: int
+    variant_count: int
+
+    def iter_variants(self) -> Iterator[int]:
+        """Yield the plan's variant masks one at a time."""
+        return iter_variant_masks(self.shapekey_bits, self.detected_mask)
+
+
+@dataclass
+class PlanCacheStats:
+    hits: int = 0
+    misses: int = 0
+
+
+_PlanKey = Tuple[int, FrozenSet[str]]
+
+# Plans hold a reference to their profile, so `id(profile)` stays unique
+# for as long as the entry is cached.
+_plans: Dict[_PlanKey, VariantPlan] = {}
+_bits: Dict[int, Tuple[Profile, ShapekeyBits]] = {}
+_stats = PlanCacheStats()
+
+
+def _get_shapekey_bits(profile: Profile) -> ShapekeyBits:
+    entry = _bits.get(id(profile))
+    if entry is None:
+        entry = (profile, ShapekeyBits.from_profile(profile))
+        _bits[id(profile)] = entry
+    return entry[1]
+
+
+def get_variant_plan(profile: Profile, shapekeys: Iterable[str]) -> VariantPlan:
+    """Return the cached plan for `profile` and the detected `shapekeys`,
+    building it on first use."""
+    bits = _get_shapekey_bits(profile)
+    detected = frozenset(k for k in shapekeys if k in bits.name_masks)
+    key = (id(profile), detected)
+
+    plan = _plans.get(key)
+    if plan is not None:
+        _stats.hits += 1
+        return plan
+
+    _stats.misses += 1
+    detected_mask = bits.mask_of(detected)
+    plan = VariantPlan(
+        profile=profile,
+        shapekey_bits=bits,
+        detected_mask=detected_mask,
+        variant_count=count_variant_masks(bits, detected_mask),
+    )
+    _plans[key] = plan
+    return plan
+
+
+def clear_variant_plans(profile_names: Optional[Iterable[str]] = None) -> None:
+    """Drop cached plans, either all of them or those of the named profiles."""
+    if profile_names is None:
+        _plans.clear()
+        _bits.clear()
+        return
+
+    names = set(profile_names)
+    for key, plan in list(_plans.items()):
+        if plan.profile.profile_name in names:
+            del _plans[key]
+    for pid, (profile, _) in list(_bits.items()):
+        if profile.profile_name in names:
+            del _bits[pid]
+
+
+def get_plan_cache_stats() -> PlanCacheStats:
+    """Return the hit/miss counters of the plan cache."""
+    return _stats
+
+
+def reset_plan_cache_stats() -> None:
+    """Reset the hit/miss counters of the plan cache."""
+    _stats.hits = 0
+    _stats.misses = 0
+
+
+add_profiles_changed_listener(clear_variant_plans)
@@ -1,8 +1,9 @@
 """Utilities for generating and naming exportable variants."""
 
-from itertools import combinations, chain, product
+from __future__ import annotations
+from dataclasses import dataclass, field
 
-from typing import List, Tuple, Iterable, Any, Optional, Iterator
+from typing import Dict, List, Tuple, Iterable, Optional, Iterator
 
 from .profile import (
     Group,
@@ -13,12 +14,6 @@ from .profile import (
 )
 
 
-def _powerset(iterable: Iterable[Any]) -> Iterator[Tuple[Any, ...]]:
-    """Return an iterator over all subsets (the powerset) of `iterable`."""
-    s = list(iterable)
-    return chain.from_iterable(combinations(s, r) for r in range(len(s) + 1))
-
-
 def filter_profile_shapekeys(
     shapekeys: set[str], profile: Profile
 ) -> List[Group]:
@@ -41,70 +36,338 @@ def filter_profile_shapekeys(
     return reduced_groups
 
 
-def _is_valid_variant_combo(
-    variant_combo: Iterable[NamePair], incompatibilities: IncompatibilityMap
-) -> bool:
-    """Check if a variant combo is valid according to the profile rules."""
+@dataclass(frozen=True)
+class ShapekeyBits:
+    """Stable bit assignment for the shapekeys of a group list.
+
+    Every shapekey entry owns one bit and a variant is the int of its
+    active bits. Exclusive keys take the low bits and optional keys the
+    high bits, each in profile order, so reading the set bits from low to
+    high gives the keys in naming order.
+    """
+
+    shapekeys: Tuple[NamePair, ...] = ()
+    exclusive_masks: Tuple[int, ...] = ()
+    optional_mask: int = 0
+    incompatible: Tuple[int, ...] = ()
+    name_masks: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_groups(
+        cls, groups: Iterable[Group], incompatibilities: IncompatibilityMap
+    ) -> ShapekeyBits:
+        groups = list(groups)
+        shapekeys: List[NamePair] = []
+        exclusive_masks: List[int] = []
+        optional_mask = 0
+
+        for g in groups:
+            if g.mode != GroupMode.EXCLUSIVE:
+                continue
+            mask = 0
+            for pair in g.shapekeys:
+                mask |= 1 << len(shapekeys)
+                shapekeys.append(pair)
+            exclusive_masks.append(mask)
+
+        for g in groups:
+            if g.mode == GroupMode.EXCLUSIVE:
+                continue
+            for pair in g.shapekeys:
+                optional_mask |= 1 << len(shapekeys)
+                shapekeys.append(pair)
+
+        name_masks: Dict[str, int] = {}
+        for bit, (bname, _) in enumerate(shapekeys):
+            name_masks[bname] = name_masks.get(bname, 0) | (1 << bit)
+
+        # Compile the rules into symmetric per-bit masks
+        incompatible = [0] * len(shapekeys)
+        for shape, others in incompatibilities.items():
+            shape_mask = name_masks.get(shape, 0)
+            other_mask = 0
+            for other in others:
+                other_mask |= name_masks.get(other, 0)
+            for bit in _iter_bits(shape_mask):
+                incompatible[bit] |= other_mask
+            for bit in _iter_bits(other_mask):
+                incompatible[bit] |= shape_mask
+
+        return cls(
+            shapekeys=tuple(shapekeys),
+            exclusive_masks=tuple(exclusive_masks),
+            optional_mask=optional_mask,
+            incompatible=tuple(incompatible),
+            name_masks=name_masks,
+        )
+
+    @classmethod
+    def from_profile(cls, profile: Profile) -> ShapekeyBits:
+        return cls.from_groups(profile.groups, profile.incompatibilities)
+
+    @property
+    def all_mask(self) -> int:
+        return (1 << len(self.shapekeys)) - 1
+
+    def mask_of(self, shapekeys: Iterable[str]) -> int:
+        """Return the mask of every entry whose Blender name is listed."""
+        mask = 0
+        for name in shapekeys:
+            mask |= self.name_masks.get(name, 0)
+        return mask
+
+    def conflicts(self, bit: int, variant: int) -> bool:
+        """Check if adding the single-bit mask `bit` to `variant` breaks a
+        profile rule."""
+        return bool(self.incompatible[bit.bit_length() - 1] & (variant | bit))
+
+    def is_valid(self, variant: int) -> bool:
+        """Check if a variant is valid according to the profile rules."""
+        return not any(
+            self.incompatible[bit] & variant for bit in _iter_bits(variant)
+        )
 
-    combo_shapes = {shape for shape, _ in variant_combo}
+    def pairs(self, variant: int) -> List[NamePair]:
+        """Return the (Blender name, export name) pairs of a variant."""
+        return [self.shapekeys[bit] for bit in _iter_bits(variant)]
 
-    for shape in combo_shapes:
-        if shape in incompatibilities and any(
-            inc in combo_shapes for inc in incompatibilities[shape]
-        ):
-            return False
-    return True
+    def export_names(self, variant: int) -> List[str]:
+        """Return the export names of a variant in naming order."""
+        return [self.shapekeys[bit][1] for bit in _iter_bits(variant)]
 
 
-def _filter_compatible_shapekeys(
-    variants: Iterable[Iterable[NamePair]],
-    incompatibilities: IncompatibilityMap,
-) -> List[List[NamePair]]:
-    """Remove shapekeys from the set that are incompatible with the profile."""
-    valid_combos = []
-    for combo in variants:
-        if _is_valid_variant_combo(combo, incompatibilities):
-            valid_combos.append(list(combo))
-    return valid_combos
+def _iter_bits(mask: int) -> Iterator[int]:
+    """Yield the indices of the set bits of `mask`, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
 
 
-def generate_variant_combinations(
-    support_list: List[Group], incompatibilities: IncompatibilityMap
-) -> List[List[NamePair]]:
-    """Generate bakeable variant combinations from support groups."""
+def _iter_exclusive_choices(
+    bits: ShapekeyBits, exclusive_masks: List[int], chosen: int, depth: int
+) -> Iterator[int]:
+    """Yield one key per exclusive group, skipping incompatible branches."""
+    if depth == len(exclusive_masks):
+        yield chosen
+        return
 
-    exclusive_groups: List[List[NamePair]] = []
-    optional_keys: List[NamePair] = []
+    remaining = exclusive_masks[depth]
+    while remaining:
+        low = remaining & -remaining
+        remaining ^= low
+        if bits.conflicts(low, chosen):
+            continue
+        yield from _iter_exclusive_choices(
+            bits, exclusive_masks, chosen | low, depth + 1
+        )
 
-    for g in support_list:
-        sk_list = g.shapekeys
-        mode = g.mode
 
-        if not sk_list:
+def _iter_optional_subsets(
+    bits: ShapekeyBits,
+    optional_bits: List[int],
+    chosen: int,
+    size: int,
+    start: int = 0,
+) -> Iterator[int]:
+    """Yield compatible `size`-element extensions of `chosen` in the order
+    of `itertools.combinations`, skipping incompatible branches."""
+    if size == 0:
+        yield chosen
+        return
+
+    for idx in range(start, len(optional_bits) - size + 1):
+        bit = optional_bits[idx]
+        if bits.conflicts(bit, chosen):
             continue
+        yield from _iter_optional_subsets(
+            bits, optional_bits, chosen | bit, size - 1, idx + 1
+        )
+
+
+def iter_variant_masks(bits: ShapekeyBits, detected: int) -> Iterator[int]:
+    """Lazily yield the valid variants built from the `detected` keys.
+
+    Variants are ordered by exclusive choice first, then by optional
+    subsets of increasing size. Incompatible branches are dropped while
+    they are built, so only the current variant is held in memory.
+    """
+    exclusive_masks = [
+        mask & detected for mask in bits.exclusive_masks if mask & detected
+    ]
+    optional_bits = [
+        1 << bit for bit in _iter_bits(bits.optional_mask & detected)
+    ]
+
+    for base in _iter_exclusive_choices(bits, exclusive_masks, 0, 0):
+        for size in range(len(optional_bits) + 1):
+            yield from _iter_optional_subsets(bits, optional_bits, base, size)
+
+
+def count_variant_masks(bits: ShapekeyBits, detected: int) -> int:
+    """Count the valid variants built from the `detected` keys without
+    enumerating them.
+
+    Exclusive choices are counted with a DP keyed by the keys they block,
+    and optional subsets as independent sets of the incompatibility graph,
+    where keys without conflicts contribute a plain factor of two.
+    """
+    incompatible = bits.incompatible
+    usable = detected
+    for bit in _iter_bits(detected):
+        if incompatible[bit] & (1 << bit):
+            usable &= ~(1 << bit)
+
+    exclusive_masks = [
+        mask & usable for mask in bits.exclusive_masks if mask & detected
+    ]
+    optional = bits.optional_mask & usable
+
+    future = [optional] * (len(exclusive_masks) + 1)
+    for depth in range(len(exclusive_masks) - 1, -1, -1):
+        future[depth] = future[depth + 1] | exclusive_masks[depth]
+
+    optional_memo: Dict[int, int] = {}
+    choice_memo: Dict[Tuple[int, int], int] = {}
+
+    def count_optional(allowed: int) -> int:
+        if allowed in optional_memo:
+            return optional_memo[allowed]
+
+        free = 0
+        pivot = 0
+        pivot_degree = 0
+        for bit in _iter_bits(allowed):
+            degree = (incompatible[bit] & allowed).bit_count()
+            if degree == 0:
+                free |= 1 << bit
+            elif degree > pivot_degree:
+                pivot, pivot_degree = bit, degree
+
+        constrained = allowed & ~free
+        total = 1 << free.bit_count()
+        if constrained:
+            rest = constrained & ~(1 << pivot)
+            total *= count_optional(rest) + count_optional(
+                rest & ~incompatible[pivot]
+            )
+
+        optional_memo[allowed] = total
+        return total
+
+    def count_choices(depth: int, blocked: int) -> int:
+        if depth == len(exclusive_masks):
+            return count_optional(optional & ~blocked)
+
+        key = (depth, blocked & future[depth])
+        if key in choice_memo:
+            return choice_memo[key]
 
-        if mode == GroupMode.EXCLUSIVE:
-            exclusive_groups.append(sk_list)
+        total = 0
+        for bit in _iter_bits(exclusive_masks[depth] & ~blocked):
+            total += count_choices(depth + 1, blocked | incompatible[bit])
+
+        choice_memo[key] = total
+        return total
+
+    return count_choices(0, 0)
+
+
+def gray_rank(bits: ShapekeyBits, variant: int) -> int:
+    """Return the position of `variant` in a reflected mixed-radix Gray code.
+
+    Each exclusive group is one digit and each optional key a binary digit,
+    with optional keys changing fastest since toggling one costs a single
+    shapekey write while switching an exclusive choice costs two.
+    """
+    rank = 0
+    for mask in bits.exclusive_masks:
+        size = mask.bit_count()
+        if not size:
+            continue
+        chosen = variant & mask
+        digit = (mask & (chosen - 1)).bit_count() if chosen else 0
+        if rank & 1:
+            digit = size - 1 - digit
+        rank = rank * size + digit
+
+    for bit in _iter_bits(bits.optional_mask):
+        digit = (variant >> bit) & 1
+        if rank & 1:
+            digit ^= 1
+        rank = rank * 2 + digit
+
+    return rank
+
+
+def _gray_digits(
+    bits: ShapekeyBits, detected: int
+) -> List[List[Optional[int]]]:
+    """Return the digits of `gray_rank`, each as the key bit of every digit
+    value: 0 for no key, None for a value with an undetected key."""
+    digits: List[List[Optional[int]]] = []
+    for mask in bits.exclusive_masks:
+        if not mask:
+            continue
+        if mask & detected:
+            digits.append([
+                1 << bit if detected >> bit & 1 else None
+                for bit in _iter_bits(mask)
+            ])
         else:
-            optional_keys.extend(sk_list)
+            # Left out of every variant, i.e. digit 0
+            digits.append([0] + [None] * (mask.bit_count() - 1))
+
+    for bit in _iter_bits(bits.optional_mask):
+        digits.append([0, 1 << bit if detected >> bit & 1 else None])
+    return digits
+
+
+def order_by_fewest_changes(
+    bits: ShapekeyBits, detected: int
+) -> Iterator[int]:
+    """Lazily yield the variants of `iter_variant_masks` along the Gray
+    code, so consecutive variants differ by as few shapekeys as possible.
+
+    The digits are walked in reflected order, giving the variants in
+    `gray_rank` order without collecting them first.
+    """
+    digits = _gray_digits(bits, detected)
+
+    def walk(depth: int, chosen: int, odd: bool) -> Iterator[int]:
+        if depth == len(digits):
+            yield chosen
+            return
+
+        keys = digits[depth]
+        radix = len(keys)
+        for step in range(radix):
+            key = keys[radix - 1 - step if odd else step]
+            if key is None or (key and bits.conflicts(key, chosen)):
+                continue
+            yield from walk(
+                depth + 1, chosen | key, bool((odd * radix + step) & 1)
+            )
 
-    optional_subsets = list(_powerset(optional_keys)) if optional_keys else [()]
+    return walk(0, 0, False)
 
-    variants: List[List[NamePair]] = []
 
-    if exclusive_groups:
-        for excl_choice in product(*exclusive_groups):
-            base = list(excl_choice)
-            for opt_subset in optional_subsets:
-                variants.append(base + list(opt_subset))
-    else:
-        for opt_subset in optional_subsets:
-            variants.append(list(opt_subset))
+def iter_variant_changes(variants: Iterable[int]) -> Iterator[Tuple[int, int]]:
+    """Yield each variant with the mask of keys changed since the previous
+    one. The first variant reports every key (-1) as changed."""
+    previous: Optional[int] = None
+    for variant in variants:
+        yield variant, -1 if previous is None else variant ^ previous
+        previous = variant
 
-    if variants == []:
-        variants.append([])
 
-    return _filter_compatible_shapekeys(variants, incompatibilities)
+def iter_variant_combinations(
+    support_list: List[Group], incompatibilities: IncompatibilityMap
+) -> Iterator[List[NamePair]]:
+    """Lazily yield bakeable variant combinations from support groups."""
+    bits = ShapekeyBits.from_groups(support_list, incompatibilities)
+    for variant in iter_variant_masks(bits, bits.all_mask):
+        yield bits.pairs(variant)
 
 
 def name_variant(variant_combo: List[str], separator: str = " - ") -> str:
@@ -116,7 +379,7 @@ def detect_export_alias(
     variant_combo: List[str], profile: Profile
 ) -> Tuple[Optional[str], List[str]]:
     """Detect and return a single export alias override and remaining items."""
-    alias_map = profile.export_aliases
+    alias_map = profile.index.alias_of
 
     if alias_map:
         for idx, name in enumerate(variant_combo):
@@ -126,3 +389,19 @@ def detect_export_alias(
                 return override, remaining
 
     return None, variant_combo
+
+
+def detect_variant_alias(
+    variant: int, bits: ShapekeyBits, profile: Profile
+) -> Tuple[Optional[str], int]:
+    """Detect a single export alias override for a variant mask and return
+    it with the remaining variant bits."""
+    alias_map = profile.index.alias_of
+
+    if alias_map:
+        for bit in _iter_bits(variant):
+            name = bits.shapekeys[bit][1]
+            if name in alias_map:
+                return alias_map[name], variant & ~(1 << bit)
+
+    return None, variant
@@ -3,7 +3,10 @@ import types
 import sys
 from types import ModuleType
 
-from .helpers import Context, Collection, Object, Operator, PropertyGroup, Mesh, Scene, Model
+from .helpers import (
+    Context, Collection, Object, Operator, PropertyGroup, Mesh, Scene, Model,
+    ShapeKeys,
+)
 
 
 def _ensure_bpy_shim():
@@ -22,8 +25,13 @@ def _ensure_bpy_shim():
     _bpy.types.PropertyGroup = PropertyGroup
     _bpy.types.Scene = Scene
     _bpy.types.Mesh = Mesh
+    _bpy.types.Key = ShapeKeys
     _bpy.types.Armature = Object
     _bpy.types.UILayout = type("UILayout", (), {})
+    _bpy.types.ByteColorAttribute = type(
+        "ByteColorAttribute", (types.SimpleNamespace,), {})
+    _bpy.types.FloatColorAttribute = type(
+        "FloatColorAttribute", (types.SimpleNamespace,), {})
 
     _bpy.props = ModuleType("bpy.props")
     sys.modules.setdefault("bpy.props", _bpy.props)
@@ -33,7 +41,7 @@ def _ensure_bpy_shim():
         return None
 
     for name in ("PointerProperty", "CollectionProperty", "StringProperty",
-                 "EnumProperty", "IntProperty", "BoolProperty"):
+                 "EnumProperty", "IntProperty", "BoolProperty", "FloatProperty"):
         setattr(_bpy.props, name, _noop)
 
 
@@ -0,0 +1,122 @@
+from types import SimpleNamespace
+
+from ..operators import attributes
+from ..shared import analysis_cache
+from .helpers import Collection, KeyBlock, ShapeKeys
+from .test_collection_analysis import make_part
+
+
+_next_uid = iter(range(1000, 100000))
+
+
+def with_uid(datablock):
+    datablock.session_uid = next(_next_uid)
+    return datablock
+
+
+def make_linked_part(name, col, **kwargs):
+    obj = with_uid(make_part(name, **kwargs))
+    with_uid(obj.data)
+    obj.users_collection = [col]
+    col.objects.append(obj)
+    return obj
+
+
+def make_update(datablock, transform=False, geometry=False):
+    return SimpleNamespace(
+        id=datablock,
+        is_updated_transform=transform,
+        is_updated_geometry=geometry,
+        is_updated_shading=False,
+    )
+
+
+def test_analysis_is_cached_until_depsgraph_marks_it_dirty(monkeypatch):
+    analysis_cache.clear_collection_analyses()
+    analysis_cache.reset_analysis_cache_stats()
+    stats = analysis_cache.get_analysis_cache_stats()
+
+    # tag_depsgraph_updates matches on bpy.types.Object
+    monkeypatch.setattr(analysis_cache, "Object", SimpleNamespace)
+
+    col = with_uid(Collection())
+    body = make_linked_part("Body 0.0", col, keys=["A"])
+    arm = make_linked_part("Body 0.1", col, keys=["B"])
+    other = with_uid(Collection(objects=[]))
+
+    first = analysis_cache.get_collection_analysis(col)
+    assert analysis_cache.get_collection_analysis(col) is first
+    assert (stats.rebuilds, stats.hits, stats.objects_analysed) == (1, 1, 2)
+
+    # moving an object doesn't touch the analysis
+    depsgraph = SimpleNamespace(updates=[make_update(arm, transform=True)])
+    analysis_cache.tag_depsgraph_updates(depsgraph)
+    assert analysis_cache.get_collection_analysis(col) is first
+    assert stats.invalidations == 0
+
+    # a new shapekey only re-reads the changed object
+    arm.data.shape_keys = ShapeKeys([KeyBlock("B"), KeyBlock("C")])
+    depsgraph = SimpleNamespace(updates=[make_update(arm, geometry=True)])
+    analysis_cache.tag_depsgraph_updates(depsgraph)
+    second = analysis_cache.get_collection_analysis(col)
+    assert second.shapekeys == {"A", "B", "C"}
+    assert stats.invalidations == 1
+    assert stats.objects_analysed == 3
+
+    # unlinking from the collection is picked up from the collection update
+    col.objects.remove(body)
+    depsgraph = SimpleNamespace(updates=[make_update(col), make_update(other)])
+    analysis_cache.tag_depsgraph_updates(depsgraph)
+    third = analysis_cache.get_collection_analysis(col)
+    assert third.shapekeys == {"B", "C"}
+    assert [p.obj for p in third.parts] == [arm]
+    assert stats.objects_analysed == 3
+
+    analysis_cache.clear_collection_analyses()
+    assert analysis_cache.get_collection_analysis(col) is not third
+    assert stats.clears == 1
+
+
+def test_shapekey_datablock_updates_mark_the_mesh_users_dirty():
+    analysis_cache.clear_collection_analyses()
+    col = with_uid(Collection())
+    body = make_linked_part("Body 0.0", col, keys=["A"])
+    make_linked_part("Body 0.1", col, keys=["B"])
+    analysis_cache.get_collection_analysis(col)
+
+    body.data.shape_keys.key_blocks[0].name = "Renamed"
+    body.data.shape_keys.user = body.data
+    depsgraph = SimpleNamespace(updates=[make_update(body.data.shape_keys)])
+    analysis_cache.tag_depsgraph_updates(depsgraph)
+
+    stats = analysis_cache.get_analysis_cache_stats()
+    analysed = stats.objects_analysed
+    analysis = analysis_cache.get_collection_analysis(col)
+    assert analysis.shapekeys == {"Renamed", "B"}
+    assert stats.objects_analysed == analysed + 1
+
+
+def test_removing_an_attribute_invalidates_the_analysis(monkeypatch):
+    analysis_cache.clear_collection_analyses()
+    col = with_uid(Collection())
+    arm = make_linked_part("Body 0.1", col, attrs=["atr_arm", "atr_hij"])
+    assert analysis_cache.get_collection_analysis(col).part_attrs == {
+        (0, 1): ["atr_arm", "atr_hij"],
+    }
+
+    # CollectionProperty items are removed by index
+    arm.modkit.attributes = type(
+        "Attributes", (list,), {"remove": list.pop}
+    )(arm.modkit.attributes)
+    monkeypatch.setattr(
+        attributes.bpy, "data",
+        SimpleNamespace(objects={arm.name: arm}), raising=False,
+    )
+    op = attributes.MODKIT_OT_handle_attribute()
+    op.obj, op.is_new, op.attribute_name = arm.name, False, "atr_arm"
+    op.report = lambda *args: None
+    assert op.execute(None) == {"FINISHED"}
+
+    assert analysis_cache.get_collection_analysis(col).part_attrs == {
+        (0, 1): ["atr_hij"],
+    }
@@ -0,0 +1,48 @@
+from types import SimpleNamespace
+
+from ..shared.export import benchmark
+
+
+class FakeDuplicator:
+    def __init__(self, clock):
+        self.clock = clock
+
+    def prepare(self, variant):
+        self.clock.now += 0.010
+
+    def release(self):
+        self.clock.now += 0.002
+
+    def close(self):
+        self.clock.now += 0.004
+
+
+def test_time_duplication_times_each_step_of_the_given_mode(monkeypatch):
+    clock = SimpleNamespace(now=0.0)
+    modes = []
+
+    def create(cfg, info, mode):
+        modes.append(mode)
+        return FakeDuplicator(clock)
+
+    monkeypatch.setattr(benchmark, "create_duplicator", create)
+    monkeypatch.setattr(
+        benchmark, "EvaluatedDuplicator",
+        lambda info: create(None, info, "EVALUATED"),
+    )
+    monkeypatch.setattr(benchmark, "bpy", SimpleNamespace(
+        context=SimpleNamespace(view_layer=None)
+    ))
+    cfg = SimpleNamespace(duplication_mode="PER_VARIANT")
+
+    timing = benchmark.time_duplication(
+        cfg, None, "EVALUATED", [0, 1, 2, 3], clock=lambda: clock.now
+    )
+    benchmark.time_duplication(cfg, None, "SNAPSHOT", [], clock=lambda: 0)
+
+    assert modes == ["EVALUATED", "SNAPSHOT"]
+    assert cfg.duplication_mode == "PER_VARIANT"
+    assert round(timing.prepare_s, 6) == 0.04
+    assert round(timing.release_s, 6) == 0.008
+    assert round(timing.close_s, 6) == 0.004
+    assert round(timing.per_variant_ms, 6) == 13.0
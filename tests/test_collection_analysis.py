@@ -0,0 +1,39 @@
+from types import SimpleNamespace
+
+from ..shared.collection_analysis import analyse_collection
+from .helpers import Collection, KeyBlock, Mesh, ShapeKeys
+
+
+def make_part(name, keys=(), attrs=(), materials=(), obj_type="MESH"):
+    data = Mesh(id=0, material_name="")
+    data.shape_keys = ShapeKeys([KeyBlock(k) for k in keys]) if keys else None
+    return SimpleNamespace(
+        name=name,
+        type=obj_type,
+        data=data,
+        modkit=SimpleNamespace(
+            attributes=[SimpleNamespace(value=a) for a in attrs]
+        ),
+        material_slots=[
+            SimpleNamespace(material=SimpleNamespace(name=m) if m else None)
+            for m in materials
+        ],
+    )
+
+
+def test_analyse_collection_gathers_everything_in_one_pass():
+    body = make_part("Body 0.0", keys=["Basis", "A"], materials=["skin", None])
+    arm = make_part("Body 0.1", keys=["B"], attrs=["atr_arm"])
+    glove = make_part("Glove 1.0", attrs=["atr_glv"])
+    helper = make_part("Helper", keys=["C"])
+    empty = SimpleNamespace(name="Empty 2.0", type="EMPTY", data=None)
+
+    col = Collection(objects=[body, arm, glove, helper, empty])
+    analysis = analyse_collection(col)
+
+    # shapekeys include objects that aren't named parts
+    assert analysis.shapekeys == {"Basis", "A", "B", "C"}
+    assert sorted(analysis.meshes) == [0, 1]
+    assert analysis.meshes[0] == [(body, "Body", 0), (arm, "Body", 1)]
+    assert analysis.part_attrs == {(0, 1): ["atr_arm"], (1, 0): ["atr_glv"]}
+    assert analysis.parts[0].materials == ("skin",)
@@ -0,0 +1,179 @@
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from ..shared.export.conversion import ConversionJob, ConversionQueue
+
+# Stand-ins for the TexTools executables: the converter writes result.db
+# to its working directory, ConsoleTools "wraps" it by copying it
+FAKE_CONVERTER = """#!{python}
+import os, sqlite3, sys, time
+log = os.environ["FAKE_CONVERTER_LOG"]
+name = os.path.basename(sys.argv[1])
+with open(log, "a") as f:
+    f.write("start " + name + "\\n")
+time.sleep(0.2)
+conn = sqlite3.connect("result.db")
+conn.executescript(
+    "CREATE TABLE source (name TEXT);"
+    "CREATE TABLE materials (material_id INTEGER PRIMARY KEY, name TEXT);"
+    "CREATE TABLE meshes (mesh INTEGER PRIMARY KEY, material_id INTEGER);"
+    "CREATE TABLE parts (mesh INTEGER, part INTEGER, attributes TEXT);"
+    "INSERT INTO meshes VALUES (0, NULL);"
+)
+conn.execute("INSERT INTO source VALUES (?)", (name,))
+conn.commit()
+with open(log, "a") as f:
+    f.write("end " + name + "\\n")
+"""
+
+FAKE_CONSOLE_TOOLS = """#!{python}
+import shutil, sys
+shutil.copyfile(sys.argv[2], sys.argv[3])
+"""
+
+
+def make_job(name, root=Path("/out"), textools=Path("/textools")):
+    return ConversionJob(
+        fbx_path=root / f"{name}.fbx",
+        textools_dir=textools,
+        game_path="chara/x.mdl",
+        materials_info={0: f"/mt_{name}.mtrl"},
+        part_attrs={},
+    )
+
+
+def write_script(path, source):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(source.format(python=sys.executable))
+    path.chmod(0o755)
+
+
+def test_conversion_queue_runs_jobs_in_order_and_collects_failures():
+    converted = []
+
+    def convert(job, workspace):
+        if job.fbx_path.stem == "bad":
+            raise RuntimeError("converter crashed")
+        converted.append(job.fbx_path.stem)
+
+    queue = ConversionQueue(convert)
+    for name in ("a", "bad", "b"):
+        queue.submit(make_job(name))
+
+    assert queue.wait(timeout=5)
+    queue.close()
+
+    assert converted == ["a", "b"]
+    assert queue.completed == 2
+    assert queue.pending == 0
+    assert [f.job.fbx_path.stem for f in queue.failures] == ["bad"]
+    assert queue.failures[0].error == "converter crashed"
+    assert queue.failures[0].job.mdl_path == Path("/out/bad.mdl")
+
+
+def test_conversion_queue_wait_times_out_and_cancel_drops_queued_jobs():
+    release = threading.Event()
+    started = threading.Event()
+    converted = []
+
+    def convert(job, workspace):
+        started.set()
+        release.wait(5)
+        converted.append(job.fbx_path.stem)
+
+    queue = ConversionQueue(convert)
+    queue.submit(make_job("running"))
+    queue.submit(make_job("queued"))
+    assert started.wait(5)
+
+    assert not queue.wait(timeout=0.01)
+    assert queue.pending == 2
+
+    queue.cancel()
+    release.set()
+    assert queue.wait(timeout=5)
+    queue.close()
+
+    # the running job finishes, the queued one never starts
+    assert converted == ["running"]
+    assert queue.completed == 1
+    assert queue.failures == []
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX stand-in scripts")
+def test_concurrent_conversions_use_private_workspaces(tmp_path, monkeypatch):
+    textools = tmp_path / "textools"
+    converter_dir = textools / "converters" / "fbx"
+    write_script(converter_dir / "converter.exe", FAKE_CONVERTER)
+    write_script(textools / "ConsoleTools.exe", FAKE_CONSOLE_TOOLS)
+    (converter_dir / "FbxSdk.dll").write_bytes(b"sdk")
+    log = tmp_path / "converter.log"
+    monkeypatch.setenv("FAKE_CONVERTER_LOG", str(log))
+
+    out = tmp_path / "out"
+    out.mkdir()
+    work = tmp_path / "work"
+    work.mkdir()
+    names = ["a", "b", "c", "d"]
+
+    queue = ConversionQueue(workers=2, workspace_root=work)
+    for name in names:
+        (out / f"{name}.fbx").write_bytes(b"fbx")
+        queue.submit(make_job(name, out, textools))
+    assert queue.wait(timeout=30)
+    queue.close()
+
+    assert queue.failures == []
+    assert queue.completed == len(names)
+    for name in names:
+        conn = sqlite3.connect(out / f"{name}.mdl")
+        assert conn.execute("SELECT name FROM source").fetchall() == [
+            (f"{name}.fbx",)
+        ]
+        assert conn.execute("SELECT name FROM materials").fetchall() == [
+            (f"/mt_{name}.mtrl",)
+        ]
+        conn.close()
+
+    # two converters ran at the same time
+    running = peak = 0
+    for line in log.read_text().splitlines():
+        running += 1 if line.startswith("start") else -1
+        peak = max(peak, running)
+    assert peak == 2
+
+    # nothing written to the TexTools folder, workspaces removed
+    assert not (converter_dir / "result.db").exists()
+    assert list(work.iterdir()) == []
+
+
+def test_failed_session_stops_background_conversions(monkeypatch):
+    from types import SimpleNamespace
+
+    from ..shared.export.export_progress import ExportProgress
+    from ..shared.export.session import ExportSession
+
+    session = ExportSession(
+        Path("/out"), SimpleNamespace(sandbox_export=False), ExportProgress()
+    )
+    queue = ConversionQueue(lambda job, workspace: None, workers=2)
+    session.conversion_queue = queue
+
+    def fail(info, variant_range):
+        raise RuntimeError("export failed")
+        yield
+
+    monkeypatch.setattr(session, "_process_single_collection", fail)
+    info = SimpleNamespace(collection=SimpleNamespace(name="Body"),
+                           variant_count=1)
+
+    with pytest.raises(RuntimeError):
+        next(session._iterate_collections([(info, None)]))
+
+    for thread in queue._threads:
+        thread.join(timeout=5)
+        assert not thread.is_alive()
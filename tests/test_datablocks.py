@@ -0,0 +1,37 @@
+from types import SimpleNamespace
+
+from ..shared.export import datablocks
+from ..shared.export.datablocks import DatablockAccounting, DatablockCounts
+
+
+def test_accounting_tracks_peak_and_logs_leaks(monkeypatch):
+    data = SimpleNamespace(meshes=["Body"], objects=["Body"], materials=["m"],
+                           collections=["Col"])
+    warnings = []
+    monkeypatch.setattr(datablocks, "log_warning", warnings.append)
+
+    accounting = DatablockAccounting(data)
+    before = accounting.sample()
+
+    # a variant's copies exist, then are removed again
+    data.meshes += ["copy"]
+    data.objects += ["copy"]
+    data.collections += ["Col__EXPORT"]
+    accounting.sample()
+    del data.objects[-1], data.collections[-1]
+
+    accounting.check("Body variant 1", before)
+
+    assert accounting.peak == DatablockCounts(2, 2, 1, 2)
+    assert accounting.leaks == 1
+    assert warnings == [
+        "Body variant 1 left behind 1 meshes, 0 objects, 0 materials, "
+        "0 collections"
+    ]
+    assert accounting.summary().endswith(
+        "left behind: 1 meshes, 0 objects, 0 materials, 0 collections"
+    )
+
+    data.meshes.pop()
+    accounting.check("Body variant 2", before)
+    assert accounting.leaks == 1
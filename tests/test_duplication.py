@@ -0,0 +1,103 @@
+from types import SimpleNamespace
+
+from ..shared.export import duplication
+from ..shared.profile import Group, GroupMode, Profile
+from ..shared.variants import ShapekeyBits
+from .test_shapekey_utils import make_mesh_with_keys
+
+
+class HObj(SimpleNamespace):
+    def __hash__(self):
+        return id(self)
+
+    def __eq__(self, other):
+        return self is other
+
+
+def make_obj(keys, modifiers=(), rwt=False):
+    props = SimpleNamespace(post_proc_robust_weight_transfer=rwt)
+    return HObj(type="MESH", data=make_mesh_with_keys(keys),
+                modifiers=list(modifiers),
+                modkit=SimpleNamespace(props=props))
+
+
+def make_modifier(target):
+    prop = SimpleNamespace(type="POINTER", identifier="object",
+                           fixed_type=SimpleNamespace(name="Object"))
+    return SimpleNamespace(name="mod", object=target,
+                           bl_rna=SimpleNamespace(properties=[prop]))
+
+
+def test_object_state_masks_follow_keys_modifiers_and_mannequin(monkeypatch):
+    monkeypatch.setattr(duplication, "static_shapekeys", lambda m: frozenset())
+    group = Group(group_name="O", mode=GroupMode.OPTIONAL,
+                  shapekeys=[("A", "a"), ("B", "b"), ("M", "m")])
+    bits = ShapekeyBits.from_profile(Profile(profile_name="P", groups=[group]))
+
+    mannequin = make_obj(["M"])
+    body = make_obj(["A"])
+    accessory = make_obj([])
+    shrinkwrapped = make_obj(["B"], modifiers=[make_modifier(body)])
+    transferred = make_obj([], rwt=True)
+
+    model = SimpleNamespace(mannequin_object=mannequin)
+    collection = SimpleNamespace(
+        objects=[body, accessory, shrinkwrapped, transferred],
+        modkit=SimpleNamespace(model=model),
+    )
+    info = SimpleNamespace(collection=collection, shapekey_bits=bits)
+
+    masks = duplication.object_state_masks(info)
+
+    assert masks[body] == 0b001
+    assert masks[accessory] == 0
+    assert masks[shrinkwrapped] == 0b011
+    assert masks[transferred] == 0b100
+
+
+def test_evaluated_duplicator_frees_copies_and_restores_sources(monkeypatch):
+    armature_mod = SimpleNamespace(type="ARMATURE", show_viewport=True)
+    source = HObj(type="MESH", modifiers=[armature_mod], data="mesh")
+    collection = SimpleNamespace(objects=[source])
+    dup = SimpleNamespace(objects=SimpleNamespace(link=lambda o: None))
+    log = []
+
+    monkeypatch.setattr(duplication, "bpy", SimpleNamespace(
+        context=SimpleNamespace(evaluated_depsgraph_get=lambda: "depsgraph")
+    ))
+    monkeypatch.setattr(duplication, "create_export_collection", lambda c: dup)
+    monkeypatch.setattr(duplication, "get_export_armature", lambda c: None)
+    monkeypatch.setattr(duplication, "collect_collection_meshes",
+                        lambda c: ["mesh"])
+    monkeypatch.setattr(duplication, "save_shapekey_config",
+                        lambda m: {"saved": m})
+    monkeypatch.setattr(duplication, "restore_shapekey_config",
+                        lambda m, c: log.append(("restore", m)))
+    monkeypatch.setattr(
+        duplication, "apply_variant_mask_to_collection",
+        lambda col, bits, variant: log.append(("apply", variant)),
+    )
+    monkeypatch.setattr(
+        duplication, "evaluated_mesh_for_export",
+        lambda obj, depsgraph, arm: HObj(name=f"copy{len(log)}"),
+    )
+    monkeypatch.setattr(duplication, "remove_export_copy",
+                        lambda o: log.append(("free", o.name)))
+    monkeypatch.setattr(duplication, "cleanup_duplicate_collection",
+                        lambda c: log.append(("cleanup",)))
+
+    info = SimpleNamespace(collection=collection, shapekey_bits=None)
+    duplicator = duplication.EvaluatedDuplicator(info)
+    for variant in (1, 2):
+        duplicator.prepare(variant)
+        assert not armature_mod.show_viewport
+        assert len(duplicator.fresh_objects) == 1
+        duplicator.release()
+    duplicator.close()
+
+    assert log == [
+        ("apply", 1), ("free", "copy1"),
+        ("apply", 2), ("free", "copy3"),
+        ("cleanup",), ("restore", "mesh"),
+    ]
+    assert armature_mod.show_viewport
@@ -1,5 +1,6 @@
-from types import SimpleNamespace, Any
-from pytest import Monkeypatch
+from types import SimpleNamespace
+from typing import Any
+from pytest import MonkeyPatch as Monkeypatch
 
 from ..shared import export_context as ec
 
@@ -49,23 +50,21 @@ def test_validate_export_readiness_and_context(
     assert ok2 is True and msg2 is None
 
     # Test CollectionExportInfo properties
-    p = ec.Profile(profile_name="P", groups=[])
-    monkeypatch.setattr(ec, "get_profile_data", lambda name: p)
-    monkeypatch.setattr(ec, "collect_collection_shapekeys", lambda col: {"sk1"})
-    monkeypatch.setattr(ec, "filter_profile_shapekeys", lambda sk, prof: [])
-    monkeypatch.setattr(
-        ec, "generate_variant_combinations", lambda g, inc: [["a"], ["b"]]
+    from ..shared.profile import Group
+
+    p = ec.Profile(
+        profile_name="P",
+        groups=[Group(group_name="G", shapekeys=[("sk1", "a"), ("sk2", "b")])],
     )
+    monkeypatch.setattr(ec, "get_profile_data", lambda name: p)
+    # one part with attributes and both shapekeys
+    from ..shared.collection_analysis import CollectionAnalysis, PartRecord
 
-    # scanned meshes
+    part = PartRecord(make_obj_with_modkit(["x"]), "name", 1, 0, ("x",), ())
     monkeypatch.setattr(
         ec,
-        "ModelScanner",
-        SimpleNamespace(
-            scan_collection=lambda c: {
-                1: [(make_obj_with_modkit(["x"]), "name", 0)]
-            }
-        ),
+        "get_collection_analysis",
+        lambda c: CollectionAnalysis(frozenset({"sk1", "sk2"}), (part,)),
     )
 
     # material info via model meshes and collection props
@@ -87,5 +86,9 @@ def test_validate_export_readiness_and_context(
 
     assert ctx.profile_name == "P"
     assert ctx.variants and len(ctx.variants) == 2
+    assert [ctx.shapekey_bits.export_names(v) for v in ctx.variants] == [
+        ["a"],
+        ["b"],
+    ]
     assert ctx.materials_info == {1: "mat"}
     assert ctx.part_attrs == {(1, 0): ["x"]}
@@ -0,0 +1,128 @@
+import io
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from ..shared.export import headless
+from ..shared.cancel import Cancelled
+from ..shared import ui_helpers
+
+
+class FakeSession:
+    fail_with = None
+    conversion_failures = []
+
+    def __init__(self, export_root, cfg, progress_reporter=None):
+        self.progress = progress_reporter
+        self.total_variants = 2
+        self.textools_dir = None
+        self.cancelled = False
+
+    def start(self, collections):
+        self.collections = collections
+        self.progress.set_total_collection_count(len(collections))
+        self.progress.set_total_variant_count(self.total_variants)
+
+    def step(self):
+        self.progress.start_new_collection("Body", 2)
+        yield "export"
+        self.progress.increment_variant_index()
+        if self.fail_with:
+            raise self.fail_with
+        self.progress.increment_variant_index()
+        yield "variant"
+
+    def cancel(self):
+        self.cancelled = True
+
+
+@pytest.fixture
+def headless_env(monkeypatch, tmp_path):
+    cfg = SimpleNamespace(export_mode="FBX_TO_MDL")
+    monkeypatch.setattr(headless, "get_export_props", lambda: cfg)
+    monkeypatch.setattr(
+        headless, "_resolve_collections",
+        lambda names: [SimpleNamespace(name=n) for n in names or ["Body"]],
+    )
+    monkeypatch.setattr(headless, "_resolve_textools", lambda arg: arg)
+    monkeypatch.setattr(headless, "ExportSession", FakeSession)
+    monkeypatch.setattr(FakeSession, "fail_with", None)
+    monkeypatch.setattr(FakeSession, "conversion_failures", [])
+    return cfg, tmp_path
+
+
+def run(argv):
+    out = io.StringIO()
+    status = headless.run_headless(argv, out)
+    return status, [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def test_headless_run_prints_json_progress_and_restores_mode(headless_env):
+    cfg, tmp_path = headless_env
+
+    status, events = run(
+        ["--export-root", str(tmp_path / "out"), "--mode", "FBX_ONLY",
+         "--collection", "Body"]
+    )
+
+    assert status == headless.EXIT_OK
+    assert [e["event"] for e in events] == [
+        "start", "collection", "variant", "variant", "done"
+    ]
+    assert events[0]["mode"] == "FBX_ONLY"
+    assert events[3] == {
+        "event": "variant", "collection": "Body", "index": 2,
+        "processed": 2, "skipped": 0, "total": 2,
+    }
+    assert (tmp_path / "out").is_dir()
+    assert cfg.export_mode == "FBX_TO_MDL"
+
+
+def test_headless_usage_and_failure_statuses(headless_env, monkeypatch):
+    cfg, tmp_path = headless_env
+
+    status, events = run(["--mode", "FBX_ONLY"])
+    assert status == headless.EXIT_USAGE
+    assert events[0]["event"] == "error"
+
+    # MDL conversion without a TexTools folder is a usage error
+    status, events = run(["--export-root", str(tmp_path)])
+    assert status == headless.EXIT_USAGE
+    assert "TexTools" in events[0]["message"]
+
+    monkeypatch.setattr(
+        FakeSession, "fail_with", ui_helpers.ViewportUnavailable("no viewport")
+    )
+    status, events = run(["--export-root", str(tmp_path), "--mode", "FBX_ONLY"])
+    assert status == headless.EXIT_FAILED
+    assert events[-1]["type"] == "ViewportUnavailable"
+    assert events[-1]["processed"] == 1
+
+    monkeypatch.setattr(FakeSession, "fail_with", Cancelled())
+    status, events = run(["--export-root", str(tmp_path), "--mode", "FBX_ONLY"])
+    assert status == headless.EXIT_FAILED
+    assert events[-1]["event"] == "cancelled"
+
+    # background conversion failures are reported after the export
+    monkeypatch.setattr(FakeSession, "fail_with", None)
+    job = SimpleNamespace(fbx_path=tmp_path / "a.fbx")
+    monkeypatch.setattr(
+        FakeSession, "conversion_failures",
+        [SimpleNamespace(job=job, error="converter crashed")],
+    )
+    status, events = run(["--export-root", str(tmp_path), "--mode", "FBX_ONLY"])
+    assert status == headless.EXIT_FAILED
+    assert events[-2] == {
+        "event": "error", "message": "converter crashed",
+        "file": str(tmp_path / "a.fbx"),
+    }
+    assert events[-1]["event"] == "done"
+
+
+def test_viewport_operator_fails_clearly_in_background(monkeypatch):
+    fake_bpy = SimpleNamespace(app=SimpleNamespace(background=True))
+    monkeypatch.setattr(ui_helpers, "bpy", fake_bpy)
+
+    with pytest.raises(ui_helpers.ViewportUnavailable):
+        ui_helpers.call_operator_in_3d_viewport(lambda ctx: None, "EXEC_DEFAULT")
@@ -0,0 +1,167 @@
+import hashlib
+import os
+from types import SimpleNamespace
+
+from ..shared.export import fingerprint
+from ..shared.export.manifest import ExportManifest
+
+
+def test_manifest_skips_only_unchanged_outputs(tmp_path):
+    fbx, mdl = tmp_path / "a.fbx", tmp_path / "a.mdl"
+    fbx.write_bytes(b"fbx")
+    mdl.write_bytes(b"mdl")
+    (tmp_path / "b.fbx").write_bytes(b"fbx")
+
+    manifest = ExportManifest(tmp_path)
+    manifest.record("a.fbx", "f1", [fbx, mdl])
+    # b's conversion failed, so it is left out
+    manifest.record("b.fbx", "f1", [tmp_path / "b.fbx", tmp_path / "b.mdl"])
+    manifest.save()
+
+    loaded = ExportManifest(tmp_path, "-0-4").load()
+    assert loaded.is_current("a.fbx", "f1", [fbx, mdl])
+    assert not loaded.is_current("a.fbx", "f2", [fbx, mdl])
+    assert not loaded.is_current("b.fbx", "f1", [tmp_path / "b.fbx"])
+
+    # an output edited since the export is rebuilt
+    stat = mdl.stat()
+    os.utime(mdl, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert not loaded.is_current("a.fbx", "f1", [fbx, mdl])
+
+
+def test_manifest_keeps_skipped_entries_and_ignores_bad_files(tmp_path):
+    fbx = tmp_path / "a.fbx"
+    fbx.write_bytes(b"fbx")
+    first = ExportManifest(tmp_path)
+    first.record("a.fbx", "f1", [fbx])
+    first.save()
+    (tmp_path / ".serenkit-manifest-broken.json").write_text("{")
+
+    second = ExportManifest(tmp_path).load()
+    assert second.is_current("a.fbx", "f1", [fbx])
+    second.keep("a.fbx")
+    second.save()
+
+    assert ExportManifest(tmp_path).load().is_current("a.fbx", "f1", [fbx])
+
+
+def _struct(**values):
+    props = [SimpleNamespace(identifier=k, type=t) for k, (t, _) in values.items()]
+    return SimpleNamespace(
+        bl_rna=SimpleNamespace(properties=props),
+        **{k: v for k, (_, v) in values.items()},
+    )
+
+
+def _digest(struct, skip=()):
+    hasher = hashlib.blake2b()
+    fingerprint.hash_rna(hasher, struct, skip=skip)
+    return hasher.hexdigest()
+
+
+def test_hash_rna_follows_values_and_pointer_names():
+    target = SimpleNamespace(name="Mannequin", users=1)
+    base = _struct(
+        strength=("FLOAT", 1.0),
+        offset=("FLOAT", [0.0, 1.0]),
+        object=("POINTER", target),
+        workers=("INT", 2),
+    )
+
+    same = _struct(
+        strength=("FLOAT", 1.0),
+        offset=("FLOAT", (0.0, 1.0)),
+        object=("POINTER", SimpleNamespace(name="Mannequin", users=3)),
+        workers=("INT", 8),
+    )
+    assert _digest(base, skip=("workers",)) == _digest(same, skip=("workers",))
+    assert _digest(base) != _digest(same)
+
+    renamed = _struct(
+        strength=("FLOAT", 1.0),
+        offset=("FLOAT", [0.0, 1.0]),
+        object=("POINTER", SimpleNamespace(name="Other", users=1)),
+        workers=("INT", 2),
+    )
+    assert _digest(base) != _digest(renamed)
+
+
+def test_stale_manifest_does_not_hide_a_newer_one(tmp_path):
+    fbx = tmp_path / "a.fbx"
+    fbx.write_bytes(b"old")
+    stale = ExportManifest(tmp_path)
+    stale.record("a.fbx", "f0", [fbx])
+    stale.save()
+
+    # a later shard rewrote the file; the unsuffixed manifest sorts last
+    fbx.write_bytes(b"newer")
+    shard = ExportManifest(tmp_path, "-0-4")
+    shard.record("a.fbx", "f1", [fbx])
+    shard.save()
+
+    loaded = ExportManifest(tmp_path).load()
+    assert loaded.is_current("a.fbx", "f1", [fbx])
+    assert not loaded.is_current("a.fbx", "f0", [fbx])
+
+
+class _Object:
+    def __init__(self, name, *targets):
+        self.name = name
+        pointer = SimpleNamespace(
+            identifier="object", type="POINTER",
+            fixed_type=SimpleNamespace(name="Object"),
+        )
+        self.modifiers = [
+            SimpleNamespace(bl_rna=SimpleNamespace(properties=[pointer]),
+                            object=target)
+            for target in targets
+        ]
+
+
+def test_referenced_objects_follow_modifier_targets():
+    body = _Object("Body")
+    cage = _Object("Cage", body)
+    mannequin = _Object("Mannequin")
+    top = _Object("Top", cage, body)
+    collection = SimpleNamespace(objects=[top, _Object("Shoes", body)])
+
+    found = fingerprint.referenced_objects(collection, mannequin)
+    assert found == [body, cage, mannequin]
+    assert fingerprint.referenced_objects(
+        SimpleNamespace(objects=[top, body]), None) == [cage]
+
+
+class _Keys(list):
+    def foreach_get(self, attr, buffer):
+        buffer[:] = [c for co in self for c in co]
+
+
+def _key_mesh(value, co, other=0.0):
+    basis = SimpleNamespace(name="Basis")
+    keys = [
+        SimpleNamespace(
+            name=name, relative_key=basis, vertex_group="", value=key_value,
+            mute=False, slider_min=0.0, slider_max=1.0,
+            interpolation="KEY_LINEAR", data=_Keys([key_co]),
+        )
+        for name, key_co, key_value in (
+            ("Basis", (0, 0, 0), 0.0),
+            ("Long", co, value),
+            ("Smile", (1, 0, 0), other),
+        )
+    ]
+    shape_keys = SimpleNamespace(use_relative=True, key_blocks=keys)
+    return SimpleNamespace(vertices=[None], shape_keys=shape_keys)
+
+
+def test_shapekey_hash_ignores_only_variant_slider_state():
+    def digest(mesh):
+        hasher = hashlib.blake2b()
+        fingerprint._hash_shapekeys(hasher, mesh, {"Long"})
+        return hasher.hexdigest()
+
+    base = digest(_key_mesh(0.0, (0, 1, 0)))
+    assert digest(_key_mesh(1.0, (0, 1, 0))) == base
+    assert digest(_key_mesh(0.0, (0, 2, 0))) != base
+    # a key outside the profile keeps the user's value in the export
+    assert digest(_key_mesh(0.0, (0, 1, 0), other=0.5)) != base
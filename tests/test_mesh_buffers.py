@@ -0,0 +1,75 @@
+from types import SimpleNamespace
+
+import numpy as np
+from bpy.types import FloatColorAttribute
+
+from ..shared.export import mesh_buffers
+
+
+class Items(list):
+    """Collection of items with Blender's bulk `foreach_get`."""
+
+    def foreach_get(self, attr, buffer):
+        values = [getattr(item, attr) for item in self]
+        buffer[:] = np.asarray(values, dtype=buffer.dtype).ravel()
+
+
+def make_quad(z=0.0, weight=1.0):
+    def group(index, w):
+        return SimpleNamespace(group=index, weight=w)
+
+    corners = [0, 1, 2, 3]
+    vertices = Items(
+        SimpleNamespace(co=(x, y, z), groups=Items([group(0, weight)]))
+        for x, y in ((0, 0), (1, 0), (1, 1), (0, 1))
+    )
+    vertices[2].groups.append(group(1, 0.5))
+    return SimpleNamespace(
+        vertices=vertices,
+        polygons=Items([SimpleNamespace(loop_total=4, material_index=0)]),
+        loops=Items(SimpleNamespace(vertex_index=i) for i in corners),
+        corner_normals=Items(
+            SimpleNamespace(vector=(0, 0, 1)) for _ in corners
+        ),
+        uv_layers=[
+            SimpleNamespace(
+                name="UVMap",
+                uv=Items(SimpleNamespace(vector=(i / 4, 0)) for i in corners),
+            )
+        ],
+        color_attributes=[
+            FloatColorAttribute(
+                name="Col",
+                data=Items(SimpleNamespace(color=(1, 1, 1, 1)) for _ in corners),
+            )
+        ],
+    )
+
+
+def digest(mesh):
+    hasher = mesh_buffers.hashlib.blake2b()
+    mesh_buffers.extract_mesh_buffers(mesh).update_hash(hasher)
+    return hasher.hexdigest()
+
+
+def test_extract_mesh_buffers_reads_every_attribute():
+    buffers = mesh_buffers.extract_mesh_buffers(make_quad(z=2.0))
+
+    assert buffers.positions.shape == (4, 3)
+    assert buffers.positions[2].tolist() == [1.0, 1.0, 2.0]
+    assert buffers.face_sizes.tolist() == [4]
+    assert buffers.corner_verts.tolist() == [0, 1, 2, 3]
+    assert buffers.normals.shape == (4, 3)
+    assert buffers.uvs["UVMap"][:, 0].tolist() == [0, 0.25, 0.5, 0.75]
+    assert buffers.colors["Col"].shape == (4, 4)
+
+    # vertex 2 has two weights, the others one
+    assert buffers.weight_offsets.tolist() == [0, 1, 2, 4, 5]
+    assert buffers.weight_groups.tolist() == [0, 0, 0, 1, 0]
+    assert buffers.weights[3] == 0.5
+
+
+def test_buffer_hash_changes_with_geometry_and_weights():
+    assert digest(make_quad()) == digest(make_quad())
+    assert digest(make_quad()) != digest(make_quad(z=0.1))
+    assert digest(make_quad()) != digest(make_quad(weight=0.9))
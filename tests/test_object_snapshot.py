@@ -0,0 +1,166 @@
+import copy
+from types import SimpleNamespace
+
+import numpy as np
+
+from ..shared.export import duplication, object_snapshot
+from ..shared.export.object_snapshot import ObjectSnapshot
+from .helpers import Mesh
+
+
+class Items(list):
+    def foreach_get(self, attr, buffer):
+        buffer[:] = np.asarray(
+            [getattr(item, attr) for item in self], dtype=buffer.dtype
+        ).ravel()
+
+    def foreach_set(self, attr, buffer):
+        width = len(buffer) // len(self)
+        for item, value in zip(self, np.reshape(buffer, (len(self), width))):
+            setattr(item, attr, tuple(value.tolist()))
+
+
+class UVLayers(list):
+    active = None
+
+    def get(self, name):
+        return next((layer for layer in self if layer.name == name), None)
+
+    def __getitem__(self, key):
+        return self.get(key) if isinstance(key, str) else super().__getitem__(key)
+
+    def new(self, name):
+        layer = SimpleNamespace(
+            name=name, uv=Items(SimpleNamespace(vector=(0, 0)) for _ in range(3))
+        )
+        self.append(layer)
+        return layer
+
+
+class SnapshotMesh(Mesh):
+    # Only read once an object let go of the mesh
+    users = 0
+
+    def __init__(self):
+        super().__init__(id=0, material_name="m")
+        self.shape_keys = None
+        self.vertices = [SimpleNamespace(groups=Items()) for _ in range(3)]
+        self.uv_layers = UVLayers()
+        uv = self.uv_layers.new("UVMap")
+        for i, loop in enumerate(uv.uv):
+            loop.vector = (i / 2, 0.5)
+        self.uv_layers.active = uv
+
+    def copy(self):
+        return copy.deepcopy(self)
+
+    def update(self):
+        pass
+
+
+def make_object(unwrap=True, transfer=True):
+    mesh = SnapshotMesh()
+    for vertex in mesh.vertices:
+        vertex.groups.append(SimpleNamespace(group=0, weight=1.0))
+    mesh.vertices[2].groups.append(SimpleNamespace(group=1, weight=0.25))
+    return SimpleNamespace(
+        data=mesh,
+        modkit=SimpleNamespace(props=SimpleNamespace(
+            postproc_unwrap_uvs=unwrap,
+            post_proc_robust_weight_transfer=transfer,
+        )),
+    )
+
+
+def weights_of(mesh):
+    return [[(g.group, g.weight) for g in v.groups] for v in mesh.vertices]
+
+
+def track_removed_meshes(monkeypatch):
+    removed = []
+    monkeypatch.setattr(object_snapshot, "bpy", SimpleNamespace(
+        data=SimpleNamespace(meshes=SimpleNamespace(remove=removed.append))
+    ))
+    return removed
+
+
+def test_snapshot_restores_uvs_changed_by_unwrapping():
+    obj = make_object(transfer=False)
+    mesh = obj.data
+    snapshot = ObjectSnapshot.take(obj)
+    assert snapshot.mesh is None
+
+    for loop in mesh.uv_layers[0].uv:
+        loop.vector = (0.0, 0.0)
+    mesh.uv_layers.new("Extra")
+
+    snapshot.restore()
+
+    assert obj.data is mesh
+    assert [layer.name for layer in mesh.uv_layers] == ["UVMap"]
+    assert [loop.vector for loop in mesh.uv_layers[0].uv] == [
+        (0.0, 0.5), (0.5, 0.5), (1.0, 0.5)
+    ]
+
+
+def test_snapshot_swaps_in_a_fresh_mesh_after_weight_transfer(monkeypatch):
+    removed = track_removed_meshes(monkeypatch)
+    obj = make_object()
+    before = weights_of(obj.data)
+    snapshot = ObjectSnapshot.take(obj)
+    assert snapshot.uvs is None
+
+    # what weight transfer would do
+    transferred = obj.data
+    for vertex in transferred.vertices:
+        vertex.groups = Items([SimpleNamespace(group=2, weight=0.5)])
+
+    snapshot.restore()
+
+    assert obj.data is not transferred
+    assert weights_of(obj.data) == before
+    assert removed == [transferred]
+
+    kept = snapshot.mesh
+    snapshot.free()
+    assert removed == [transferred, kept]
+    assert snapshot.mesh is None
+
+
+def test_snapshot_skips_state_no_preprocessing_touches():
+    snapshot = ObjectSnapshot.take(make_object(unwrap=False, transfer=False))
+    assert snapshot.uvs is None
+    assert snapshot.mesh is None
+
+
+def test_snapshot_duplicator_copies_once(monkeypatch):
+    removed = track_removed_meshes(monkeypatch)
+    copies = [make_object(), make_object()]
+    dup = SimpleNamespace(objects=copies)
+    calls = []
+    monkeypatch.setattr(
+        duplication, "duplicate_collection", lambda c: calls.append(c) or dup
+    )
+    monkeypatch.setattr(
+        duplication, "apply_variant_mask_to_collection",
+        lambda col, bits, variant, objects: calls.append(variant),
+    )
+    monkeypatch.setattr(
+        duplication, "cleanup_duplicate_collection", calls.append
+    )
+    info = SimpleNamespace(collection="Body", shapekey_bits=None)
+    duplicator = duplication.SnapshotDuplicator(info)
+
+    for variant in (0, 1, 2):
+        assert duplicator.prepare(variant) is dup
+        assert duplicator.fresh_objects == copies
+        assert weights_of(copies[0].data)[2] == [(0, 1.0), (1, 0.25)]
+        # preprocessing replaces the weights, the next prepare restores them
+        copies[0].data.vertices[2].groups = Items()
+        duplicator.release()
+    duplicator.close()
+
+    assert calls == ["Body", 0, 1, 2, dup]
+    # the kept copies are freed along with the export collection
+    assert len(removed) == 2 * 2 + 2
+    assert duplicator.applies_shapekeys
@@ -0,0 +1,106 @@
+import json
+import sys
+import time
+
+from ..shared.export.export_progress import ExportProgress
+from ..shared.export.parallel import ParallelExport
+from ..shared.export.session import Shard, split_variant_range
+
+
+def test_shards_cover_all_variants_once():
+    counts = [5, 0, 7, 3]
+    seen = []
+    for index in range(4):
+        ranges = split_variant_range(counts, Shard(index, 4))
+        for col, (start, stop) in enumerate(ranges):
+            seen += [(col, v) for v in range(start, stop)]
+
+    assert sorted(seen) == [(c, v) for c, n in enumerate(counts) for v in range(n)]
+    assert split_variant_range(counts, None) == [None] * 4
+    # contiguous: the first worker gets the start of the first collection
+    assert split_variant_range(counts, Shard(0, 4))[0] == (0, 3)
+
+
+def fake_worker(index, total, fail=False):
+    lines = [
+        "Blender startup noise",
+        json.dumps({"event": "start", "variants": total}),
+        json.dumps({"event": "collection", "name": "Body"}),
+    ]
+    lines += [
+        json.dumps({"event": "variant", "processed": i + 1})
+        for i in range(total)
+    ]
+    if fail:
+        lines.append(json.dumps({"event": "error", "message": "boom"}))
+    script = f"import sys; print({chr(10).join(lines)!r}); sys.exit({int(fail)})"
+    return [sys.executable, "-c", script]
+
+
+def run_until_done(parallel):
+    deadline = time.monotonic() + 30
+    while parallel.poll():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_parallel_export_merges_worker_progress(tmp_path, monkeypatch):
+    progress = ExportProgress()
+    parallel = ParallelExport(
+        tmp_path, ["Body"], 3, progress, blender_binary="blender"
+    )
+    assert parallel.worker_command(tmp_path / "s.blend", 1)[-4:] == [
+        "--stage-dir", str(tmp_path / ".serenkit-stage" / "worker-1"),
+        "--collection", "Body",
+    ]
+
+    monkeypatch.setattr(
+        parallel, "worker_command", lambda snapshot, i: fake_worker(i, i + 1)
+    )
+    parallel.start(snapshot=tmp_path / "unused.blend")
+    run_until_done(parallel)
+
+    assert progress.total_variant_count == 6
+    assert progress.processed_variants == 6
+    assert progress.collection_name == "Body"
+    assert parallel.failures() == []
+
+    parallel.cleanup()
+    assert not parallel.stage_root.exists()
+
+
+def test_parallel_export_reports_failed_workers(tmp_path, monkeypatch):
+    parallel = ParallelExport(
+        tmp_path, ["Body"], 2, ExportProgress(), blender_binary="blender"
+    )
+    monkeypatch.setattr(
+        parallel,
+        "worker_command",
+        lambda snapshot, i: fake_worker(i, 1, fail=(i == 1)),
+    )
+    parallel.start(snapshot=tmp_path / "unused.blend")
+    run_until_done(parallel)
+
+    failures = parallel.failures()
+    assert len(failures) == 1
+    assert "worker 1" in failures[0] and "boom" in failures[0]
+
+
+def test_runner_publishes_finished_files(tmp_path):
+    from ..shared.cancel import CancelToken
+    from ..shared.export.mdl_converter import MDLExportRunner
+
+    stage = tmp_path / "stage"
+    stage.mkdir()
+    (stage / "body.fbx").write_text("fbx")
+    (stage / "body.mdl").write_text("mdl")
+
+    runner = MDLExportRunner(
+        None, None, CancelToken(), None, publish_dir=tmp_path / "out" / "Body"
+    )
+    runner._publish(stage / "body.fbx")
+
+    assert sorted(p.name for p in (tmp_path / "out" / "Body").iterdir()) == [
+        "body.fbx", "body.mdl"
+    ]
+    assert list(stage.iterdir()) == []
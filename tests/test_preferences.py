@@ -9,9 +9,12 @@ def test_reload_profiles_success(monkeypatch):
     setattr(bpy.types, 'AddonPreferences', type('AddonPreferences', (), {}))
     from .. import preferences as prefs
 
-    # monkeypatch load_profiles and get_loaded_profiles
-    monkeypatch.setattr(prefs, 'load_profiles', lambda: None)
-    monkeypatch.setattr(prefs, 'get_loaded_profiles', lambda: {'A': 1, 'B': 2})
+    # monkeypatch reload_profiles and get_profile_names
+    from ..shared.profile import ProfileReloadResult
+    monkeypatch.setattr(
+        prefs, 'reload_profiles', lambda: ProfileReloadResult(changed={'A'})
+    )
+    monkeypatch.setattr(prefs, 'get_profile_names', lambda: ['A', 'B'])
 
     op = prefs.MODKIT_OT_reload_profiles()
 
@@ -24,6 +27,7 @@ def test_reload_profiles_success(monkeypatch):
     res = op.execute(None)
     assert res == {'FINISHED'}
     assert 'Reloaded 2 variant profiles' in op._last_report[1]
+    assert '1 changed' in op._last_report[1]
 
 
 def test_reload_profiles_failure(monkeypatch):
@@ -34,7 +38,7 @@ def test_reload_profiles_failure(monkeypatch):
     def bad_reload():
         raise RuntimeError('boom')
 
-    monkeypatch.setattr(prefs, 'load_profiles', bad_reload)
+    monkeypatch.setattr(prefs, 'reload_profiles', bad_reload)
 
     op = prefs.MODKIT_OT_reload_profiles()
 
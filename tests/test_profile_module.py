@@ -49,3 +49,25 @@ def test_variant_profile_validate_errors():
 
     with pytest.raises(ValueError):
         profile.Profile.from_dict({})  # missing profile_name
+
+
+def test_profile_index_lookups():
+    data = {
+        "profile_name": "P",
+        "standard_materials": {"skin": "mt_skin.mtrl", "alt": "mt_skin.mtrl"},
+        "groups": [
+            make_group_dict(),
+            make_group_dict("opt", "OPTIONAL", {"C": "c"}),
+        ],
+        "export_aliases": {"c": "c_alias"},
+    }
+    vp = profile.Profile.from_dict(data)
+    index = vp.index
+
+    assert index is vp.index
+    assert vp.get_shapekey_names() == {"A", "B", "C"}
+    assert index.group_shapekeys["group1"] == {"A", "B"}
+    assert index.alias_of == {"c": "c_alias"}
+    assert index.material_paths["alt"] == "mt_skin.mtrl"
+    # the first material naming a path wins the reverse lookup
+    assert index.material_names["mt_skin.mtrl"] == "skin"
@@ -50,3 +50,129 @@ def test_get_profile_items_and_data_roundtrip(tmp_path, monkeypatch):
     items = profile.get_profile_items()
     assert any(i[0] == "T" for i in items)
     assert profile.get_profile_data("T") is p
+
+
+def test_profiles_dir_uses_compiled_cache_for_unchanged_files(tmp_path, monkeypatch):
+    good = tmp_path / "good.toml"
+    good.write_text(
+        'profile_name = "Good"\nstandard_materials = {}\ngroups = []\n',
+        encoding="utf-8",
+    )
+    (tmp_path / "bad.toml").write_text("not toml", encoding="utf-8")
+
+    first = profile._load_profiles_from_directory(tmp_path)
+    assert set(first) == {"Good"}
+    assert profile._get_profile_cache_path(tmp_path).exists()
+
+    parsed = []
+    real_parse = profile._parse_profile
+
+    def counting_parse(path, content):
+        parsed.append(path.name)
+        return real_parse(path, content)
+
+    monkeypatch.setattr(profile, "_parse_profile", counting_parse)
+
+    # nothing changed: neither the valid nor the invalid file is parsed
+    second = profile._load_profiles_from_directory(tmp_path)
+    assert second == first
+    assert parsed == []
+
+    # a changed file is parsed again, the others come from the cache
+    good.write_text(
+        'profile_name = "Better"\nstandard_materials = {}\ngroups = []\n',
+        encoding="utf-8",
+    )
+    third = profile._load_profiles_from_directory(tmp_path)
+    assert set(third) == {"Better"}
+    assert parsed == ["good.toml"]
+
+
+def test_profiles_dir_falls_back_on_corrupt_cache(tmp_path):
+    content = 'profile_name = "Good"\nstandard_materials = {}\ngroups = []\n'
+    (tmp_path / "good.toml").write_text(content, encoding="utf-8")
+
+    cache_path = profile._get_profile_cache_path(tmp_path)
+    cache_path.parent.mkdir()
+    cache_path.write_bytes(b"definitely not a pickle")
+
+    loaded = profile._load_profiles_from_directory(tmp_path)
+    assert "Good" in loaded
+
+
+def test_lazy_loading_indexes_names_and_evicts(tmp_path, monkeypatch):
+    for name in ("A", "B", "C"):
+        (tmp_path / f"{name.lower()}.toml").write_text(
+            f'profile_name = "{name}"\ngroups = []\n\n[standard_materials]\n', encoding="utf-8"
+        )
+    (tmp_path / "bad.toml").write_text("not = = toml", encoding="utf-8")
+
+    monkeypatch.setattr(profile, "_PROFILES_DIRECTORY", tmp_path)
+    monkeypatch.setattr(profile, "LAZY_PROFILE_CACHE_SIZE", 2)
+    profile.set_lazy_profile_loading(True)
+    try:
+        profile.load_profiles()
+
+        assert profile.get_loaded_profiles() == {}
+        assert sorted(profile.get_profile_names()) == ["A", "B", "C"]
+        assert profile.is_profile_loaded("B")
+        assert not profile.is_profile_loaded("bad")
+
+        a = profile.get_profile_data("A")
+        assert a is not None and a.profile_name == "A"
+        assert profile.get_profile_data("A") is a
+
+        profile.get_profile_data("B")
+        profile.get_profile_data("A")
+        profile.get_profile_data("C")
+
+        # B was least recently used and got dropped, but stays available
+        assert set(profile.get_loaded_profiles()) == {"A", "C"}
+        assert profile.get_profile_data("B") is not None
+        assert profile.get_profile_data("missing") is None
+    finally:
+        profile.set_lazy_profile_loading(False)
+        profile.load_profiles()
+
+
+def _write_profile(path, name, groups="[]"):
+    path.write_text(
+        f'profile_name = "{name}"\nstandard_materials = {{}}\ngroups = {groups}\n',
+        encoding="utf-8",
+    )
+
+
+def test_reload_profiles_only_touches_changed_files(tmp_path, monkeypatch):
+    _write_profile(tmp_path / "a.toml", "A")
+    _write_profile(tmp_path / "b.toml", "B")
+    _write_profile(tmp_path / "c.toml", "C")
+    monkeypatch.setattr(profile, "_PROFILES_DIRECTORY", tmp_path)
+
+    notified = []
+    monkeypatch.setattr(
+        profile, "_profiles_changed_listeners", [notified.append]
+    )
+    profile.load_profiles()
+    untouched = profile.get_profile_data("C")
+
+    # Same content with a new mtime is recognised by its hash
+    st = (tmp_path / "a.toml").stat()
+    os.utime(tmp_path / "a.toml", ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert not profile.reload_profiles().affected
+
+    _write_profile(tmp_path / "a.toml", "A", '[{group_name = "g", mode = "optional", shapekeys = {}}]')
+    (tmp_path / "b.toml").unlink()
+    _write_profile(tmp_path / "d.toml", "D")
+
+    result = profile.reload_profiles()
+
+    assert result.changed == {"A"}
+    assert result.removed == {"B"}
+    assert result.added == {"D"}
+    assert notified[-1] == {"A", "B", "D"}
+    assert len(profile.get_profile_data("A").groups) == 1
+    assert profile.get_profile_data("C") is untouched
+    assert not profile.is_profile_loaded("B")
+    assert not profile.reload_profiles().affected
+
+    profile.load_profiles()
@@ -0,0 +1,105 @@
+from types import SimpleNamespace
+
+import pytest
+
+from ..shared.export import sandbox, utils
+
+
+class Obj:
+    def __init__(self, context, name, selected=False):
+        self.context, self.name = context, name
+        self.display_type = "TEXTURED"
+        self.select_calls = 0
+        if selected:
+            context.selected_objects.append(self)
+
+    def select_get(self):
+        return self in self.context.selected_objects
+
+    def select_set(self, state):
+        self.select_calls += 1
+        if state and not self.select_get():
+            self.context.selected_objects.append(self)
+        elif not state and self.select_get():
+            self.context.selected_objects.remove(self)
+
+
+@pytest.fixture
+def context(monkeypatch):
+    modes = []
+    context = SimpleNamespace(
+        mode="EDIT_MESH",
+        selected_objects=[],
+        preferences=SimpleNamespace(edit=SimpleNamespace(use_global_undo=True)),
+        view_layer=SimpleNamespace(objects=SimpleNamespace(active=None)),
+    )
+
+    def mode_set(mode):
+        modes.append(mode)
+        context.mode = "OBJECT" if mode == "OBJECT" else "EDIT_MESH"
+
+    fake_bpy = SimpleNamespace(
+        context=context,
+        ops=SimpleNamespace(object=SimpleNamespace(mode_set=mode_set)),
+    )
+    monkeypatch.setattr(sandbox, "bpy", fake_bpy)
+    monkeypatch.setattr(utils, "bpy", fake_bpy)
+    context.modes = modes
+    return context
+
+
+def test_sandbox_suspends_undo_and_restores_mode_and_selection(context):
+    body = Obj(context, "Body", selected=True)
+    other = Obj(context, "Other")
+    context.view_layer.objects.active = body
+
+    box = sandbox.ExportSandbox()
+    box.enter()
+    assert sandbox.get_active_sandbox() is box
+    assert context.preferences.edit.use_global_undo is False
+    assert context.mode == "OBJECT"
+
+    # a nested sandbox leaves the running one alone
+    nested = sandbox.ExportSandbox()
+    nested.enter()
+    nested.exit()
+    assert sandbox.get_active_sandbox() is box
+
+    copy = Obj(context, "export_Body")
+    box.adopt([copy])
+    assert copy.display_type == "BOUNDS"
+    utils.select_objects_for_export([other, copy])
+    context.view_layer.objects.active = copy
+
+    box.exit()
+
+    assert sandbox.get_active_sandbox() is None
+    assert context.preferences.edit.use_global_undo is True
+    assert context.selected_objects == [body]
+    assert context.view_layer.objects.active is body
+    assert context.modes == ["OBJECT", "EDIT"]
+
+
+def test_failed_enter_restores_undo(context, monkeypatch):
+    def mode_set(mode):
+        raise RuntimeError("context is incorrect")
+
+    monkeypatch.setattr(sandbox.bpy.ops.object, "mode_set", mode_set)
+
+    with pytest.raises(RuntimeError):
+        sandbox.ExportSandbox().enter()
+
+    assert sandbox.get_active_sandbox() is None
+    assert context.preferences.edit.use_global_undo is True
+
+
+def test_select_objects_for_export_only_touches_changed_objects(context):
+    keep = Obj(context, "Keep", selected=True)
+    drop = Obj(context, "Drop", selected=True)
+    add = Obj(context, "Add")
+
+    utils.select_objects_for_export([keep, add])
+
+    assert set(context.selected_objects) == {keep, add}
+    assert (keep.select_calls, drop.select_calls, add.select_calls) == (0, 1, 1)
+    assert context.view_layer.objects.active is keep
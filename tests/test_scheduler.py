@@ -0,0 +1,50 @@
+from ..shared.export.scheduler import FrameBudget
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, ms):
+        self.now += ms / 1000
+
+
+def run_tick(budget, clock, stage_ms):
+    """Run stages of `stage_ms` each until the budget is used; return count."""
+    budget.begin_tick()
+    stages = 0
+    while True:
+        clock.advance(stage_ms)
+        stages += 1
+        if not budget.has_time():
+            break
+    budget.end_tick()
+    return stages
+
+
+def test_frame_budget_batches_stages_and_adapts_to_ui_load():
+    clock = FakeClock()
+    budget = FrameBudget(50, min_ms=10, max_ms=100, interval_s=0.01, clock=clock)
+
+    assert run_tick(budget, clock, 10) == 5
+    # a stage longer than the budget still runs once
+    assert run_tick(budget, clock, 200) == 1
+
+    # the UI takes far longer than the budget between ticks: shrink
+    clock.advance(10 + 200)
+    run_tick(budget, clock, 1)
+    assert budget.budget_ms < 50
+
+    for _ in range(20):
+        clock.advance(10 + 200)
+        run_tick(budget, clock, 1)
+    assert budget.budget_ms == 10
+
+    # an idle UI lets the budget grow back up to the maximum
+    for _ in range(40):
+        clock.advance(10)
+        run_tick(budget, clock, 1)
+    assert budget.budget_ms == 100
@@ -0,0 +1,75 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from ..shared.export import shapekey_deltas
+from ..shared.export.shapekey_deltas import find_static_keys
+
+
+class Coords(list):
+    def foreach_get(self, attr, buffer):
+        buffer[:] = np.asarray(self, dtype=buffer.dtype).ravel()
+
+
+def make_keyed_mesh(basis, keys):
+    """`keys` maps key names to {vertex index: offset} from the basis."""
+    basis_block = SimpleNamespace(
+        name="Basis", data=Coords(basis), value=0.0, mute=False,
+        vertex_group="",
+    )
+    basis_block.relative_key = basis_block
+    blocks = [basis_block]
+    for name, moved in keys.items():
+        coords = [list(co) for co in basis]
+        for index, offset in moved.items():
+            coords[index] = [c + o for c, o in zip(coords[index], offset)]
+        blocks.append(SimpleNamespace(
+            name=name, data=Coords(coords), value=0.0, mute=False,
+            vertex_group="", relative_key=basis_block,
+        ))
+    shape_keys = SimpleNamespace(
+        use_relative=True, key_blocks=blocks, reference_key=basis_block
+    )
+    return SimpleNamespace(
+        vertices=basis, shape_keys=shape_keys, session_uid=id(shape_keys)
+    )
+
+
+def test_only_keys_moving_no_vertex_are_static():
+    basis = [(float(i), 0.0, 0.0) for i in range(1000)]
+    mesh = make_keyed_mesh(basis, {
+        "A": {3: (0, 1, 0)},
+        "B": {3: (0, 0, 2), 7: (1, 0, 0)},
+        "Tiny": {5: (0, 1e-8, 0)},
+        "Empty": {},
+    })
+
+    assert find_static_keys(mesh) == {"Tiny", "Empty"}
+
+
+def test_vertex_group_keys_are_never_static():
+    mesh = make_keyed_mesh([(0.0, 0.0, 0.0)], {"A": {}})
+    mesh.shape_keys.key_blocks[1].vertex_group = "Mask"
+
+    assert find_static_keys(mesh) == frozenset()
+
+
+def test_static_keys_are_kept_until_the_mesh_changes(monkeypatch):
+    shapekey_deltas.clear_static_shapekeys()
+    # tag_depsgraph_updates matches on bpy.types.Mesh
+    monkeypatch.setattr(shapekey_deltas, "Mesh", SimpleNamespace)
+    mesh = make_keyed_mesh([(0.0, 0.0, 0.0)], {"A": {}, "B": {0: (1, 0, 0)}})
+    reads = []
+    monkeypatch.setattr(
+        shapekey_deltas, "find_static_keys",
+        lambda m: reads.append(m) or find_static_keys(m),
+    )
+
+    assert shapekey_deltas.static_shapekeys(mesh) == {"A"}
+    assert shapekey_deltas.static_shapekeys(mesh) == {"A"}
+    assert len(reads) == 1
+
+    update = SimpleNamespace(id=mesh, is_updated_geometry=True)
+    shapekey_deltas.tag_depsgraph_updates(SimpleNamespace(updates=[update]))
+    shapekey_deltas.static_shapekeys(mesh)
+    assert len(reads) == 2
@@ -73,29 +73,43 @@ def test_save_and_restore_shapekey_config():
     assert kb.value == 0.5 and kb.mute is True
 
 
-def test_apply_variant_shapekeys_to_mesh_and_collection():
-    # Prepare profile with shapekey names
+def test_apply_variant_mask_to_collection_and_mannequin():
+    from ..shared.variants import ShapekeyBits
+
     vg = Group(group_name="G", mode=GroupMode.EXCLUSIVE,
                shapekeys=[("A", "A"), ("B", "B")])
-    vp = Profile(profile_name="P", groups=[vg])
-
-    m = make_mesh_with_keys(["A", "B"])
-    # apply A active only
-    sku.apply_variant_shapekeys(m, vp, {"A"})
-    assert m.shape_keys.key_blocks["A"].value == 1.0
-    assert m.shape_keys.key_blocks["A"].mute is False
-    assert m.shape_keys.key_blocks["B"].value == 0.0
-    assert m.shape_keys.key_blocks["B"].mute is True
-
-    # apply to collection: use a fresh mesh instance so previous state
-    # doesn't affect the result
+    bits = ShapekeyBits.from_profile(Profile(profile_name="P", groups=[vg]))
+
     m_coll = make_mesh_with_keys(["A", "B"])
+    m_mannequin = make_mesh_with_keys(["A", "B"])
     o = SimpleNamespace(data=m_coll)
-    # mannequin is Mesh instance placed on model.mannequin_object
-    model = SimpleNamespace(mannequin_object=SimpleNamespace(data=m_coll))
+    model = SimpleNamespace(
+        mannequin_object=SimpleNamespace(data=m_mannequin)
+    )
     col = SimpleNamespace(objects=[o])
     col.modkit = SimpleNamespace(model=model)
 
-    sku.apply_variant_shapekeys_to_collection(col, vp, {"B"})
-    assert m_coll.shape_keys.key_blocks["A"].value == 0.0
-    assert m_coll.shape_keys.key_blocks["B"].value == 1.0
+    sku.apply_variant_mask_to_collection(col, bits, bits.mask_of({"B"}))
+    for mesh in (m_coll, m_mannequin):
+        assert mesh.shape_keys.key_blocks["A"].value == 0.0
+        assert mesh.shape_keys.key_blocks["A"].mute is True
+        assert mesh.shape_keys.key_blocks["B"].value == 1.0
+        assert mesh.shape_keys.key_blocks["B"].mute is False
+
+
+def test_apply_variant_mask_to_mesh():
+    from ..shared.variants import ShapekeyBits
+
+    vg = Group(group_name="G", mode=GroupMode.OPTIONAL,
+               shapekeys=[("A", "A"), ("B", "B"), ("C", "C")])
+    bits = ShapekeyBits.from_profile(Profile(profile_name="P", groups=[vg]))
+
+    m = make_mesh_with_keys(["A", "C", "Other"])
+    sku.apply_variant_mask(m, bits, bits.mask_of({"C"}))
+    assert m.shape_keys.key_blocks["A"].value == 0.0
+    assert m.shape_keys.key_blocks["A"].mute is True
+    assert m.shape_keys.key_blocks["C"].value == 1.0
+    assert m.shape_keys.key_blocks["C"].mute is False
+    # keys outside the profile are left untouched
+    assert m.shape_keys.key_blocks["Other"].value == 0.0
+    assert m.shape_keys.key_blocks["Other"].mute is False
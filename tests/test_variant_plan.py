@@ -0,0 +1,59 @@
+from pathlib import Path
+
+from pytest import MonkeyPatch as Monkeypatch
+
+from ..shared import profile, variant_plan
+from ..shared.profile import Group, GroupMode, Profile
+
+
+def make_profile(name: str = "P") -> Profile:
+    return Profile(
+        profile_name=name,
+        groups=[
+            Group(group_name="G", mode=GroupMode.EXCLUSIVE,
+                  shapekeys=[("A", "a"), ("B", "b")]),
+            Group(group_name="O", mode=GroupMode.OPTIONAL,
+                  shapekeys=[("C", "c")]),
+        ],
+    )
+
+
+def test_plan_is_shared_for_same_profile_and_keys() -> None:
+    variant_plan.clear_variant_plans()
+    variant_plan.reset_plan_cache_stats()
+    p = make_profile()
+
+    first = variant_plan.get_variant_plan(p, {"A", "B", "C"})
+    # keys outside the profile do not split the cache
+    second = variant_plan.get_variant_plan(p, ["C", "B", "A", "Unrelated"])
+    other = variant_plan.get_variant_plan(p, {"A"})
+
+    assert first is second
+    assert other is not first
+    assert first.variant_count == 4
+    assert list(other.iter_variants()) == [0b001]
+
+    stats = variant_plan.get_plan_cache_stats()
+    assert (stats.hits, stats.misses) == (1, 2)
+
+
+def test_plans_are_dropped_when_profiles_reload(
+    tmp_path: Path, monkeypatch: Monkeypatch
+) -> None:
+    variant_plan.clear_variant_plans()
+    variant_plan.reset_plan_cache_stats()
+    p = make_profile("Keep")
+    q = make_profile("Drop")
+
+    kept = variant_plan.get_variant_plan(p, {"A"})
+    variant_plan.get_variant_plan(q, {"A"})
+    variant_plan.clear_variant_plans({"Drop"})
+
+    assert variant_plan.get_variant_plan(p, {"A"}) is kept
+    variant_plan.get_variant_plan(q, {"A"})
+    assert variant_plan.get_plan_cache_stats().misses == 3
+
+    monkeypatch.setattr(profile, "_PROFILES_DIRECTORY", tmp_path)
+    profile.load_profiles()
+
+    assert variant_plan.get_variant_plan(p, {"A"}) is not kept
@@ -1,47 +1,183 @@
-from typing import Any
+from itertools import chain, combinations, product
+from random import Random
 from ..shared.profile import Profile, Group, GroupMode
 from ..shared.variants import (
+    ShapekeyBits,
+    count_variant_masks,
     filter_profile_shapekeys,
-    generate_variant_combinations,
+    gray_rank,
+    iter_variant_combinations,
+    iter_variant_changes,
+    iter_variant_masks,
     name_variant,
+    order_by_fewest_changes,
 )
 from ..shared.export.shapekey_utils import collect_collection_shapekeys
 
 from .helpers import Object, Collection
 
 
-def test_generate_combinations_exclusive_and_optional() -> None:
-    # two exclusive groups with 2 choices each, and two optional keys
-    support_list: list[Any] = [
-        Group(
-            group_name="G1",
-            mode=GroupMode.EXCLUSIVE,
-            shapekeys=[("a1", "A1"), ("a2", "A2")],
-        ),
-        Group(
-            group_name="G2",
-            mode=GroupMode.EXCLUSIVE,
-            shapekeys=[("b1", "B1"), ("b2", "B2")],
-        ),
-        Group(
-            group_name="OPT",
-            mode=GroupMode.OPTIONAL,
-            shapekeys=[("o1", "O1"), ("o2", "O2")],
-        ),
+def _is_valid_combo(
+    combo: list[tuple[str, str]], incompatibilities: dict[str, list[str]]
+) -> bool:
+    shapes = {shape for shape, _ in combo}
+    return not any(
+        inc in shapes for shape in shapes
+        for inc in incompatibilities.get(shape, []))
+
+
+def _eager_variant_combinations(
+    support_list: list[Group], incompatibilities: dict[str, list[str]]
+) -> list[list[tuple[str, str]]]:
+    """Reference powerset x product implementation."""
+    exclusive = [g.shapekeys for g in support_list
+                 if g.shapekeys and g.mode == GroupMode.EXCLUSIVE]
+    optional = [sk for g in support_list
+                if g.mode == GroupMode.OPTIONAL for sk in g.shapekeys]
+    subsets = list(chain.from_iterable(
+        combinations(optional, r) for r in range(len(optional) + 1)))
+    variants = [list(base) + list(sub)
+                for base in product(*exclusive) for sub in subsets]
+    return [v for v in variants
+            if _is_valid_combo(v, incompatibilities)]
+
+
+def test_lazy_combinations_match_eager_order() -> None:
+    support_list = [
+        Group(group_name="G1", mode=GroupMode.EXCLUSIVE,
+              shapekeys=[("a1", "A1"), ("a2", "A2"), ("a3", "A3")]),
+        Group(group_name="OPT", mode=GroupMode.OPTIONAL,
+              shapekeys=[("o1", "O1"), ("o2", "O2"), ("o3", "O3")]),
+        Group(group_name="G2", mode=GroupMode.EXCLUSIVE,
+              shapekeys=[("b1", "B1"), ("b2", "B2")]),
+        Group(group_name="EMPTY", mode=GroupMode.EXCLUSIVE, shapekeys=[]),
     ]
+    incompatibilities = {"a1": ["b2"], "o1": ["o3", "a2"], "b1": ["o2"]}
+
+    lazy = iter_variant_combinations(support_list, incompatibilities)
+    assert not isinstance(lazy, list)
+    assert list(lazy) == _eager_variant_combinations(
+        support_list, incompatibilities)
+
+    assert list(iter_variant_combinations([], {})) == [[]]
+
+
+def test_shapekey_bits_masks_and_names() -> None:
+    groups = [
+        Group(group_name="OPT", mode=GroupMode.OPTIONAL,
+              shapekeys=[("o1", "O1"), ("o2", "O2")]),
+        Group(group_name="G1", mode=GroupMode.EXCLUSIVE,
+              shapekeys=[("a1", "A1"), ("a2", "A2")]),
+    ]
+    bits = ShapekeyBits.from_groups(groups, {"o2": ["a1"]})
+
+    # exclusive keys take the low bits regardless of group order
+    assert bits.shapekeys == (("a1", "A1"), ("a2", "A2"),
+                              ("o1", "O1"), ("o2", "O2"))
+    assert bits.exclusive_masks == (0b0011,)
+    assert bits.optional_mask == 0b1100
+
+    # incompatibilities are compiled symmetrically
+    assert bits.incompatible[0] == 0b1000
+    assert bits.incompatible[3] == 0b0001
+    assert bits.is_valid(0b0110)
+    assert not bits.is_valid(0b1001)
+
+    variant = bits.mask_of({"a2", "o1", "missing"})
+    assert variant == 0b0110
+    assert bits.export_names(variant) == ["A2", "O1"]
+
+    # only detected keys take part in enumeration
+    detected = bits.mask_of({"a1", "o2"})
+    assert list(iter_variant_masks(bits, detected)) == [0b0001]
+
+
+def _random_support(rng: Random) -> tuple[list[Group], dict[str, list[str]]]:
+    """Build random groups and incompatibilities over a small key pool."""
+    pool = [f"k{i}" for i in range(rng.randint(0, 10))]
+    groups = []
+    for g in range(rng.randint(0, 4)):
+        keys = rng.sample(pool, rng.randint(0, min(4, len(pool))))
+        mode = rng.choice([GroupMode.EXCLUSIVE, GroupMode.OPTIONAL])
+        groups.append(Group(group_name=f"g{g}", mode=mode,
+                            shapekeys=[(k, k.upper()) for k in keys]))
+    incompatibilities: dict[str, list[str]] = {}
+    for key in pool:
+        if pool and rng.random() < 0.4:
+            incompatibilities[key] = rng.sample(
+                pool, rng.randint(1, min(3, len(pool))))
+    return groups, incompatibilities
 
-    # generate combinations using empty incompatibilities
-    variants = generate_variant_combinations(support_list, {})
-    # exclusive combinations: 2 * 2 = 4
-    # optional subsets: 2^2 = 4
-    assert len(variants) == 4 * 4
 
-    # check structure: each variant is a list of tuples
-    assert all(isinstance(v, list) for v in variants)
-    assert all(
-        all(isinstance(t, tuple) and len(t) == 2 for t in v) for v in variants
+def _brute_force_count(bits: ShapekeyBits, detected: int) -> int:
+    """Count by checking every subset of the detected keys."""
+    exclusive = [m & detected for m in bits.exclusive_masks if m & detected]
+    total = 0
+    for variant in range(bits.all_mask + 1):
+        if variant & ~detected:
+            continue
+        if any((variant & m).bit_count() != 1 for m in exclusive):
+            continue
+        if bits.is_valid(variant):
+            total += 1
+    return total
+
+
+def test_count_matches_brute_force_on_random_profiles() -> None:
+    rng = Random(1234)
+    for _ in range(300):
+        groups, incompatibilities = _random_support(rng)
+        bits = ShapekeyBits.from_groups(groups, incompatibilities)
+        detected = rng.randint(0, bits.all_mask)
+
+        expected = _brute_force_count(bits, detected)
+        assert count_variant_masks(bits, detected) == expected
+        assert sum(1 for _ in iter_variant_masks(bits, detected)) == expected
+
+
+def test_count_large_optional_set_without_enumeration() -> None:
+    optional = Group(group_name="OPT", mode=GroupMode.OPTIONAL,
+                     shapekeys=[(f"o{i}", f"O{i}") for i in range(60)])
+    exclusive = Group(group_name="G", mode=GroupMode.EXCLUSIVE,
+                      shapekeys=[("a", "A"), ("b", "B")])
+
+    # "a" excludes the first optional key, leaving 59 free keys
+    bits = ShapekeyBits.from_groups([exclusive, optional], {"a": ["o0"]})
+    assert count_variant_masks(bits, bits.all_mask) == 2 ** 59 + 2 ** 60
+
+
+def test_fewest_changes_order_keeps_outputs_and_reduces_writes() -> None:
+    support_list = [
+        Group(group_name="G1", mode=GroupMode.EXCLUSIVE,
+              shapekeys=[("a1", "A1"), ("a2", "A2"), ("a3", "A3")]),
+        Group(group_name="G2", mode=GroupMode.EXCLUSIVE,
+              shapekeys=[("b1", "B1"), ("b2", "B2")]),
+        Group(group_name="OPT", mode=GroupMode.OPTIONAL,
+              shapekeys=[("o1", "O1"), ("o2", "O2"), ("o3", "O3")]),
+    ]
+    bits = ShapekeyBits.from_groups(support_list, {"a1": ["o2"]})
+    variants = list(iter_variant_masks(bits, bits.all_mask))
+    ordered = list(order_by_fewest_changes(bits, bits.all_mask))
+
+    assert ordered == sorted(variants, key=lambda v: gray_rank(bits, v))
+
+    # Undetected keys still count as digits of the code
+    detected = bits.mask_of(["a2", "a3", "o1", "o3"])
+    partial = list(iter_variant_masks(bits, detected))
+    assert list(order_by_fewest_changes(bits, detected)) == sorted(
+        partial, key=lambda v: gray_rank(bits, v)
     )
 
+    def writes(order: list[int]) -> int:
+        return sum(changed.bit_count()
+                   for _, changed in iter_variant_changes(order)
+                   if changed != -1)
+
+    assert writes(ordered) < writes(variants)
+
+    changes = list(iter_variant_changes([0b01, 0b11, 0b10]))
+    assert changes == [(0b01, -1), (0b11, 0b10), (0b10, 0b01)]
+
 
 def test_empty_variant_name() -> None:
     assert name_variant([]) == ""